@@ -1,11 +1,73 @@
+import argparse
 import pygame
-from scripts.game_logic.game import Game
+from scripts.game_logic.game import Game, enable_headless_drivers
+from scripts.game_logic.save_store import SaveStore
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Security Invaders")
+    parser.add_argument("--headless", action="store_true",
+                        help="run simulated sessions with no window, audio or frame cap")
+    parser.add_argument("--sessions", type=int, default=1,
+                        help="number of headless sessions to simulate")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="maximum frames per headless session")
+    parser.add_argument("--dirty-rects", dest="dirty_rects", action="store_true", default=None,
+                        help="only repaint the parts of the screen that changed (default on a Raspberry Pi)")
+    parser.add_argument("--perf-overlay", action="store_true",
+                        help="start with the frame timing overlay shown (F3 toggles it)")
+    parser.add_argument("--record", metavar="DIR", default=None,
+                        help="record every new game as a replay file in DIR")
+    parser.add_argument("--replay", metavar="FILE", default=None,
+                        help="re-run a recorded replay headless and check it against its checksums")
+    parser.add_argument("--export-save", nargs=2, metavar=("SLOT", "FILE"), default=None,
+                        help="write save slot SLOT (1-3) to FILE as readable JSON and exit")
+    parser.add_argument("--full-redraw", dest="dirty_rects", action="store_false",
+                        help="repaint the whole screen every frame")
+    return parser.parse_args()
+
+
+def run_headless(sessions, max_frames, replay_dir=None):
+    game = Game(headless=True, replay_dir=replay_dir)
+    for session in range(sessions):
+        result = game.run_headless_session(max_frames)
+        print(f"Session {session + 1}: {result}")
+
+
+def run_replay(path):
+    result = Game(headless=True).play_replay(path)
+    print(f"Replay {path}: {result}")
+    if result["divergences"]:
+        print(f"Diverged from the recording at step {result['divergences'][0]}")
+
+
+def export_save(slot, path):
+    store = SaveStore()
+    store.load_index()
+    try:
+        store.export_json(int(slot) - 1, path)
+    except (OSError, ValueError) as e:
+        print(f"Could not export save slot {slot}: {e}")
+        return
+    print(f"Save slot {slot} written to {path}")
 
 
 def main():
+    args = parse_args()
+    if args.export_save:
+        export_save(*args.export_save)
+        return
+    if args.headless or args.replay:
+        enable_headless_drivers()
     pygame.init()
+    if args.replay:
+        run_replay(args.replay)
+        return
+    if args.headless:
+        run_headless(args.sessions, args.frames, args.record)
+        return
     pygame.mixer.init()
-    game = Game()
+    game = Game(dirty_rendering=args.dirty_rects, replay_dir=args.record, perf_overlay=args.perf_overlay)
     game.show_menu()
 
 if __name__ == "__main__":
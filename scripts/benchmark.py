@@ -0,0 +1,294 @@
+'''
+Benchmark suite for the game logic.
+
+Runs fixed, seeded scenarios through the real update and draw code (headless,
+no frame cap) and reports frames per second, p50/p99 frame time and memory
+allocated per scenario. Results are written as JSON and compared against a
+stored baseline:
+
+    python -m scripts.benchmark
+    python -m scripts.benchmark --scenario boss_rage_phase4 --frames 300
+    python -m scripts.benchmark --update-baseline
+'''
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import pygame
+from scripts.game_logic.game import Game, enable_headless_drivers
+from scripts.game_logic.replay import RecordedKeys, KEY_BITS
+from scripts.game_logic.save_store import SaveStore
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "benchmark_baseline.json")
+SEED = 1234
+WARMUP_FRAMES = 30
+ALLOC_FRAMES = 60  # Frames run under tracemalloc (it slows everything down, so it gets its own pass)
+
+NO_KEYS = RecordedKeys(0)
+FIRE = RecordedKeys(KEY_BITS[pygame.K_SPACE])
+
+
+def prepare(game):
+    # Fresh session state, as main_game_loop would start it
+    game.reset_game_state()
+    game.enemy_manager.create_enemies()
+    game.rng.reseed(SEED)
+    game.game_over = False
+    game.paused = False
+    game.reset_loop_state()
+    # Nobody answers questions here, keep the player alive for the whole run
+    game.player.lives = 10 ** 6
+    game.player.set_invulnerable(10 ** 9)
+
+
+def step(game, keys):
+    game.game_clock.advance()
+    game.update_frame(keys)
+    game.draw_frame()
+    game.game_over = False
+
+
+'''
+Each scenario sets up a game and returns the function that plays one frame.
+'''
+def formation_scenario(game):
+    # A full 5 x 10 enemy wave moving and shooting, the player stands still
+    prepare(game)
+    enemies = game.enemy_manager
+
+    def frame():
+        if enemies.bounding_box()[3] > game.screen_height - 150:
+            enemies.create_enemies()  # Start over before the wave reaches the player
+        step(game, NO_KEYS)
+    return frame
+
+
+def boss_rage_phase4_scenario(game):
+    # Boss at 30% health (phase 4, circle attack) in rage mode, nobody hurts it
+    prepare(game)
+    game.enemy_manager.clear()
+    game.boss_fight = True
+    game.minigame_completed = True
+    game.boss.minigame_triggered = True
+    game.boss.health = 30
+    game.boss.enable_rage_mode()
+
+    def frame():
+        step(game, NO_KEYS)
+    return frame
+
+
+def laser_scenario(game):
+    # Laser power-up kept active while the player holds fire into a full wave
+    prepare(game)
+    bullet_manager = game.bullet_manager
+    power_ups = game.power_ups
+
+    def frame():
+        power_ups.power_up_active = True
+        power_ups.current_power_up = 'Laser'
+        power_ups.power_up_timer = game.game_clock.now
+        bullet_manager.player_bullet_height = 30
+        bullet_manager.player_bullet_speed = 35
+        bullet_manager.player_shoot_interval = 0.005
+        if game.enemy_manager.alive_count < 10:
+            game.enemy_manager.create_enemies()  # Never clear the level
+        step(game, FIRE)
+    return frame
+
+
+def barricade_erosion_scenario(game):
+    # Extra enemy bullets rain onto the barricades; they are rebuilt once they are gone
+    prepare(game)
+    rng = np.random.default_rng(SEED)
+    barricades = game.barricade_manager
+    top = min(barricade["y"] for barricade in barricades.barricades)
+    left = min(barricade["x"] for barricade in barricades.barricades)
+    right = max(barricade["x"] for barricade in barricades.barricades) + barricades.cols * barricades.block_width
+
+    def frame():
+        for x in rng.uniform(left, right, 20).tolist():
+            game.bullet_manager.add_enemy_bullet(x, top - 60)
+        if not any(barricade["cells"].any() for barricade in barricades.barricades):
+            barricades.reset()
+        step(game, NO_KEYS)
+    return frame
+
+
+def save_load_scenario(game):
+    # Write a busy game state to disk and load it back, once per frame
+    prepare(game)
+    rng = np.random.default_rng(SEED)
+    bullet_manager = game.bullet_manager
+    for row, col in zip(rng.integers(0, 5, 15).tolist(), rng.integers(0, 10, 15).tolist()):
+        game.enemy_manager.kill(row, col)
+    for x, y in rng.uniform((0, 0), (game.screen_width, game.screen_height), (300, 2)).tolist():
+        bullet_manager.add_enemy_bullet(x, y)
+        bullet_manager.add_boss_bullet(x, y, 1.5, 2.5)
+        bullet_manager.spawn_player_bullet(x, y, 10, 0.0)
+    folder = tempfile.TemporaryDirectory(prefix="invaders-bench-")
+    store = SaveStore(folder.name)
+
+    def frame():
+        store.save(0, game.get_save_state("BEN"))
+        game.apply_save_state(store.load(0))
+    frame.cleanup = folder.cleanup  # Removes the save folder once run_scenario is done with this frame
+    return frame
+
+
+def startup_scenario(game):
+    # Build a whole new Game (assets, fonts, questions) and draw the first menu frame
+    def frame():
+        new_game = Game(headless=True)
+        new_game.draw_menu(["New Game", "Instructions", "Exit"], 0)
+    return frame
+
+
+# name: (setup, default frame count, warm-up frames)
+SCENARIOS = {
+    "formation": (formation_scenario, 600, WARMUP_FRAMES),
+    "boss_rage_phase4": (boss_rage_phase4_scenario, 600, WARMUP_FRAMES),
+    "laser": (laser_scenario, 600, WARMUP_FRAMES),
+    "barricade_erosion": (barricade_erosion_scenario, 600, WARMUP_FRAMES),
+    "save_load": (save_load_scenario, 200, 5),
+    "startup": (startup_scenario, 5, 0),
+}
+
+
+def finish(frame):
+    # Scenarios that leave something behind (e.g. a temporary save folder) attach a cleanup to their frame
+    cleanup = getattr(frame, "cleanup", None)
+    if cleanup is not None:
+        cleanup()
+
+
+def time_frames(frame, frames, warmup):
+    for _ in range(warmup):
+        frame()
+    frame_times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        frame()
+        frame_times.append(time.perf_counter() - start)
+    return np.array(frame_times) * 1000
+
+
+def run_scenario(game, name, frames=None, repeats=3):
+    setup, default_frames, warmup = SCENARIOS[name]
+    frames = frames or default_frames
+    if name == "startup":
+        frames = min(frames, default_frames)  # Every "frame" here is a full startup
+
+    # Other processes only ever make a run slower, so the fastest repeat is the most comparable
+    runs = []
+    for _ in range(repeats):
+        frame = setup(game)
+        runs.append(time_frames(frame, frames, warmup))
+        finish(frame)
+    frame_times = min(runs, key=lambda times: np.percentile(times, 50))
+
+    # Separate pass for allocations
+    frame = setup(game)
+    tracemalloc.start()
+    start_memory, _ = tracemalloc.get_traced_memory()
+    alloc_frames = min(frames, ALLOC_FRAMES)
+    for _ in range(alloc_frames):
+        frame()
+    end_memory, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    finish(frame)
+
+    return {
+        "frames": frames,
+        "fps": round(frames / (frame_times.sum() / 1000), 1),
+        "p50_ms": round(float(np.percentile(frame_times, 50)), 3),
+        "p99_ms": round(float(np.percentile(frame_times, 99)), 3),
+        "alloc_peak_kib": round((peak_memory - start_memory) / 1024, 1),
+        "alloc_retained_kib_per_frame": round((end_memory - start_memory) / 1024 / alloc_frames, 2),
+    }
+
+
+def compare(results, baseline, threshold):
+    '''
+    Print each scenario next to its baseline and return the names of the ones
+    whose p50 frame time got slower by more than `threshold` (a fraction).
+    '''
+    regressions = []
+    print(f"{'scenario':<20}{'fps':>10}{'p50 ms':>10}{'p99 ms':>10}{'base p50':>10}{'change':>9}")
+    for name, result in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        line = f"{name:<20}{result['fps']:>10}{result['p50_ms']:>10}{result['p99_ms']:>10}"
+        if base:
+            change = result["p50_ms"] / base["p50_ms"] - 1 if base["p50_ms"] else 0.0
+            flag = "  SLOWER" if change > threshold else ""
+            line += f"{base['p50_ms']:>10}{change:>+9.1%}{flag}"
+            if change > threshold:
+                regressions.append(name)
+        print(line)
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Security Invaders benchmarks")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="frames per scenario instead of each scenario's default")
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="timed runs per scenario, the fastest one is reported")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="where to write the results JSON")
+    parser.add_argument("--baseline", default=BASELINE_PATH,
+                        help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="p50 slowdown (fraction) reported as a regression")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store these results as the new baseline")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    enable_headless_drivers()
+    pygame.init()
+    game = Game(headless=True)
+
+    results = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "scenarios": {},
+    }
+    for name in args.scenario or SCENARIOS:
+        results["scenarios"][name] = run_scenario(game, name, args.frames, args.repeats)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+    elif regressions:
+        print(f"Slower than the baseline: {', '.join(regressions)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,33 @@
+import os
+import getpass
 import requests
 from requests.auth import HTTPBasicAuth
 
+# Same server as the game, the local one from scripts/leaderboard_server.py by default
+LEADERBOARD_URL = os.environ.get("LEADERBOARD_URL", "http://127.0.0.1:8000")
+
 def reset_leaderboard():
-    print("All scores have been deleted successfully!")
-    # username = input("Enter the username: ")
-    # password = input("Enter the password: ")
+    username = input("Enter the username (blank if the server has none): ")
+    password = getpass.getpass("Enter the password: ") if username else ""
+
+    url = f"{LEADERBOARD_URL}/delete_all_scores"
 
-    # url = 'https://5269989.pythonanywhere.com/delete_all_scores'
-    
-    # try:
-    #     # Send the DELETE request with the Authentication
-    #     response = requests.delete(url, auth=HTTPBasicAuth(username, password))
+    try:
+        # Send the DELETE request with the Authentication
+        response = requests.delete(url, auth=HTTPBasicAuth(username, password) if username else None, timeout=10)
 
-    #     if response.status_code == 200:
-    #         print("All scores have been deleted successfully!")
-    #     else:
-    #         try:
-    #             error_data = response.json()
-    #             print(f"Failed to delete scores. Error: {error_data}")
-    #         except requests.exceptions.JSONDecodeError:
-    #             # If decoding fails, print error
-    #             print(f"Failed to delete scores. \nResponse: {response.text}")
+        if response.status_code == 200:
+            print("All scores have been deleted successfully!")
+        else:
+            try:
+                error_data = response.json()
+                print(f"Failed to delete scores. Error: {error_data}")
+            except requests.exceptions.JSONDecodeError:
+                # If decoding fails, print error
+                print(f"Failed to delete scores. \nResponse: {response.text}")
 
-    # except requests.RequestException as e:
-    #     print(f"An error occurred: {e}")
+    except requests.RequestException as e:
+        print(f"An error occurred: {e}")
 
-reset_leaderboard()
+if __name__ == "__main__":
+    reset_leaderboard()
@@ -0,0 +1,110 @@
+'''
+7-segment display benchmark, runs on any machine.
+
+Drives the score display against the simulated GPIO backend and reports
+the cost of one refresh step (against the old driver's seven per-segment
+output calls), then runs the real refresh thread for a few seconds while
+the score changes like it does in game, and reports the refresh rate it
+kept up, how late it fell and how much CPU it used:
+
+    python -m scripts.display_benchmark
+    python -m scripts.display_benchmark --refresh-hz 500 --seconds 10
+'''
+import argparse
+import json
+import time
+from scripts.game_logic.seven_segment import (SevenSegmentDisplay, SimulatedGPIO, DIGIT_PINS, SEGMENT_PINS,
+                                              DIGIT_SEGMENTS)
+
+STEPS = 100000
+
+
+def old_step(gpio, digits, position):
+    # What update_7seg_display did for one digit: select it, seven separate segment writes, deselect it
+    gpio.output((DIGIT_PINS[position],), (1,))
+    lit = DIGIT_SEGMENTS[digits[position]]
+    for s, pin in enumerate(SEGMENT_PINS):
+        gpio.output((pin,), (0 if lit >> s & 1 else 1,))
+    gpio.output((DIGIT_PINS[position],), (0,))
+
+
+def time_steps(score_every=200):
+    """Microseconds per step and output calls/pin writes per step, old driver and new."""
+    results = {}
+
+    gpio = SimulatedGPIO(log_size=0)
+    display = SevenSegmentDisplay(gpio)
+    start = time.perf_counter()
+    for i in range(STEPS):
+        if i % score_every == 0:
+            display.set_number(i // score_every * 10)
+        display.step()
+    results["new"] = (time.perf_counter() - start) / STEPS * 1e6, gpio.calls / STEPS, gpio.pin_writes / STEPS
+
+    gpio = SimulatedGPIO(log_size=0)
+    digits = (0, 0, 0, 0)
+    start = time.perf_counter()
+    for i in range(STEPS):
+        if i % score_every == 0:
+            number = i // score_every * 10 % 10000
+            digits = tuple(int(c) for c in f"{number:04d}")
+        old_step(gpio, digits, i % len(DIGIT_PINS))
+    results["old"] = (time.perf_counter() - start) / STEPS * 1e6, gpio.calls / STEPS, gpio.pin_writes / STEPS
+    return results
+
+
+def run_refresh(refresh_hz, seconds):
+    gpio = SimulatedGPIO(log_size=100000)
+    display = SevenSegmentDisplay(gpio, refresh_hz)
+    display.start()
+    end = time.perf_counter() + seconds
+    score = 0
+    while time.perf_counter() < end:
+        score += 10  # About what a busy wave adds per frame
+        display.set_number(score)
+        time.sleep(1 / 60)
+    display.stop()
+
+    # Gaps between consecutive digit selections, the on-time each digit actually got
+    selects = [t for t, pin, level in gpio.log if level == 1 and pin in DIGIT_PINS]
+    gaps = sorted(b - a for a, b in zip(selects, selects[1:]))
+    stats = display.stats()
+    if gaps:
+        stats["step_p50_ms"] = gaps[len(gaps) // 2] * 1000
+        stats["step_p99_ms"] = gaps[int(len(gaps) * 0.99)] * 1000
+    stats["target_step_ms"] = display.step_interval * 1000
+    return stats
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Security Invaders 7-segment display benchmark")
+    parser.add_argument("--refresh-hz", type=float, default=250,
+                        help="whole-display refreshes per second")
+    parser.add_argument("--seconds", type=float, default=5,
+                        help="how long to run the refresh thread")
+    parser.add_argument("--output", default=None,
+                        help="also write the results as JSON to this file")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    steps = time_steps()
+    print(f"{'driver':<8}{'us/step':>10}{'calls/step':>12}{'pins/step':>11}")
+    for name, (us, calls, pins) in steps.items():
+        print(f"{name:<8}{us:>10.2f}{calls:>12.2f}{pins:>11.2f}")
+
+    refresh = run_refresh(args.refresh_hz, args.seconds)
+    print()
+    print(f"Refresh {refresh['refresh_hz']:.1f} Hz (target {refresh['target_hz']:.0f}), "
+          f"CPU {refresh['cpu_percent']:.1f}%, late steps {refresh['late_steps']}")
+    if "step_p50_ms" in refresh:
+        print(f"Step p50 {refresh['step_p50_ms']:.3f} ms, p99 {refresh['step_p99_ms']:.3f} ms "
+              f"(target {refresh['target_step_ms']:.3f} ms)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"steps": steps, "refresh": refresh}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import pygame
+
+RAGE_TINT = (255, 90, 90)  # Multiplied in, keeps the red channel and darkens the rest
+HIT_FLASH = (170, 170, 170)  # Added in, washes the sprite out towards white
+
+def tinted(image, color, blend):
+    # Copy of image with color blended into its RGB channels, alpha is left alone
+    surface = image.copy()
+    surface.fill(color, special_flags=blend)
+    return surface
+
+class BakedAnimation:
+    '''
+    All the frames a sprite can show, rendered once when the game loads.
+
+    Every variant (normal, rage, hit flash and rage + hit flash) has a plain
+    and a horizontally flipped frame. Playing the animation is only a lookup
+    into these lists, no surface is flipped or tinted during gameplay.
+    '''
+    def __init__(self, image, interval, rage_image=None):
+        self.interval = interval
+        if rage_image is None:
+            rage_image = tinted(image, RAGE_TINT, pygame.BLEND_RGB_MULT)
+        self.variants = {
+            "normal": self.bake(image),
+            "rage": self.bake(rage_image),
+            "hit": self.bake(tinted(image, HIT_FLASH, pygame.BLEND_RGB_ADD)),
+            "rage_hit": self.bake(tinted(rage_image, HIT_FLASH, pygame.BLEND_RGB_ADD)),
+        }
+
+    @staticmethod
+    def bake(image):
+        return [image, pygame.transform.flip(image, True, False)]
+
+    @staticmethod
+    def variant_name(rage=False, hit=False):
+        if rage:
+            return "rage_hit" if hit else "rage"
+        return "hit" if hit else "normal"
+
+    def frame_index(self, time, phase=0):
+        # Frame to show at `time` (seconds); `phase` shifts the cycle so sprites don't all flip together
+        return (int(time / self.interval) + phase) % 2
+
+    def frame(self, variant, index):
+        return self.variants[variant][index]
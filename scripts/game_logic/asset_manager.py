@@ -0,0 +1,67 @@
+import os
+import pygame
+from scripts.game_logic.sprite_outline import load_outline
+
+def get_asset_path(*path_parts):
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", *path_parts))
+
+class SilentSound:
+    """Stand-in for pygame.mixer.Sound when the game runs without audio."""
+    def play(self, *args, **kwargs):
+        pass
+
+class AssetManager:
+    '''
+    Loads every image and sound once and hands out the same object afterwards.
+
+    Images are converted to the display's pixel format when they are loaded,
+    so blitting them never has to convert pixels, and each requested size is
+    scaled only once. Resetting a game or coming back to a menu reuses what
+    is already in memory instead of reading the disk again.
+    '''
+    def __init__(self, headless=False):
+        self.headless = headless
+        self.images = {}
+        self.sounds = {}
+        self.outlines = {}
+
+    def image(self, *path_parts, size=None, alpha=True):
+        """Shared surface for assets/<path_parts>, scaled to `size` if given. Raises pygame.error."""
+        key = (path_parts, size, alpha)
+        surface = self.images.get(key)
+        if surface is not None:
+            return surface
+
+        if size is None:
+            surface = pygame.image.load(get_asset_path("assets", *path_parts))
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha() if alpha else surface.convert()
+        else:
+            surface = pygame.transform.scale(self.image(*path_parts, alpha=alpha), size)
+        self.images[key] = surface
+        return surface
+
+    def sprite(self, filename, size):
+        # Sprites are required, the game cannot run without them
+        try:
+            return self.image("sprites", filename, size=size)
+        except pygame.error as e:
+            print(f"Error loading or scaling image '{filename}': {e}")
+            pygame.quit()
+            quit()
+
+    def outline(self, filename, size):
+        # Shield-style outline of a sprite, see sprite_outline.py
+        key = (filename, size)
+        if key not in self.outlines:
+            self.outlines[key] = load_outline(get_asset_path("assets", "sprites", filename), self.sprite(filename, size))
+        return self.outlines[key]
+
+    def sound(self, filename):
+        if self.headless:
+            return SilentSound()
+        sound = self.sounds.get(filename)
+        if sound is None:
+            sound = pygame.mixer.Sound(get_asset_path("assets", "sounds", filename))
+            self.sounds[filename] = sound
+        return sound
@@ -0,0 +1,83 @@
+import threading
+import time
+
+class Autosave:
+    '''
+    Periodic autosave that stays off the frame's critical path.
+
+    The main thread only takes the snapshot (get_save_state copies a few
+    small arrays); encoding, compressing and writing it to disk happen on a
+    background thread. If a new snapshot arrives while the previous one is
+    still being written, only the newest is kept, so the worker can never
+    fall behind.
+    '''
+    def __init__(self, game, store, interval=30, enabled=True):
+        self.game = game
+        self.store = store
+        self.interval = interval  # Seconds of game time between autosaves
+        self.enabled = enabled
+        self.last_save_time = 0
+        self.capture_ms = 0.0  # How long the last snapshot held up the frame, shown in the F3 overlay
+        self.pending = None
+        self.busy = False
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def start_worker(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run_worker, daemon=True)
+            self.thread.start()
+
+    def run_worker(self):
+        while True:
+            with self.condition:
+                while self.pending is None:
+                    self.condition.wait()
+                state, self.pending = self.pending, None
+                self.busy = True
+            try:
+                self.store.save_autosave(state)
+            except Exception as e:
+                # Keep the worker alive whatever went wrong, wait() must never be left hanging
+                print(f"Error autosaving: {e}")
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
+
+    def reset(self):
+        # A new session starts counting from now
+        self.last_save_time = self.game.game_clock.now
+
+    def update(self):
+        """Called once per frame; saves when the interval has passed."""
+        if self.enabled and self.game.game_clock.now - self.last_save_time >= self.interval:
+            self.save()
+
+    def save(self):
+        if not self.enabled:
+            return
+        start = time.perf_counter()
+        state = self.game.get_save_state("Autosave")
+        self.capture_ms = (time.perf_counter() - start) * 1000
+        self.last_save_time = self.game.game_clock.now
+        self.start_worker()
+        with self.condition:
+            self.pending = state  # Replaces an older snapshot that was not written yet
+            self.condition.notify_all()
+
+    def wait(self):
+        """Block until everything handed to the worker is on disk."""
+        with self.condition:
+            while self.pending is not None or self.busy:
+                self.condition.wait()
+
+    def discard(self):
+        # The session is over (won or lost), there is nothing left to continue
+        if not self.enabled:
+            return
+        self.wait()
+        try:
+            self.store.delete_autosave()
+        except OSError as e:
+            print(f"Error removing autosave: {e}")
@@ -1,4 +1,5 @@
 import pygame
+import numpy as np
 
 class BarricadeManager:
     def __init__(self, game):
@@ -10,6 +11,11 @@ class BarricadeManager:
         self.rows = 4
         self.create_barricades()
 
+    '''
+    Each barricade is its top-left corner plus a rows x cols occupancy array
+    ("cells"), one flag per block. A bullet position maps straight to the
+    block it is in, so a hit test is an index lookup instead of a search.
+    '''
     def create_barricades(self, saved_state=None):
         self.barricades = []  # Clear any old barricades
         barricade_y = self.game.screen_height - 120
@@ -18,57 +24,76 @@ class BarricadeManager:
             self.game.screen_width // 3 - barricade_width // 2,
             2 * self.game.screen_width // 3 - barricade_width // 2
         ]
-    
-        for x, saved_blocks in zip(positions, saved_state) if saved_state else [(x, None) for x in positions]:
-            blocks = []
-            if saved_blocks:  # Restoring from save
-                for block in saved_blocks:
-                    block_rect = pygame.Rect(block["x"], block["y"], self.block_width, self.block_height)
-                    blocks.append({"rect": block_rect})
-            else:  # Creating new barricades
-                for row in range(self.rows):
-                    for col in range(self.cols):
-                        block_rect = pygame.Rect(
-                            x + col * self.block_width,
-                            barricade_y + row * self.block_height,
-                            self.block_width,
-                            self.block_height
-                        )
-                        blocks.append({"rect": block_rect})
-            self.barricades.append(blocks)
+
+        for x, saved in zip(positions, saved_state) if saved_state else [(x, None) for x in positions]:
+            if saved is None:  # Creating new barricades
+                self.add_barricade(x, barricade_y)
+            else:  # saves.json listed the remaining blocks
+                cells = np.zeros((self.rows, self.cols), dtype=bool)
+                for block in saved:
+                    cells[(block["y"] - barricade_y) // self.block_height, (block["x"] - x) // self.block_width] = True
+                self.add_barricade(x, barricade_y, cells)
+
+    def add_barricade(self, x, y, cells=None):
+        if cells is None:
+            cells = np.ones((self.rows, self.cols), dtype=bool)
+        self.barricades.append({"x": x, "y": y, "cells": np.array(cells, dtype=bool)})
+
+    def cells_at(self, barricade, xs, ys):
+        # Block row/column under every point, plus a mask of the points that hit a standing block
+        cols = np.floor_divide(xs - barricade["x"], self.block_width).astype(int)
+        rows = np.floor_divide(ys - barricade["y"], self.block_height).astype(int)
+        inside = (cols >= 0) & (cols < self.cols) & (rows >= 0) & (rows < self.rows)
+        rows = np.clip(rows, 0, self.rows - 1)
+        cols = np.clip(cols, 0, self.cols - 1)
+        return rows, cols, inside & barricade["cells"][rows, cols]
 
     '''
-    Checkpoint 8: update barricades. Specifically barricade.remove(block)
-    This remove method removes the specific block (piece) of the barricade
-    that was hit by the enemy bullet
+    Checkpoint 8: update barricades. Specifically clearing the cell of the
+    block (piece) of the barricade that was hit by the enemy bullet
     '''
     def update(self):
-        for bullet in self.game.bullet_manager.enemy_bullets[:]:
-            bullet_pos = (
-                bullet[0] + self.game.bullet_manager.bullet_width / 2,
-                bullet[1] + self.game.bullet_manager.enemy_bullet_height / 2
-            )
-            for barricade in self.barricades:
-                for block in barricade:
-                    if block["rect"].collidepoint(bullet_pos):
-                        barricade.remove(block)  # Enemy bullets remove the block
-                        if bullet in self.game.bullet_manager.enemy_bullets:
-                            self.game.bullet_manager.enemy_bullets.remove(bullet)
-                        break
+        bullet_manager = self.game.bullet_manager
+        enemy_bullets = bullet_manager.enemy_bullets
+        n = enemy_bullets.count
+        # Bullets are tested at their center
+        bullet_x = enemy_bullets.x[:n] + bullet_manager.bullet_width / 2
+        bullet_y = enemy_bullets.y[:n] + bullet_manager.enemy_bullet_height / 2
+        for barricade in self.barricades:
+            rows, cols, hits = self.cells_at(barricade, bullet_x, bullet_y)
+            for i in np.flatnonzero(hits & enemy_bullets.alive[:n]):
+                # A second bullet in the same block this frame finds it already gone
+                if barricade["cells"][rows[i], cols[i]]:
+                    barricade["cells"][rows[i], cols[i]] = False  # Enemy bullets remove the block
+                    enemy_bullets.kill(i)
+        enemy_bullets.compact()
 
-        for bullet in self.game.bullet_manager.player_bullets[:]:
-            bullet_pos = (bullet[0], bullet[1])
-            for barricade in self.barricades:
-                for block in barricade:
-                    if block["rect"].collidepoint(bullet_pos):
-                        if bullet in self.game.bullet_manager.player_bullets:
-                            self.game.bullet_manager.player_bullets.remove(bullet)
-                        break
+        player_bullets = bullet_manager.player_bullets
+        n = player_bullets.count
+        for barricade in self.barricades:
+            _, _, hits = self.cells_at(barricade, player_bullets.x[:n], player_bullets.y[:n])
+            player_bullets.kill(np.flatnonzero(hits))  # Barricades stop player bullets
+        player_bullets.compact()
 
     def draw(self):
         for barricade in self.barricades:
-            for block in barricade:
-                pygame.draw.rect(self.game.screen, (0, 255, 0), block["rect"])  # Always green
+            for row, col in zip(*np.nonzero(barricade["cells"])):
+                block_rect = (barricade["x"] + col * self.block_width, barricade["y"] + row * self.block_height,
+                              self.block_width, self.block_height)
+                pygame.draw.rect(self.game.screen, (0, 255, 0), block_rect)  # Always green
+        return [pygame.Rect(barricade["x"], barricade["y"], self.cols * self.block_width, self.rows * self.block_height)
+                for barricade in self.barricades]
+
+    def get_saved_state(self):
+        return {
+            'positions': np.array([[barricade["x"], barricade["y"]] for barricade in self.barricades], dtype=np.int32).reshape(-1, 2),
+            'cells': np.array([barricade["cells"] for barricade in self.barricades], dtype=bool).reshape(-1, self.rows, self.cols),
+        }
+
+    def restore_saved_state(self, state):
+        self.barricades = []
+        for (x, y), cells in zip(state['positions'].tolist(), state['cells']):
+            self.add_barricade(x, y, cells)
 
     def reset(self):
         self.create_barricades()
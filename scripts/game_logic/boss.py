@@ -1,8 +1,8 @@
 import pygame
 import math
-import random
-import time
-import os
+import numpy as np
+from scripts.game_logic.bullet_pool import VIRUS_BULLET
+from scripts.game_logic.animation import BakedAnimation
 from scripts.game_logic.minigame import HackingMiniGame
 
 class Boss:
@@ -10,10 +10,10 @@ class Boss:
         self.game = game
 
         # Load assets
-        self.base_image = self.load_and_scale_image("boss.png", (150, 150))
-        self.rage_image = self.load_and_scale_image("boss_rage.png", (150, 150))
+        self.base_image = game.assets.sprite("boss.png", (150, 150))
+        self.rage_image = game.assets.sprite("boss_rage.png", (150, 150))
         # Load the virus bullet asset
-        self.virus_bullet_image = self.load_and_scale_image("virus.png", (20, 20))
+        self.virus_bullet_image = game.assets.sprite("virus.png", (20, 20))
 
         self.current_image = self.base_image
         self.width, self.height = self.base_image.get_size()
@@ -26,6 +26,10 @@ class Boss:
         self.animation_interval = 0.5
         self.last_animation_time = 0
         self.animation_toggle = False
+        # Every frame (flipped, rage, hit flash) is baked here once, drawing only picks one
+        self.animation = BakedAnimation(self.base_image, self.animation_interval, self.rage_image)
+        self.hit_flash_duration = 0.08
+        self.last_hit_time = -math.inf
         
         # Save initial positions/stats so you can reset if needed
         self.initial_x = self.x
@@ -43,7 +47,7 @@ class Boss:
 
         # For erratic (phase 5) movement: target position and time
         self.target_pos = (self.x, self.y)
-        self.last_target_update = pygame.time.get_ticks()
+        self.last_target_update = self.game.game_clock.ticks_ms()
 
         # New attributes for the multi–phase AI:
         self.phase = 1  # Phases 1 to 5
@@ -60,16 +64,6 @@ class Boss:
         self.max_explosion_dist = 700
         self.player_explode_threshold = 250
 
-    def load_and_scale_image(self, filename, size):
-        try:
-            return pygame.transform.scale(
-                pygame.image.load(os.path.join("assets", "sprites", filename)).convert_alpha(), size
-            )
-        except pygame.error as e:
-            print(f"Error loading or scaling image '{filename}': {e}")
-            pygame.quit()
-            quit()
-
     def update(self):
         # Update phase according to current health.
         self.update_phase()
@@ -81,8 +75,6 @@ class Boss:
         self.update_virus_bullets()
         # Check for collisions with player bullets.
         self.check_hit_by_player()
-        # Draw the boss and its health bar.
-        self.draw()
 
     def update_phase(self):
         """Determine the current phase based on the percentage of remaining health."""
@@ -131,7 +123,7 @@ class Boss:
             self.x += self.dx
         base_y = 100
         amplitude = 20
-        self.y = base_y + amplitude * math.sin(pygame.time.get_ticks() / 1000.0)
+        self.y = base_y + amplitude * math.sin(self.game.game_clock.ticks_ms() / 1000.0)
 
     def movement_phase3(self):
         # Boss “aims” at the player but with smoothing.
@@ -147,12 +139,12 @@ class Boss:
         # Vertical oscillation (set movement, not pure reaction).
         base_y = 100
         amplitude = 20
-        self.y = base_y + amplitude * math.sin(pygame.time.get_ticks() / 1000.0)
+        self.y = base_y + amplitude * math.sin(self.game.game_clock.ticks_ms() / 1000.0)
 
     def movement_phase4(self):
         # Zigzag movement: use time–based sine functions for both x and y.
         period = 3000  # period in milliseconds
-        t = pygame.time.get_ticks() % period
+        t = self.game.game_clock.ticks_ms() % period
         x_min = 50
         x_max = self.game.screen_width - self.width - 50
         sine_val = math.sin(2 * math.pi * t / period)
@@ -162,13 +154,13 @@ class Boss:
 
     def movement_phase5(self):
         # Erratic movement: update a target position every 2 seconds, then smoothly move toward it.
-        current_time = pygame.time.get_ticks()
+        current_time = self.game.game_clock.ticks_ms()
         if current_time - self.last_target_update > 2000:
             x_min = 50
             x_max = self.game.screen_width - self.width - 50
             y_min = 50
             y_max = self.game.screen_height // 3
-            self.target_pos = (random.randint(x_min, x_max), random.randint(y_min, y_max))
+            self.target_pos = (self.game.rng.boss.randint(x_min, x_max), self.game.rng.boss.randint(y_min, y_max))
             self.last_target_update = current_time
         target_x, target_y = self.target_pos
         dx = target_x - self.x
@@ -198,9 +190,14 @@ class Boss:
         elif self.phase == 5:
             self.phase5_attack()
 
+    def fire_current_attack(self):
+        """Fire the current phase's attack now, ignoring its shoot interval (used by the stress test)."""
+        self.last_shot_time = -math.inf
+        self.attack_pattern()
+
     def phase1_attack(self):
         """Phase 1: Fire a bullet straight down."""
-        current_time = time.time()
+        current_time = self.game.game_clock.now
         if current_time - self.last_shot_time < self.phase1_shoot_interval:
             return
         self.last_shot_time = current_time
@@ -210,7 +207,7 @@ class Boss:
 
     def phase2_attack(self):
         """Phase 2: Spread attack – continuously fire a single bullet with a random angle in a 45° cone (relative to straight down)."""
-        current_time = time.time()
+        current_time = self.game.game_clock.now
         if current_time - self.last_shot_time < self.phase2_shoot_interval:
             return
         self.last_shot_time = current_time
@@ -220,7 +217,7 @@ class Boss:
         boss_bottom_y = self.y + self.height
 
         # Choose a random angle between -22.5° and +22.5° (relative to straight down)
-        angle = random.uniform(-90, 90)
+        angle = self.game.rng.boss.uniform(-90, 90)
         rad = math.radians(angle)
     
         # Calculate bullet velocity components; when angle=0, bullet goes straight down
@@ -232,7 +229,7 @@ class Boss:
 
     def phase3_attack(self):
         
-        current_time = time.time()
+        current_time = self.game.game_clock.now
         if current_time - self.last_shot_time < self.phase3_shoot_interval:
             return
         self.last_shot_time = current_time
@@ -243,19 +240,19 @@ class Boss:
         dx = (player_center_x - boss_center_x) / 50.0
         dy = (player_center_y - boss_center_y) / 50.0
         # Add slight inaccuracy
-        dx += dx * random.uniform(-0.02, 0.02)
-        dy += dy * random.uniform(-0.02, 0.02)
+        dx += dx * self.game.rng.boss.uniform(-0.02, 0.02)
+        dy += dy * self.game.rng.boss.uniform(-0.02, 0.02)
         self.game.bullet_manager.add_boss_bullet(
             self.x + self.width // 2, self.y + self.height, dx, dy
         )
 
     def phase4_attack(self):
         """Phase 4: Circle attack firing a bullet in a random direction."""
-        current_time = time.time()
+        current_time = self.game.game_clock.now
         if current_time - self.last_shot_time < self.phase4_shoot_interval:
             return
         self.last_shot_time = current_time
-        angle = random.randint(0, 360)
+        angle = self.game.rng.boss.randint(0, 360)
         rad = math.radians(angle)
         dx = math.cos(rad) * 3
         dy = math.sin(rad) * 3
@@ -264,7 +261,7 @@ class Boss:
         )
 
     def phase5_attack(self):
-        current_time = time.time()
+        current_time = self.game.game_clock.now
         if current_time - self.last_shot_time < self.phase5_shoot_interval:
             return
         self.last_shot_time = current_time
@@ -288,31 +285,29 @@ class Boss:
         dy *= self.virus_bullet_speed
 
         # Create virus bullet with explosion params
-        virus_bullet = {
-            "x": bx, "y": by, "dx": dx, "dy": dy, 
-            "type": "virus", "image": self.virus_bullet_image,
-            "start_x": bx, "start_y": by,
-            "explode_dist": random.uniform(self.min_explosion_dist, self.max_explosion_dist)
-        }
-        self.game.bullet_manager.boss_bullets.append(virus_bullet)
+        self.game.bullet_manager.add_virus_bullet(
+            bx, by, dx, dy, self.game.rng.boss.uniform(self.min_explosion_dist, self.max_explosion_dist)
+        )
 
     def update_virus_bullets(self):
         """Update virus bullets and trigger their explosion when they reach the threshold."""
 
-        explosion_threshold = (5000)
-
-        for bullet in self.game.bullet_manager.boss_bullets[:]:
-            if isinstance(bullet, dict) and bullet.get("type") == "virus":
-                # Update its position
-                bullet["y"] += bullet["dy"]
+        bullets = self.game.bullet_manager.boss_bullets
+        n = bullets.count
+        is_virus = bullets.kind[:n] == VIRUS_BULLET
+        if not is_virus.any():
+            return
+        # Update their position
+        bullets.y[:n][is_virus] += bullets.dy[:n][is_virus]
 
-                if bullet["y"] >= (500):
-                    self.explode_virus(bullet)
-                    self.game.bullet_manager.boss_bullets.remove(bullet)
+        exploding = np.flatnonzero(is_virus & (bullets.y[:n] >= 500))
+        bullets.kill(exploding)
+        for i in exploding:
+            self.explode_virus(bullets.x[i], bullets.y[i])
+        bullets.compact()
 
-    def explode_virus(self, bullet):
+    def explode_virus(self, x, y):
         """Explode the virus bullet into several bullets in a circular pattern."""
-        x, y = bullet["x"], bullet["y"]
         for angle in range(0, 360, 45):
             rad = math.radians(angle)
             dx = math.cos(rad) * 4
@@ -340,16 +335,16 @@ class Boss:
     # ─── DRAWING METHODS ─────────────────────────────────────────────
     def draw(self):
         # Handle image animation (flip periodically)
-        current_time = time.time()
+        current_time = self.game.game_clock.now
         if current_time - self.last_animation_time >= self.animation_interval:
             self.animation_toggle = not self.animation_toggle
-            base = self.rage_image if self.rage_mode else self.base_image
-            self.current_image = (pygame.transform.flip(base, True, False)
-                                  if self.animation_toggle else base)
             self.last_animation_time = current_time
+        hit = current_time - self.last_hit_time < self.hit_flash_duration
+        variant = self.animation.variant_name(self.rage_mode, hit)
+        self.current_image = self.animation.frame(variant, int(self.animation_toggle))
 
-        self.game.screen.blit(self.current_image, (self.x, self.y))
-        self.draw_health_bar()
+        rect = self.game.screen.blit(self.current_image, (self.x, self.y))
+        return [rect] + self.draw_health_bar()
 
     def draw_health_bar(self):
         bar_width = 200
@@ -357,15 +352,15 @@ class Boss:
         bar_x = self.game.screen_width // 2 - bar_width // 2
 
         # Draw health bar background (red) and current health (green)
-        pygame.draw.rect(self.game.screen, self.game.RED, (bar_x, 40, bar_width, 20))
+        bar_rect = pygame.draw.rect(self.game.screen, self.game.RED, (bar_x, 40, bar_width, 20))
         pygame.draw.rect(self.game.screen, self.game.GREEN, (bar_x, 40, health_width, 20))
 
         # Render "VIRUS" text
-        name_text = self.game.font.render(self.name, True, self.game.YELLOW)
+        name_text = self.game.text_cache.render(self.game.font, self.name, True, self.game.YELLOW)
     
         # If in rage mode, render "(Rage Mode)" text
         if self.rage_mode:
-            rage_text = self.game.font.render("(Rage Mode)", True, self.game.RED)
+            rage_text = self.game.text_cache.render(self.game.font, "(Rage Mode)", True, self.game.RED)
 
             # Calculate total width of "VIRUS (Rage Mode)" combined
             total_width = name_text.get_width() + 10 + rage_text.get_width()
@@ -375,32 +370,38 @@ class Boss:
             rage_x = name_x + name_text.get_width() + 10  # Place "(Rage Mode)" after "VIRUS"
 
             # Draw both texts
-            self.game.screen.blit(name_text, (name_x, 10))
-            self.game.screen.blit(rage_text, (rage_x, 10))
+            name_rect = self.game.screen.blit(name_text, (name_x, 10))
+            rage_rect = self.game.screen.blit(rage_text, (rage_x, 10))
+            return [bar_rect, name_rect, rage_rect]
         else:
             # Just center "VIRUS" normally if not in rage mode
             name_x = self.game.screen_width // 2 - name_text.get_width() // 2
-            self.game.screen.blit(name_text, (name_x, 10))
+            name_rect = self.game.screen.blit(name_text, (name_x, 10))
+            return [bar_rect, name_rect]
 
 
     def check_hit_by_player(self):
         """Check for collision with player bullets and update health."""
-        for bullet in self.game.bullet_manager.player_bullets[:]:
-            if (self.x < bullet[0] < self.x + self.width and 
-                self.y < bullet[1] < self.y + self.height):
-                self.game.bullet_manager.player_bullets.remove(bullet)
-                self.health -= 1
-                if self.health <= 0:
-                    self.game.change_music(self.game.boss_defeated_music)
-                    self.game.display_feedback("Boss Defeated!", self.game.GREEN)
-                    self.game.end_game_screen()
-                # Trigger the minigame (or rage mode) once when health is low.
-                elif self.health <= 50 and not self.rage_mode and not self.minigame_triggered:
-                    success = HackingMiniGame(self.game).run()
-                    if not success:
-                        self.enable_rage_mode()
-                    self.minigame_triggered = True
-                    
+        bullets = self.game.bullet_manager.player_bullets
+        grid = self.game.bullet_manager.build_player_grid()
+        hits = grid.query_rect(self.x, self.y, self.width, self.height)
+        bullets.kill(hits)
+        bullets.compact()
+        if len(hits):
+            self.last_hit_time = self.game.game_clock.now  # Flash white for a moment
+        for _ in hits:
+            self.health -= 1
+            if self.health <= 0:
+                self.game.change_music(self.game.boss_defeated_music)
+                self.game.display_feedback("Boss Defeated!", self.game.GREEN)
+                self.game.end_game_screen()
+            # Trigger the minigame (or rage mode) once when health is low.
+            elif self.health <= 50 and not self.rage_mode and not self.minigame_triggered:
+                success = HackingMiniGame(self.game).run()
+                if not success:
+                    self.enable_rage_mode()
+                self.minigame_triggered = True
+                
     def trigger_minigame(self):
         success = HackingMiniGame(self.game).run()
         if not success:
@@ -408,6 +409,43 @@ class Boss:
             self.rage_mode = True
         self.minigame_triggered = True
         
+    def get_saved_state(self):
+        now = self.game.game_clock.now
+        return {
+            'x': self.x,
+            'y': self.y,
+            'health': self.health,
+            'max_health': self.max_health,
+            'speed': self.speed,
+            'dx': self.dx,
+            'phase': self.phase,
+            'rage_mode': self.rage_mode,
+            'minigame_triggered': self.minigame_triggered,
+            'target_pos': list(self.target_pos),
+            'target_age_ms': self.game.game_clock.ticks_ms() - self.last_target_update,
+            'last_shot_time': now - self.last_shot_time,  # Seconds since the last shot
+            # Rage mode shortens these, so they are saved rather than recomputed
+            'shoot_intervals': [self.phase1_shoot_interval, self.phase2_shoot_interval, self.phase3_shoot_interval,
+                                self.phase4_shoot_interval, self.phase5_shoot_interval],
+        }
+
+    def restore_saved_state(self, state):
+        now = self.game.game_clock.now
+        self.x = state['x']
+        self.y = state['y']
+        self.health = state['health']
+        self.max_health = state['max_health']
+        self.speed = state['speed']
+        self.dx = state['dx']
+        self.phase = state['phase']
+        self.rage_mode = state['rage_mode']
+        self.minigame_triggered = state['minigame_triggered']
+        self.target_pos = tuple(state['target_pos'])
+        self.last_target_update = self.game.game_clock.ticks_ms() - state['target_age_ms']
+        self.last_shot_time = now - state['last_shot_time']
+        (self.phase1_shoot_interval, self.phase2_shoot_interval, self.phase3_shoot_interval,
+         self.phase4_shoot_interval, self.phase5_shoot_interval) = state['shoot_intervals']
+
     def reset_boss(self):
         self.x = self.initial_x
         self.y = self.initial_y
@@ -417,10 +455,15 @@ class Boss:
         self.animation_interval = self.initial_animation_interval
         self.last_shot_time = 0
         self.last_animation_time = 0
+        self.last_hit_time = -math.inf
         self.current_image = self.base_image
         self.direction = 1
         self.rage_mode = False
         self.minigame_triggered = False
+        self.phase = 1
+        self.dx = self.speed
+        self.target_pos = (self.x, self.y)
+        self.last_target_update = self.game.game_clock.ticks_ms()
         self.phase1_shoot_interval = 0.15  
         self.phase2_shoot_interval = 0.1  
         self.phase3_shoot_interval = 0.5  
@@ -1,12 +1,16 @@
 import pygame
 import math
-import time
+import numpy as np
+from scripts.game_logic.bullet_pool import BulletPool, PLAYER_BULLET, ENEMY_BULLET, BOSS_BULLET, VIRUS_BULLET
+from scripts.game_logic.spatial_grid import SpatialGrid
+from scripts.game_logic.bullet_sprites import RotatedBulletSprites
 
 class BulletManager:
     def __init__(self, game):
-        self.player_bullets = []
-        self.enemy_bullets = []
-        self.boss_bullets = []
+        # Struct-of-arrays pools, one per owner; boss and virus bullets share a pool and are told apart by kind
+        self.player_bullets = BulletPool(256, extra_fields=("height", "angle"))
+        self.enemy_bullets = BulletPool(256)
+        self.boss_bullets = BulletPool(1024, extra_fields=("start_x", "start_y", "explode_dist"))
         self.bullet_width = 5
         self.player_bullet_height = 10  # Default height for player bullets
         self.enemy_bullet_height = 10   # New attribute for enemy bullet height
@@ -17,188 +21,196 @@ class BulletManager:
         self.game = game
         self.angle = math.radians(20)
         self.triple_shot = False
+        # Broadphase grid over the player bullets, rebuilt whenever a collision pass needs it
+        self.player_grid = SpatialGrid(cell_size=32)
+        # Bullet sprites are rasterized once here, drawing a bullet is then a single blit
+        self.player_bullet_sprites = {}
+        for height in (10, 30):  # Normal and Laser bullets
+            self.get_player_bullet_sprites(height)
+        self.boss_bullet_sprites = RotatedBulletSprites(self.enemy_bullet_height, self.bullet_width,
+                                                        self.game.YELLOW, centered=True)
+        self.enemy_bullet_sprite = pygame.Surface((self.bullet_width, self.enemy_bullet_height))
+        self.enemy_bullet_sprite.fill(self.game.RED)
 
     def add_player_bullet(self, x, y):
         if self.triple_shot:
             # Middle bullet (straight ahead)
-            self.player_bullets.append([x, y, self.player_bullet_height, 0])  # angle 0 means straight up
+            self.spawn_player_bullet(x, y, self.player_bullet_height, 0)  # angle 0 means straight up
             # Left bullet (20 degrees to the left)
-            self.player_bullets.append([x - 10, y, self.player_bullet_height, -self.angle])  
+            self.spawn_player_bullet(x - 10, y, self.player_bullet_height, -self.angle)
             # Right bullet (20 degrees to the right)
-            self.player_bullets.append([x + 10, y, self.player_bullet_height, self.angle])
+            self.spawn_player_bullet(x + 10, y, self.player_bullet_height, self.angle)
         else:
-            self.player_bullets.append([x, y, self.player_bullet_height, 0])  # Single shot straight up
+            self.spawn_player_bullet(x, y, self.player_bullet_height, 0)  # Single shot straight up
+
+    def spawn_player_bullet(self, x, y, height, angle):
+        # The direction is worked out once per bullet; the speed is applied every frame, so bullets
+        # already in flight slow down again when the Laser power-up ends
+        self.player_bullets.add(x, y, math.sin(angle), -math.cos(angle), PLAYER_BULLET, height=height, angle=angle)
 
     def add_enemy_bullet(self, x, y):
-        self.enemy_bullets.append([x, y])
+        self.enemy_bullets.add(x, y, 0, self.enemy_bullet_speed, ENEMY_BULLET)
 
     def add_boss_bullet(self, x, y, dx=0, dy=3):
         # Ensure all parameters are valid numbers
         if all(isinstance(v, (int, float)) for v in [x, y, dx, dy]):
-            self.boss_bullets.append([x, y, dx, dy])
+            self.boss_bullets.add(x, y, dx, dy, BOSS_BULLET)
         else:
             return
 
-    def update_player_bullets(self, draw_only=False):
-        if not draw_only:
-            self.check_bullet_collisions()
-        bullets_to_remove = []
-        for bullet in self.player_bullets[:]:
-            x, y, height, angle = bullet
-            # Move bullet based on its angle
-            if not draw_only and angle == 0:  # Straight up
-                bullet[1] -= self.player_bullet_speed
-            elif not draw_only:
-                # Calculate movement based on angle
-                bullet[0] += self.player_bullet_speed * math.sin(angle)  # Horizontal movement
-                bullet[1] -= self.player_bullet_speed * math.cos(angle)  # Vertical movement
-            
-            # Calculate points for drawing a rotated rectangle
-            # Here we're using the bullet's height as its length in the direction of travel
-            rect_points = [
-                (x, y),
-                (x + height * math.sin(angle), y - height * math.cos(angle)),
-                (x + self.bullet_width * math.cos(angle) + height * math.sin(angle), y + self.bullet_width * math.sin(angle) - height * math.cos(angle)),
-                (x + self.bullet_width * math.cos(angle), y + self.bullet_width * math.sin(angle))
-            ]
-            # Draw the rotated rectangle
-            pygame.draw.polygon(self.game.screen, self.game.GREEN, rect_points)
-            
-            # Check for conditions to remove bullet
-            if not draw_only and (bullet[1] < 0 or bullet[0] < 0 or bullet[0] > self.game.screen_width):
-                bullets_to_remove.append(bullet)
-            '''
-            Checkpoint 9: check for player bullet collision with enemies
-            '''
-            # Check for enemy collision
-            for enemy in self.game.enemy_manager.enemies[:]:
-                if (enemy[0] < x < enemy[0] + 40 and enemy[1] < y < enemy[1] + 40) or \
-                   (enemy[0] < x + height * math.sin(angle) < enemy[0] + 40 and enemy[1] < y - height * math.cos(angle) < enemy[1] + 40):
-                    bullets_to_remove.append(bullet)
-                    self.game.enemy_manager.enemies.remove(enemy)
-                    break
-            # Remove all bullets marked for deletion
-            for bullet in bullets_to_remove:
-                if bullet in self.player_bullets:  # Double check if the bullet is still in the list
-                    self.player_bullets.remove(bullet)
-
-    def update_enemy_bullets(self, draw_only=False):
-        # Changed from boss_bullets to enemy_bullets
-        for bullet in self.enemy_bullets[:]:  # THIS LINE WAS FIXED
-            if not draw_only:
-                # Move bullet downward
-                bullet[1] += self.enemy_bullet_speed
-        
-            # Draw enemy bullet
-            pygame.draw.rect(self.game.screen, self.game.RED, 
-                            (bullet[0], bullet[1], self.bullet_width, self.enemy_bullet_height))
-        
-            # Remove bullets that go off screen
-            if not draw_only and bullet[1] > self.game.screen_height:
-                self.enemy_bullets.remove(bullet)
-                
-    def update_boss_bullets(self, draw_only=False):
-        for bullet in self.boss_bullets[:]:
-            if isinstance(bullet, dict) and bullet.get("type") == "virus":
-                if not draw_only:
-                    bullet["x"] += bullet["dx"]
-                    bullet["y"] += bullet["dy"]
-
-                    # Check distance traveled
-                    traveled = math.hypot(bullet["x"]-bullet["start_x"], 
-                                        bullet["y"]-bullet["start_y"])
-                    if traveled >= bullet["explode_dist"]:
-                        self.game.boss.explode_virus(bullet)
-                        self.boss_bullets.remove(bullet)
-                        continue
-
-                    # Check player proximity
-                    px = self.game.player.x + self.game.player.width//2
-                    py = self.game.player.y + self.game.player.height//2
-                    dist_to_player = math.hypot(bullet["x"]-px, bullet["y"]-py)
-                    if dist_to_player < self.game.boss.player_explode_threshold:
-                        self.game.boss.explode_virus(bullet)
-                        self.boss_bullets.remove(bullet)
-                        continue
-
-                self.game.screen.blit(bullet["image"], (bullet["x"], bullet["y"]))
-
-            elif isinstance(bullet, list) and len(bullet) == 4:
-                if not draw_only:
-                    bullet[0] += bullet[2]  # x += dx
-                    bullet[1] += bullet[3]  # y += dy
-
-                # Calculate angle in radians
-                angle = math.atan2(bullet[3], bullet[2])
-
-                # Bullet dimensions (keeping original proportions)
-                width = self.enemy_bullet_height
-                height =  self.bullet_width # This is now the bullet's "length"
-
-                # Center of the bullet
-                cx, cy = bullet[0] + width / 2, bullet[1] + height / 2
-
-                # Calculate rotated rectangle corners
-                cos_a = math.cos(angle)
-                sin_a = math.sin(angle)
-
-                half_w, half_h = width / 2, height / 2
-
-                points = [
-                    (cx - half_w * cos_a - half_h * sin_a, cy - half_w * sin_a + half_h * cos_a),  # Top-left
-                    (cx + half_w * cos_a - half_h * sin_a, cy + half_w * sin_a + half_h * cos_a),  # Top-right
-                    (cx + half_w * cos_a + half_h * sin_a, cy + half_w * sin_a - half_h * cos_a),  # Bottom-right
-                    (cx - half_w * cos_a + half_h * sin_a, cy - half_w * sin_a - half_h * cos_a)   # Bottom-left
-                ]
-
-                # Draw the rotated rectangle
-                pygame.draw.polygon(self.game.screen, self.game.YELLOW, points)
-
-                # Remove bullets that go off screen
-                if not draw_only and (cx < 0 or cx > self.game.screen_width or cy < 0 or cy > self.game.screen_height):
-                    self.boss_bullets.remove(bullet)
-
-            else:
-                self.boss_bullets.remove(bullet)
-                
-    def check_bullet_collisions(self):
-        bullets_to_remove = []
-        collision_radius = 10  # Adjust for better hitbox size
+    def add_virus_bullet(self, x, y, dx, dy, explode_dist):
+        self.boss_bullets.add(x, y, dx, dy, VIRUS_BULLET, start_x=x, start_y=y, explode_dist=explode_dist)
 
-        # Check for collisions between player bullets and boss bullets
-        for p_bullet in self.player_bullets[:]:
-            px, py, _, _ = p_bullet  # Player bullet position
-
-            for b_bullet in self.boss_bullets[:]:
-                if isinstance(b_bullet, list) and len(b_bullet) == 4:
-                    bx, by, _, _ = b_bullet  # Normal boss bullet
-                elif isinstance(b_bullet, dict) and "x" in b_bullet and "y" in b_bullet:
-                    bx, by = b_bullet["x"], b_bullet["y"]  # Virus bullet dictionary
+    def update_player_bullets(self):
+        self.check_bullet_collisions()
+        bullets = self.player_bullets
+        n = bullets.count
+        # Positions before moving, used for the enemy hit test like before
+        x = bullets.x[:n].copy()
+        y = bullets.y[:n].copy()
+        # Move every bullet along its angle in one pass
+        bullets.integrate(self.player_bullet_speed)
+        # Remove bullets that left the top or the sides of the screen
+        bullets.cull(0, 0, self.game.screen_width, math.inf)
+        '''
+        Checkpoint 9: check for player bullet collision with enemies
+        '''
+        # The bullet hits an enemy if either its base or its tip is inside the enemy.
+        # Both points map straight to a formation slot, no search over the enemies needed
+        enemy_manager = self.game.enemy_manager
+        if n and enemy_manager.alive_count:
+            height = bullets.height[:n]
+            tip_x = x + height * np.sin(bullets.angle[:n])
+            tip_y = y - height * np.cos(bullets.angle[:n])
+            base_rows, base_cols, base_hits = enemy_manager.enemy_at(x, y)
+            tip_rows, tip_cols, tip_hits = enemy_manager.enemy_at(tip_x, tip_y)
+            for i in np.flatnonzero((base_hits | tip_hits) & bullets.alive[:n]):
+                # Another bullet may have taken this enemy out earlier in the loop
+                if base_hits[i] and enemy_manager.alive[base_rows[i], base_cols[i]]:
+                    enemy_manager.kill(base_rows[i], base_cols[i])
+                elif tip_hits[i] and enemy_manager.alive[tip_rows[i], tip_cols[i]]:
+                    enemy_manager.kill(tip_rows[i], tip_cols[i])
                 else:
-                    continue  # Skip invalid bullets
+                    continue
+                bullets.kill(i)  # One enemy per bullet
+        bullets.compact()
+
+    def get_player_bullet_sprites(self, height):
+        if height not in self.player_bullet_sprites:
+            self.player_bullet_sprites[height] = RotatedBulletSprites(self.bullet_width, height, self.game.GREEN)
+        return self.player_bullet_sprites[height]
+
+    def draw_player_bullets(self):
+        bullets = self.player_bullets
+        n = bullets.count
+        rects = []
+        if not n:
+            return rects
+        heights = bullets.height[:n]
+        # One batched blit per bullet length (normal and Laser bullets can be on screen together)
+        for height in np.unique(heights).tolist():
+            same = heights == height
+            sprites = self.get_player_bullet_sprites(height)
+            rects += self.game.screen.blits(sprites.blit_sequence(bullets.x[:n][same], bullets.y[:n][same],
+                                                                  bullets.angle[:n][same]))
+        return rects
+
+    def update_enemy_bullets(self):
+        # Move every bullet downward and remove the ones that went off screen
+        self.enemy_bullets.integrate()
+        self.enemy_bullets.cull(-math.inf, -math.inf, math.inf, self.game.screen_height)
+        self.enemy_bullets.compact()
+
+    def draw_enemy_bullets(self):
+        sprite = self.enemy_bullet_sprite
+        return self.game.screen.blits([(sprite, position) for position in self.enemy_bullets.rows("x", "y")])
+
+    def update_boss_bullets(self):
+        bullets = self.boss_bullets
+        bullets.integrate()
+        n = bullets.count
+        is_virus = bullets.kind[:n] == VIRUS_BULLET
+
+        # Remove normal boss bullets whose center went off screen
+        bullets.cull(0, 0, self.game.screen_width, self.game.screen_height,
+                     offset_x=self.enemy_bullet_height / 2, offset_y=self.bullet_width / 2,
+                     mask=~is_virus)
+
+        if is_virus.any():
+            # Virus bullets explode once they travelled far enough or got close to the player
+            px = self.game.player.x + self.game.player.width//2
+            py = self.game.player.y + self.game.player.height//2
+            x, y = bullets.x[:n], bullets.y[:n]
+            traveled_sq = (x - bullets.start_x[:n]) ** 2 + (y - bullets.start_y[:n]) ** 2
+            to_player_sq = (x - px) ** 2 + (y - py) ** 2
+            explode = is_virus & bullets.alive[:n] & (
+                (traveled_sq >= bullets.explode_dist[:n] ** 2) |
+                (to_player_sq < self.game.boss.player_explode_threshold ** 2)
+            )
+            exploding = np.flatnonzero(explode)
+            bullets.kill(exploding)
+            for i in exploding:
+                self.game.boss.explode_virus(bullets.x[i], bullets.y[i])
+        bullets.compact()
 
-                # Distance-based collision check
-                if math.hypot(px - bx, py - by) < collision_radius:
-                    # If this is a virus bullet, trigger its explosion before removing it
-                    if isinstance(b_bullet, dict) and b_bullet.get("type") == "virus":
-                        self.game.boss.explode_virus(b_bullet)
-                    bullets_to_remove.append((p_bullet, b_bullet))
+    def draw_boss_bullets(self):
+        bullets = self.boss_bullets
+        n = bullets.count
+        if not n:
+            return []
+        is_virus = bullets.kind[:n] == VIRUS_BULLET
+        normal = ~is_virus
+        # Sprites are anchored at the bullet's center and rotated to its direction of travel
+        cx = bullets.x[:n][normal] + self.enemy_bullet_height / 2
+        cy = bullets.y[:n][normal] + self.bullet_width / 2
+        angles = np.arctan2(bullets.dy[:n][normal], bullets.dx[:n][normal])
+        rects = self.game.screen.blits(self.boss_bullet_sprites.blit_sequence(cx, cy, angles))
+        if is_virus.any():
+            image = self.game.boss.virus_bullet_image
+            positions = zip(bullets.x[:n][is_virus].tolist(), bullets.y[:n][is_virus].tolist())
+            rects += self.game.screen.blits([(image, position) for position in positions])
+        return rects
 
-            # Check for collisions between player bullets and normal enemy bullets
-            for e_bullet in self.game.bullet_manager.enemy_bullets[:]:
-                ex, ey = e_bullet  # Enemy bullet position
+    def draw(self):
+        # Returns the screen rects that were drawn into, for dirty-rect rendering
+        return self.draw_player_bullets() + self.draw_enemy_bullets() + self.draw_boss_bullets()
 
-                if math.hypot(px - ex, py - ey) < collision_radius:
-                    bullets_to_remove.append((p_bullet, e_bullet))
+    def build_player_grid(self):
+        """Rebuild the broadphase over the current player bullet positions and return it."""
+        n = self.player_bullets.count
+        return self.player_grid.rebuild(self.player_bullets.x[:n], self.player_bullets.y[:n])
+
+    def check_bullet_collisions(self):
+        collision_radius = 10  # Adjust for better hitbox size
+        players = self.player_bullets
+        if players.count == 0:
+            return
+        grid = self.build_player_grid()
+
+        # Check for collisions between player bullets and boss bullets
+        bosses = self.boss_bullets
+        m = bosses.count
+        if m:
+            boss_idx, player_idx = grid.pairs_within(bosses.x[:m], bosses.y[:m], collision_radius)
+            hit_bosses = np.unique(boss_idx)
+            # If this is a virus bullet, trigger its explosion before removing it
+            for i in hit_bosses[bosses.kind[hit_bosses] == VIRUS_BULLET]:
+                self.game.boss.explode_virus(bosses.x[i], bosses.y[i])
+            players.kill(player_idx)
+            bosses.kill(hit_bosses)
+            bosses.compact()
+
+        # Check for collisions between player bullets and normal enemy bullets
+        enemies = self.enemy_bullets
+        m = enemies.count
+        if m:
+            enemy_idx, player_idx = grid.pairs_within(enemies.x[:m], enemies.y[:m], collision_radius)
+            players.kill(player_idx)
+            enemies.kill(enemy_idx)
+            enemies.compact()
 
         # Remove collided bullets
-        for p_bullet, enemy_bullet in bullets_to_remove:
-            if p_bullet in self.player_bullets:
-                self.player_bullets.remove(p_bullet)
-            if enemy_bullet in self.boss_bullets:
-                self.boss_bullets.remove(enemy_bullet)
-            elif enemy_bullet in self.enemy_bullets:
-                self.enemy_bullets.remove(enemy_bullet)
+        players.compact()
 
     '''
     Checkpoint 7: check if player is hit by enemy bullets
@@ -206,36 +218,70 @@ class BulletManager:
     def check_player_hit(self):
         player_object_total_width = self.game.player.x + self.game.player.width
         player_object_total_height = self.game.player.y + self.game.player.height
-        #self.enemy_bullets[:] is the python splice to create a copy of the enemy_bullet list
-        # to not modify the original list while iterating over it
-        for bullet in self.enemy_bullets[:]:
-            '''
-            if the bullet x coordinate falls within the player object x coordinate and total player object width
-            and the bullet y coordinate falls within the player object y coordinate and total player object height
-            then we have a hit
-            '''
-            #Original if (self.game.player.x < bullet[0] < self.game.player.x + self.game.player.width and self.game.player.y < bullet[1] < self.game.player.y + self.game.player.height):
-            if((bullet[0] > self.game.player.x and bullet[0] < player_object_total_width) and (bullet[1] > self.game.player.y and bullet[1] < player_object_total_height)):
-                if not self.game.player.invulnerable:
-                    self.enemy_bullets.remove(bullet)
-                    self.game.last_hit_time = time.time()
-                    return True
-                self.enemy_bullets.remove(bullet)
+        bullets = self.enemy_bullets
+        n = bullets.count
+        x, y = bullets.x[:n], bullets.y[:n]
+        '''
+        if the bullet x coordinate falls within the player object x coordinate and total player object width
+        and the bullet y coordinate falls within the player object y coordinate and total player object height
+        then we have a hit
+        '''
+        hits = (x > self.game.player.x) & (x < player_object_total_width) & \
+               (y > self.game.player.y) & (y < player_object_total_height)
+        if not hits.any():
+            return False
+        if not self.game.player.invulnerable:
+            bullets.remove(int(np.argmax(hits)))
+            self.game.last_hit_time = self.game.game_clock.now
+            return True
+        # The shield absorbs every bullet that touches it
+        bullets.kill(np.flatnonzero(hits))
+        bullets.compact()
         return False
 
     def reset_triple_shot(self):
         self.triple_shot = False
 
     def check_player_hit_by_boss_bullet(self):
-        for bullet in self.boss_bullets[:]:
-            if not isinstance(bullet, list) or len(bullet) < 4:
-                continue  # Skip malformed bullets
-        
-            # Access bullet as a list
-            if (self.game.player.x < bullet[0] < self.game.player.x + self.game.player.width and
-                self.game.player.y < bullet[1] < self.game.player.y + self.game.player.height):
-                if not self.game.player.invulnerable:
-                    self.boss_bullets.remove(bullet)
-                    return True
+        if self.game.player.invulnerable:
+            return False
+        bullets = self.boss_bullets
+        n = bullets.count
+        x, y = bullets.x[:n], bullets.y[:n]
+        # Virus bullets never hit directly, they explode instead
+        hits = (bullets.kind[:n] == BOSS_BULLET) & \
+               (self.game.player.x < x) & (x < self.game.player.x + self.game.player.width) & \
+               (self.game.player.y < y) & (y < self.game.player.y + self.game.player.height)
+        if hits.any():
+            bullets.remove(int(np.argmax(hits)))
+            return True
         return False
+
+    def clear(self):
+        self.player_bullets.clear()
+        self.enemy_bullets.clear()
+        self.boss_bullets.clear()
     
+
+    def get_saved_state(self):
+        return {
+            'player_bullets': self.player_bullets.get_saved_state(),
+            'enemy_bullets': self.enemy_bullets.get_saved_state(),
+            'boss_bullets': self.boss_bullets.get_saved_state(),
+            # Power-ups change these, they are saved so a Laser or TripleShot carries on after loading
+            'player_bullet_height': self.player_bullet_height,
+            'player_bullet_speed': self.player_bullet_speed,
+            'player_shoot_interval': self.player_shoot_interval,
+            'triple_shot': self.triple_shot,
+            'last_shot_time': self.game.game_clock.now - self.last_shot_time,  # Seconds since the last shot
+        }
+
+    def restore_saved_state(self, state):
+        self.player_bullets.restore_saved_state(state['player_bullets'])
+        self.enemy_bullets.restore_saved_state(state['enemy_bullets'])
+        self.boss_bullets.restore_saved_state(state['boss_bullets'])
+        self.player_bullet_height = state['player_bullet_height']
+        self.player_bullet_speed = state['player_bullet_speed']
+        self.player_shoot_interval = state['player_shoot_interval']
+        self.triple_shot = state['triple_shot']
+        self.last_shot_time = self.game.game_clock.now - state['last_shot_time']
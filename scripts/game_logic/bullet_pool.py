@@ -0,0 +1,136 @@
+import numpy as np
+
+# Bullet kinds stored in BulletPool.kind
+PLAYER_BULLET = 0
+ENEMY_BULLET = 1
+BOSS_BULLET = 2
+VIRUS_BULLET = 3
+
+class BulletPool:
+    """
+    Preallocated struct-of-arrays storage for bullets.
+
+    Live bullets are packed into the first `count` slots of every array, so a
+    whole pass (move, cull, collide) is a handful of NumPy operations on
+    `array[:count]` instead of a Python loop. Bullets are removed either right
+    away with an O(1) swap-remove, or by clearing their `alive` flag during a
+    pass and calling `compact()` once at the end of it.
+    """
+    def __init__(self, capacity=256, extra_fields=()):
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.dx = np.zeros(capacity)
+        self.dy = np.zeros(capacity)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        # Per-kind data (e.g. player bullet length, virus explosion distance)
+        self.extra_fields = tuple(extra_fields)
+        for name in self.extra_fields:
+            setattr(self, name, np.zeros(capacity))
+
+    def columns(self):
+        return [self.x, self.y, self.dx, self.dy, self.kind, self.alive] + \
+               [getattr(self, name) for name in self.extra_fields]
+
+    def __len__(self):
+        return self.count
+
+    def add(self, x, y, dx, dy, kind, **extra):
+        if self.count == self.capacity:
+            self.grow()
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.dx[i] = dx
+        self.dy[i] = dy
+        self.kind[i] = kind
+        self.alive[i] = True
+        for name in self.extra_fields:
+            getattr(self, name)[i] = extra.get(name, 0.0)
+        self.count += 1
+        return i
+
+    def grow(self):
+        # Double the capacity; only happens when a wave outgrows the preallocation
+        self.capacity *= 2
+        for name in ("x", "y", "dx", "dy", "kind", "alive") + self.extra_fields:
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def remove(self, i):
+        """Remove bullet i by moving the last live bullet into its slot."""
+        last = self.count - 1
+        if i != last:
+            for column in self.columns():
+                column[i] = column[last]
+        self.alive[last] = False
+        self.count = last
+
+    def kill(self, indices):
+        # Mark bullets for removal, they are dropped by the next compact()
+        self.alive[indices] = False
+
+    def compact(self):
+        """Pack the bullets that are still alive into the front of the arrays."""
+        n = self.count
+        keep = self.alive[:n].copy()
+        if keep.all():
+            return
+        kept = int(np.count_nonzero(keep))
+        for column in self.columns():
+            column[:kept] = column[:n][keep]
+        self.alive[kept:n] = False
+        self.count = kept
+
+    def clear(self):
+        self.alive[:self.count] = False
+        self.count = 0
+
+    def integrate(self, speed=1):
+        # dx/dy are scaled by `speed`, for pools that store a direction instead of a velocity
+        n = self.count
+        if speed == 1:
+            self.x[:n] += self.dx[:n]
+            self.y[:n] += self.dy[:n]
+        else:
+            self.x[:n] += self.dx[:n] * speed
+            self.y[:n] += self.dy[:n] * speed
+
+    def cull(self, left, top, right, bottom, offset_x=0, offset_y=0, mask=None):
+        '''
+        Kill every bullet whose (x + offset_x, y + offset_y) point has left the
+        given bounds. `mask` limits the test to a subset, e.g. one kind.
+        '''
+        n = self.count
+        px = self.x[:n] + offset_x
+        py = self.y[:n] + offset_y
+        outside = (px < left) | (px > right) | (py < top) | (py > bottom)
+        if mask is not None:
+            outside &= mask
+        self.alive[:n] &= ~outside
+
+    def get_saved_state(self):
+        # Copies of the live part of every column
+        return {name: column[:self.count].copy()
+                for name, column in zip(("x", "y", "dx", "dy", "kind") + self.extra_fields,
+                                        [self.x, self.y, self.dx, self.dy, self.kind] +
+                                        [getattr(self, name) for name in self.extra_fields])}
+
+    def restore_saved_state(self, state):
+        self.clear()
+        count = len(state["x"])
+        while self.capacity < count:
+            self.grow()
+        for name in ("x", "y", "dx", "dy", "kind") + self.extra_fields:
+            getattr(self, name)[:count] = state[name]
+        self.alive[:count] = True
+        self.count = count
+
+    def rows(self, *names):
+        # Plain Python tuples of the requested columns, used for saving
+        n = self.count
+        return list(zip(*(getattr(self, name)[:n].tolist() for name in names)))
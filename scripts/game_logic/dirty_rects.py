@@ -0,0 +1,65 @@
+import pygame
+
+class DirtyRectTracker:
+    """
+    Remembers which screen regions the game drew into, frame to frame.
+
+    Instead of clearing the whole screen and pushing every pixel to the
+    display, only the regions covered last frame are erased, and only the
+    regions covered last frame or this frame are sent to display.update().
+    When those regions add up to more than `full_update_ratio` of the screen,
+    a plain full-screen update is cheaper and is used instead.
+    """
+    def __init__(self, screen_size, full_update_ratio=0.4):
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self.full_update_ratio = full_update_ratio
+        self.previous = []
+        self.current = []
+        self.full_redraw = True  # The first frame always repaints everything
+        self.full_updates = 0
+        self.partial_updates = 0
+
+    def invalidate(self):
+        # Something else (a menu, a question screen) drew over the game; repaint everything next frame
+        self.full_redraw = True
+
+    def erase(self, screen, color):
+        """Clear what was drawn last frame (or the whole screen after an invalidate)."""
+        if self.full_redraw:
+            screen.fill(color)
+        else:
+            for rect in self.previous:
+                screen.fill(color, rect)
+
+    def add(self, rects):
+        # Accepts a single rect or any iterable of rects
+        if isinstance(rects, pygame.Rect):
+            self.current.append(rects)
+        elif rects:
+            self.current.extend(rects)
+
+    def finish_frame(self):
+        '''
+        Return the rects to pass to display.update(), or None when the whole
+        screen should be updated.
+        '''
+        changed = [rect.clip(self.screen_rect) for rect in self.previous + self.current]
+        changed = [rect for rect in changed if rect.width and rect.height]
+        self.previous = self.current
+        self.current = []
+
+        dirty_area = sum(rect.width * rect.height for rect in changed)
+        screen_area = self.screen_rect.width * self.screen_rect.height
+        if self.full_redraw or dirty_area > screen_area * self.full_update_ratio:
+            self.full_redraw = False
+            self.full_updates += 1
+            return None
+        self.partial_updates += 1
+        return changed
+
+    def present(self):
+        rects = self.finish_frame()
+        if rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
@@ -1,37 +1,111 @@
 import pygame
-import random
-import os
+import numpy as np
+from scripts.game_logic.animation import BakedAnimation
 
 class EnemyManager:
+    '''
+    The enemy wave is a fixed formation of rows x cols slots. Which enemies are
+    still alive is kept in a boolean mask and the whole formation moves by
+    changing a single offset, so moving the wave and checking the screen edges
+    costs the same no matter how many enemies are in it.
+    '''
     def __init__(self, game):
-        self.enemies = []
-        self.enemy_image = self.load_and_scale_image("enemy.png", (40, 40))
-        self.enemy_speed = 2
-        self.shoot_prob = 0.003
-        self.direction = 1
+        self.enemy_image = game.assets.sprite("enemy.png", (40, 40))
+        self.enemy_width, self.enemy_height = self.enemy_image.get_size()
+        # Enemies flip back and forth, neighbouring columns out of step; killed ones flash briefly
+        self.animation = BakedAnimation(self.enemy_image, 0.5)
+        self.death_flash_duration = 0.1
+        self.dying = []  # (row, col, time of death)
         self.game = game
+        self.reset_difficulty()
+        # Formation layout, new waves are wave_rows x wave_cols
+        self.wave_rows = 5
+        self.wave_cols = 10
+        self.spacing_x = self.enemy_width + 10
+        self.spacing_y = self.enemy_height + 10
+        self.start_x = 50
+        self.start_y = 50
         self.create_enemies()
 
-    def load_and_scale_image(self, filename, size):
-        try:
-            return pygame.transform.scale(pygame.image.load(os.path.join("assets", "sprites", filename)).convert_alpha(), size)
-        except pygame.error as e:
-            print(f"Error loading or scaling image '{filename}': {e}")
-            pygame.quit()
-            quit()
-
-    def create_enemies(self):
-        self.enemies = []
-        for row in range(5):
-            for col in range(10):
-                enemy_x = col * (self.enemy_image.get_width() + 10) + 50
-                enemy_y = row * (self.enemy_image.get_height() + 10) + 50
-                self.enemies.append([enemy_x, enemy_y])
+    def create_enemies(self, alive=None):
+        if alive is None:
+            alive = np.ones((self.wave_rows, self.wave_cols), dtype=bool)
+        self.alive = np.array(alive, dtype=bool)
+        self.rows, self.cols = self.alive.shape
+        # Top-left corner of slot (0, 0)
+        self.offset_x = self.start_x
+        self.offset_y = self.start_y
+        self.dying = []
+        self.update_counts()
+
+    def update_counts(self):
+        # Per-row and per-column alive counts let the bounding box shrink without rescanning the mask
+        self.alive_count = int(np.count_nonzero(self.alive))
+        self.row_counts = np.count_nonzero(self.alive, axis=1)
+        self.col_counts = np.count_nonzero(self.alive, axis=0)
+        alive_rows = np.flatnonzero(self.row_counts)
+        alive_cols = np.flatnonzero(self.col_counts)
+        if self.alive_count:
+            self.min_row, self.max_row = int(alive_rows[0]), int(alive_rows[-1])
+            self.min_col, self.max_col = int(alive_cols[0]), int(alive_cols[-1])
+        else:
+            self.min_row = self.max_row = self.min_col = self.max_col = 0
+
+    def clear(self):
+        self.alive[:] = False
+        self.dying = []
+        self.update_counts()
+
+    def kill(self, row, col):
+        if not self.alive[row, col]:
+            return
+        self.alive[row, col] = False
+        self.dying.append((row, col, self.game.game_clock.now))
+        self.alive_count -= 1
+        self.row_counts[row] -= 1
+        self.col_counts[col] -= 1
+        if not self.alive_count:
+            return
+        # Shrink the bounding box if this enemy was on its edge
+        while not self.col_counts[self.min_col]:
+            self.min_col += 1
+        while not self.col_counts[self.max_col]:
+            self.max_col -= 1
+        while not self.row_counts[self.min_row]:
+            self.min_row += 1
+        while not self.row_counts[self.max_row]:
+            self.max_row -= 1
+
+    def bounding_box(self):
+        left = self.offset_x + self.min_col * self.spacing_x
+        top = self.offset_y + self.min_row * self.spacing_y
+        right = self.offset_x + self.max_col * self.spacing_x + self.enemy_width
+        bottom = self.offset_y + self.max_row * self.spacing_y + self.enemy_height
+        return left, top, right, bottom
+
+    def enemy_at(self, xs, ys):
+        '''
+        Map points straight to formation slots.
+        Returns the row and column of every point and a mask of the points that
+        are strictly inside a living enemy (the gaps between enemies are empty).
+        '''
+        local_x = np.asarray(xs) - self.offset_x
+        local_y = np.asarray(ys) - self.offset_y
+        cols = np.floor_divide(local_x, self.spacing_x).astype(int)
+        rows = np.floor_divide(local_y, self.spacing_y).astype(int)
+        cell_x = local_x - cols * self.spacing_x
+        cell_y = local_y - rows * self.spacing_y
+        inside = (cols >= 0) & (cols < self.cols) & (rows >= 0) & (rows < self.rows) & \
+                 (cell_x > 0) & (cell_x < self.enemy_width) & (cell_y > 0) & (cell_y < self.enemy_height)
+        rows = np.clip(rows, 0, self.rows - 1)
+        cols = np.clip(cols, 0, self.cols - 1)
+        inside &= self.alive[rows, cols]
+        return rows, cols, inside
 
     def update(self):
-        if not self.enemies:
-            if self.game.paused:  
-                return  
+        if not self.alive_count:
+            if self.game.paused:
+                return
 
             if self.game.level < self.game.total_levels:
                 self.game.level += 1
@@ -40,33 +114,92 @@ class EnemyManager:
                 self.increase_difficulty()
                 self.game.clear_level()
                 self.create_enemies()
+                self.game.autosave.save()  # Level transitions are autosaved, written in the background
             else:
                 self.game.boss_fight_splash_screen()
                 self.game.boss_fight = True
+                self.game.autosave.save()
+                return
 
-        edge_reached = False
-        for enemy in self.enemies:
-            enemy[0] += self.enemy_speed * self.direction
-            if enemy[0] <= 0 or enemy[0] + 40 >= self.game.screen_width:
-                edge_reached = True
+        # Move the whole formation at once
+        self.offset_x += self.enemy_speed * self.direction
+        left, top, right, bottom = self.bounding_box()
+        edge_reached = left <= 0 or right >= self.game.screen_width
 
-            if random.random() < self.shoot_prob:
-                self.game.bullet_manager.add_enemy_bullet(enemy[0] + 20, enemy[1] + 40)
+        # Each enemy fires with shoot_prob, so the number of shots this frame is binomial
+        rng = self.game.rng.enemies
+        shots = rng.binomial(self.alive_count, self.shoot_prob)
+        if shots:
+            rows, cols = np.nonzero(self.alive)
+            for i in rng.choice(len(rows), size=shots, replace=False):
+                enemy_x = self.offset_x + cols[i] * self.spacing_x
+                enemy_y = self.offset_y + rows[i] * self.spacing_y
+                self.game.bullet_manager.add_enemy_bullet(enemy_x + 20, enemy_y + 40)
 
-            if enemy[1] + 40 >= self.game.screen_height:
-                self.game.game_over = True
-                self.game.game_over_screen()
+        if bottom >= self.game.screen_height:
+            self.game.game_over = True
+            self.game.game_over_screen()
 
         if edge_reached:
-            for enemy in self.enemies:
-                enemy[1] += 20
+            self.offset_y += 20
             self.direction *= -1
 
     def draw(self):
-        for enemy in self.enemies:
-            self.game.screen.blit(self.enemy_image, (enemy[0], enemy[1]))
+        now = self.game.game_clock.now
+        frames = self.animation.variants["normal"]
+        frame = self.animation.frame_index(now)
+        rows, cols = np.nonzero(self.alive)
+        xs = (self.offset_x + cols * self.spacing_x).tolist()
+        ys = (self.offset_y + rows * self.spacing_y).tolist()
+        self.game.screen.blits([(frames[(frame + col) % 2], (x, y)) for col, x, y in zip(cols.tolist(), xs, ys)], False)
+
+        # Enemies killed a moment ago still flash in their slot
+        self.dying = [death for death in self.dying if now - death[2] < self.death_flash_duration]
+        flash = self.animation.frame("hit", frame)
+        rects = [self.game.screen.blit(flash, (self.offset_x + col * self.spacing_x, self.offset_y + row * self.spacing_y))
+                 for row, col, _ in self.dying]
+
+        if self.alive_count:
+            # The formation's bounding box covers every living enemy
+            left, top, right, bottom = self.bounding_box()
+            rects.append(pygame.Rect(left, top, right - left, bottom - top))
+        return rects
+
+    def reset_difficulty(self):
+        self.enemy_speed = 2
+        self.shoot_prob = 0.003
+        self.direction = 1
 
     def increase_difficulty(self):
         self.enemy_speed += 0.5
         self.shoot_prob += 0.001
 
+    def get_saved_state(self):
+        return {
+            'alive': self.alive.copy(),
+            'offset': [self.offset_x, self.offset_y],
+            'direction': self.direction,
+            'enemy_speed': self.enemy_speed,
+            'shoot_prob': self.shoot_prob,
+        }
+
+    def restore_saved_state(self, state):
+        self.create_enemies(state['alive'])
+        self.offset_x, self.offset_y = state['offset']
+        self.direction = state['direction']
+        self.enemy_speed = state['enemy_speed']
+        self.shoot_prob = state['shoot_prob']
+
+    def restore_enemy_positions(self, positions):
+        # saves.json stored a list of [x, y] per enemy; lay them back onto the formation grid
+        if not positions:
+            self.clear()
+            return
+        min_x = min(p[0] for p in positions)
+        min_y = min(p[1] for p in positions)
+        cells = [(round((y - min_y) / self.spacing_y), round((x - min_x) / self.spacing_x)) for x, y in positions]
+        alive = np.zeros((max(r for r, _ in cells) + 1, max(c for _, c in cells) + 1), dtype=bool)
+        for row, col in cells:
+            alive[row, col] = True
+        self.create_enemies(alive)
+        self.offset_x, self.offset_y = min_x, min_y
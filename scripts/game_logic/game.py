@@ -1,11 +1,9 @@
 import pygame
 import platform
-import random
 import time
 import os
-import json
 import math
-import requests
+import sqlite3
 import datetime
 from threading import Thread
 from requests.auth import HTTPBasicAuth
@@ -16,17 +14,58 @@ from scripts.game_logic.bullet_manager import BulletManager
 from scripts.game_logic.powerup_manager import PowerUpManager
 from scripts.game_logic.minigame import HackingMiniGame
 from scripts.game_logic.barricade_manager import BarricadeManager
-
-def get_asset_path(*path_parts):
-    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", *path_parts))
+from scripts.game_logic.game_clock import GameClock
+from scripts.game_logic.text_cache import TextCache
+from scripts.game_logic.dirty_rects import DirtyRectTracker
+from scripts.game_logic.asset_manager import AssetManager, get_asset_path
+from scripts.game_logic.replay import Replay, RngStreams
+from scripts.game_logic.perf_overlay import PerfOverlay
+from scripts.game_logic.save_store import SaveStore
+from scripts.game_logic.autosave import Autosave
+from scripts.game_logic.question_bank import QuestionBank, question_id
+from scripts.game_logic.question_layout import QuestionLayoutCache
+from scripts.game_logic.leaderboard_client import LeaderboardClient
+from scripts.game_logic.score_queue import ScoreQueue
+from scripts.game_logic.seven_segment import SevenSegmentDisplay, RPiGPIO
+
+# Leaderboard server, by default the local one from scripts/leaderboard_server.py
+LEADERBOARD_URL = os.environ.get("LEADERBOARD_URL", "http://127.0.0.1:8000")
+
+def leaderboard_auth():
+    user = os.environ.get("LEADERBOARD_USER")
+    return HTTPBasicAuth(user, os.environ.get("LEADERBOARD_PASSWORD", "")) if user else None
+
+def enable_headless_drivers():
+    """Point SDL at its dummy video and audio drivers so no window or sound device is opened."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, dirty_rendering=None, replay_dir=None, perf_overlay=False):
         self.is_raspberry_pi = platform.system() == "Linux" and "arm" in platform.machine().lower()
+        # Headless mode runs the simulation with no window, no audio and no frame cap
+        self.headless = headless
+        if self.headless:
+            enable_headless_drivers()
+            if pygame.display.get_init() and pygame.display.get_driver() != "dummy":
+                pygame.display.quit()
+                pygame.display.init()
         self.screen_width = 1200
         self.screen_height = 600
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
         self.clock = pygame.time.Clock()
+        # Dirty-rect rendering only repaints what changed, which matters most on the Pi
+        self.dirty_rendering = self.is_raspberry_pi if dirty_rendering is None else dirty_rendering
+        self.dirty_rects = DirtyRectTracker((self.screen_width, self.screen_height))
+        # Per-stage frame timings, F3 shows or hides them
+        self.perf = PerfOverlay(self)
+        self.perf.enabled = perf_overlay
+        # Fixed-step game time shared by every manager (pausing it freezes all timers)
+        self.game_clock = GameClock()
+        # Seeded random streams per subsystem; with replay_dir set every new game is recorded there
+        self.rng = RngStreams()
+        self.replay_dir = replay_dir
+        self.replay = None
         self.game_over = False
         self.level = 1
         self.total_levels = 4
@@ -42,12 +81,20 @@ class Game:
         self.score = 5000
         self.power_ups = PowerUpManager(self)
         self.paused = False
-        self.save_slots = [None, None, None]  
+        self.save_store = SaveStore()
+        self.save_slots = self.save_store.slots  # What the slot menus show, see SaveStore.summary
+        # Simulated sessions leave no autosave behind
+        self.autosave = Autosave(self, self.save_store, enabled=not headless)
+        self.leaderboard = LeaderboardClient(LEADERBOARD_URL, leaderboard_auth())
+        self.score_queue = ScoreQueue(self.leaderboard, os.path.join(self.save_store.folder, "score_queue.sqlite"))
+        if not headless:
+            self.score_queue.start()  # Upload whatever earlier sessions could not send
         self.selected_save_slot = 0
         self.loaded_from_menu = False
         self.save_name_input = ""
         self.current_music = None 
-        self.load_saves_from_file()  
+        if not headless:
+            self.load_saves_from_file()  # Simulated sessions never read (or migrate) the saves folder
         self.init_gpio()
         self.cheat_codes = {
             "D4A52B11": "invincible",
@@ -60,12 +107,6 @@ class Game:
         
         
         if self.is_raspberry_pi:
-            self.display_score_front = 5000 
-            self.display_score_back = 5000   
-            self.display_update_flag = False
-            self.display_lock = threading.Lock()
-            self.start_display_thread()
-            
             def init_rfid(self):
                 from mfrc522 import SimpleMFRC522
                 self.reader = SimpleMFRC522()
@@ -99,14 +140,20 @@ class Game:
         self.BLUE = (0, 0, 128)
         self.LIGHTBLUE = (60, 60 , 255)
 
+        # Every image and sound is loaded once through here and shared
+        self.assets = AssetManager(headless)
+
         #Title
-        self.title_image = pygame.image.load("assets/fonts/Title.png")
+        self.title_image = self.assets.image("fonts", "Title.png")
 
         # Fonts
         self.font = pygame.font.Font("assets/fonts/TextFont.ttf", 18)
         self.big_font = pygame.font.Font("assets/fonts/TextFont.ttf", 23)
         self.bold_font = pygame.font.Font("assets/fonts/TextFont.ttf", 40)
         self.title_font = pygame.font.Font("assets/fonts/TextFont.ttf", 30)  
+        # Rendered text is cached, most strings on screen never change between frames
+        self.text_cache = TextCache()
+        self.question_layouts = QuestionLayoutCache(self)
 
         '''
         Checkpoint 1: Initializing game components
@@ -117,8 +164,8 @@ class Game:
         self.bullet_manager = BulletManager(self)
         self.power_ups = PowerUpManager(self)
         
-        # Cybersecurity questions
-        self.cybersecurity_questions = self.load_cybersecurity_questions()
+        # Cybersecurity questions, read from an indexed copy of the JSON one at a time
+        self.question_bank = QuestionBank(get_asset_path("assets", "cybersecurity_questions.json"))
         #     [{"question": "What does 'HTTPS' stand for?",
         #      "options": ["A) Hypertext Transfer Protocol Standard", "B) Hypertext Transfer Protocol Secure", "C) High Transfer Protocol Secure"],
         #      "answer": "B"},
@@ -147,84 +194,14 @@ class Game:
         
         self.load_menu_background()
         
-        if self.is_raspberry_pi:
-            self.start_display_thread()
+        if self.segment_display is not None:
+            self.segment_display.start()  # Refreshes the score display from its own thread
 
     def init_gpio(self):
-        if self.is_raspberry_pi:
-            import RPi.GPIO as GPIO, threading
-            from threading import Event
-            GPIO.setwarnings(False)
-            GPIO.setmode(GPIO.BCM)
-    
-            GREEN_LED_PIN = 20
-            RED_LED_PIN = 21
-    
-
-            # Define the GPIO pins connected to segments and digits
-            D4 = 16
-            D3 = 25
-            D2 = 26
-            D1 = 5
-
-            SEGMENT_A = 4
-            SEGMENT_F = 17
-            SEGMENT_B = 18
-            SEGMENT_E = 22
-            SEGMENT_D = 23
-            SEGMENT_C = 24
-            SEGMENT_G = 27 
-
-            GPIO.setmode(GPIO.BCM)  
-            pins = [SEGMENT_A, SEGMENT_F, SEGMENT_B, SEGMENT_E, SEGMENT_D, SEGMENT_C, SEGMENT_G, D1, D2, D3, D4, GREEN_LED_PIN, RED_LED_PIN]
-            GPIO.setup(pins, GPIO.OUT, initial=GPIO.LOW)
-
-            # Digit to segment mapping (0-9)
-            digit_to_segments = {
-                '0': [0,0,0,0,0,0,1],
-                '1': [1,0,0,1,1,1,1],  
-                '2': [0,0,1,0,0,1,0],
-                '3': [0,0,0,0,1,1,0],
-                '4': [1,0,0,1,1,0,0],  
-                '5': [0,1,0,0,1,0,0],  
-                '6': [0,1,0,0,0,0,0],
-                '7': [0,0,0,1,1,1,1],
-                '8': [0,0,0,0,0,0,0],
-                '9': [0,0,0,0,1,0,0]
-            }
-
-            # Function to display a 4-digit number on the 7-segment display
-            def display_number_on_7seg(number):
-                digits = str(number).zfill(4)  
-                start_time = time.perf_counter()
-                for i, digit in enumerate(digits):
-            
-                    digit_pins = [D1, D2, D3, D4]
-                    GPIO.output(digit_pins[i], GPIO.HIGH) 
-            
-                    # Turn on/off the segments based on the digit
-                    segments = digit_to_segments[digit]
-                    GPIO.output(SEGMENT_A, GPIO.HIGH if segments[0] == 1 else GPIO.LOW)
-                    GPIO.output(SEGMENT_B, GPIO.HIGH if segments[1] == 1 else GPIO.LOW)
-                    GPIO.output(SEGMENT_C, GPIO.HIGH if segments[2] == 1 else GPIO.LOW)
-                    GPIO.output(SEGMENT_D, GPIO.HIGH if segments[3] == 1 else GPIO.LOW)
-                    GPIO.output(SEGMENT_E, GPIO.HIGH if segments[4] == 1 else GPIO.LOW)
-                    GPIO.output(SEGMENT_F, GPIO.HIGH if segments[5] == 1 else GPIO.LOW)
-                    GPIO.output(SEGMENT_G, GPIO.HIGH if segments[6] == 1 else GPIO.LOW)
-            
-                    for j in range(4):
-                        if j != i:
-                            GPIO.output(digit_pins[j], GPIO.LOW)
-            
-                    while time.perf_counter() - start_time < 0.001 * (i + 1):
-                        pass
-
-                # Turn off all digits after displaying
-                GPIO.output(D1, GPIO.LOW)
-                GPIO.output(D2, GPIO.LOW)
-                GPIO.output(D3, GPIO.LOW)
-                GPIO.output(D4, GPIO.LOW)
-
+        # Score display and answer LEDs, see seven_segment.py for the wiring
+        self.segment_display = None
+        if self.is_raspberry_pi and not self.headless:
+            self.segment_display = SevenSegmentDisplay(RPiGPIO())
         else:
             print("Not running on RPi, GPIO functionality disabled.")
   
@@ -242,13 +219,15 @@ class Game:
             if not os.path.exists(music_file):
                 print(f"Warning: Music file missing -> {music_file}")
 
-        # Sound Effect Paths
-        self.shoot_sound = pygame.mixer.Sound(get_asset_path("assets", "sounds", "shoot.wav"))
-        self.hit_sound = pygame.mixer.Sound(get_asset_path("assets", "sounds", "hit.wav"))
-        self.correct_answer_sound = pygame.mixer.Sound(get_asset_path("assets", "sounds", "correct.wav"))
-        self.wrong_answer_sound = pygame.mixer.Sound(get_asset_path("assets", "sounds", "wrong.wav"))
-        self.level_up_sound = pygame.mixer.Sound(get_asset_path("assets", "sounds", "level_up.wav"))
-        self.power_up_sound = pygame.mixer.Sound(get_asset_path("assets", "sounds", "power_up.wav"))
+        # Sound effects (silent stand-ins when headless)
+        self.shoot_sound = self.assets.sound("shoot.wav")
+        self.hit_sound = self.assets.sound("hit.wav")
+        self.correct_answer_sound = self.assets.sound("correct.wav")
+        self.wrong_answer_sound = self.assets.sound("wrong.wav")
+        self.level_up_sound = self.assets.sound("level_up.wav")
+        self.power_up_sound = self.assets.sound("power_up.wav")
+        if self.headless:
+            return
 
 
         #Set volume 
@@ -257,22 +236,18 @@ class Game:
     def load_menu_background(self):
         # Load animated menu backgrounds
         self.menu_backgrounds = [
-            pygame.image.load("assets/backgrounds/menu_background1.png"),
-            pygame.image.load("assets/backgrounds/menu_background2.png"),
-            pygame.image.load("assets/backgrounds/menu_background3.png")
+            self.assets.image("backgrounds", "menu_background1.png", alpha=False),
+            self.assets.image("backgrounds", "menu_background2.png", alpha=False),
+            self.assets.image("backgrounds", "menu_background3.png", alpha=False)
         ]
         self.menu_background_index = 0 
         self.last_bg_update = time.time()  
         self.bg_animation_interval = 1  
 
-    def start_display_thread(self):
-        self.display_running = True 
-        self.display_thread = threading.Thread(target=self.update_7seg_display)
-        self.display_thread.daemon = True
-        self.display_thread.start()
-    
     def change_music(self, new_track):
         """Stops current music and plays a new track safely."""
+        if self.headless:
+            return
         if not os.path.exists(new_track):  
             print(f"Music file not found: {new_track}")  # Debugging info
             return  
@@ -283,155 +258,175 @@ class Game:
             pygame.mixer.music.play(-1)  
             self.current_music = new_track  
 
-    def update_7seg_display(self):
-        digit_pins = [D1, D2, D3, D4]
-        try:
-            while self.display_running:
-                with self.display_lock:
-                    current_score = self.display_score_front
-                digits = f"{current_score:04d}"
-            
-                for i in range(4):
-                    GPIO.output(digit_pins[i], GPIO.HIGH)
-                    segments = digit_to_segments[digits[i]]
-                    # Set each segment
-                    GPIO.output(SEGMENT_A, GPIO.HIGH if segments[0] else GPIO.LOW)
-                    GPIO.output(SEGMENT_B, GPIO.HIGH if segments[1] else GPIO.LOW)
-                    GPIO.output(SEGMENT_C, GPIO.HIGH if segments[2] else GPIO.LOW)
-                    GPIO.output(SEGMENT_D, GPIO.HIGH if segments[3] else GPIO.LOW)
-                    GPIO.output(SEGMENT_E, GPIO.HIGH if segments[4] else GPIO.LOW)
-                    GPIO.output(SEGMENT_F, GPIO.HIGH if segments[5] else GPIO.LOW)
-                    GPIO.output(SEGMENT_G, GPIO.HIGH if segments[6] else GPIO.LOW)
-                    # Hold the digit for a short time
-                    time.sleep(0.001)
-                    GPIO.output(digit_pins[i], GPIO.LOW)
-        except KeyboardInterrupt:
-            self.display_running = False
-            GPIO.cleanup()
-
-    def display_changed_segments(self, number):
-        # Only update what has changed
-        new_digits = str(number).zfill(4)
-        for i, digit in enumerate(new_digits):
-            if digit != str(self.display_score).zfill(4)[i]:
-                self.changed_segments.add(i)
-        for i in self.changed_segments:
-            self.display_digit(i, new_digits[i])
-        self.changed_segments.clear()
-        
-    def display_digit(self, position, digit):
-        digit_pins = [D1, D2, D3, D4]
-        GPIO.output(digit_pins[position], GPIO.HIGH) 
-        segments = digit_to_segments[digit]
-        for j, segment in enumerate([SEGMENT_A, SEGMENT_B, SEGMENT_C, SEGMENT_D, SEGMENT_E, SEGMENT_F, SEGMENT_G]):
-            GPIO.output(segment, GPIO.HIGH if segments[j] == 1 else GPIO.LOW)
-        for j in range(4):
-            if j != position:
-                GPIO.output(digit_pins[j], GPIO.LOW)
-
-    def adjust_score(self, points):
-        with self.display_lock:  
-            self.score = max(0, self.score + points)
-            self.display_score_back = self.score
-            self.display_update_flag = True
-            
     def __del__(self):
-        if self.is_raspberry_pi:
-            self.display_running = False
-            self.display_thread.join()
-            GPIO.cleanup()
+        if getattr(self, "segment_display", None) is not None:
+            self.segment_display.cleanup()
 
     '''
     Checkpoint 4: main game loop
     '''
-    def main_game_loop(self):
+    def reset_loop_state(self):
+        # Bookkeeping update_frame relies on, set up fresh for every session
+        self.start_time = self.game_clock.now
+        self.minigame_completed = False
+        self.last_score_update_time = self.start_time
+        self.score_paused = False
+        self.frame_count = 0
+
+    def main_game_loop(self, max_frames=None):
         self.change_music(self.level_music)  # Start level music
-        self.start_time = time.time()
-        minigamecompleted = False
-        last_score_update_time = self.start_time
-        score_paused = False
+        self.reset_loop_state()
+        self.autosave.reset()
+        self.game_clock.resync()
+        self.dirty_rects.invalidate()
         while not self.game_over:
-            self.screen.fill(self.BLACK)
+            if max_frames is not None and self.frame_count >= max_frames:
+                break
+            self.perf.begin_frame()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    self.finish_replay()  # Keep the recording of a session that was closed mid-game
+                    self.autosave.save()  # ...and the session itself, so it can be continued
+                    self.autosave.wait()
                     pygame.quit()
                     quit()
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         self.paused = not self.paused  
+                    elif event.key == pygame.K_F3:
+                        self.perf.toggle()
                 if event.type == pygame.USEREVENT + 1:
                     if hasattr(self, 'score_adjustment') and time.time() - self.score_adjustment_time >= 2:
                         del self.score_adjustment
-                if self.paused:
-                    self.power_ups.pause_powerups()
-                    self.draw_pause_menu() 
-                    continue
+            if self.paused and self.replay is not None and self.replay.playing:
+                self.paused = False  # The pause menu has no effect on the recorded session
+            if self.paused:
+                # Freezing the clock freezes every timer in the game at once
+                self.game_clock.pause()
+                self.draw_pause_menu()
+                self.game_clock.resume()
+                self.dirty_rects.invalidate()  # The pause menu drew over the whole screen
+                continue
 
             keys = pygame.key.get_pressed()
-            self.player.move(keys)
-            self.player.shoot(keys)
-            current_time = time.time()
-            elapsed_time = current_time - last_score_update_time
-            if not score_paused:
-                if elapsed_time >= 1:  
-                    self.score -= 25  # Deduct 25 points per second
-                    self.score = max(0, self.score)  # Ensure score doesn't go below 0
-                    last_score_update_time = current_time  
-            if keys[pygame.K_ESCAPE]:
-                self.paused = not self.paused
-            self.player.check_invulnerability()
+            self.perf.mark("input")
+            # Update phase: run as many fixed steps as real time calls for.
+            # Headless sessions have no real time to follow, so they take one step per frame
+            steps = 1 if self.headless else self.game_clock.tick()
+            for _ in range(steps):
+                replay = self.replay
+                step_keys = replay.keys_for_step(keys) if replay is not None else keys
+                self.game_clock.advance()
+                self.update_frame(step_keys)
+                if replay is not None:
+                    replay.after_step(self)
+                if self.game_over or (replay is not None and replay.finished):
+                    break
+            if self.replay is not None and self.replay.finished:
+                break
+            if not self.game_over:
+                self.autosave.update()  # Snapshot only, the disk write happens on the autosave thread
+            # Handle 7-segment display
+            if self.segment_display is not None:
+                self.segment_display.set_number(self.score)
+            self.frame_count += 1
+            if self.headless:
+                continue  # No rendering and no frame cap, run as fast as the CPU allows
+            # Draw phase: render the current state
+            self.draw_frame()
+            self.present_frame()
+            self.perf.mark("display")
+            self.perf.end_frame()
+            self.clock.tick(60)
+        self.finish_replay()
+
+    def update_frame(self, keys):
+        mark = self.perf.mark
+        self.player.move(keys)
+        self.player.shoot(keys)
+        current_time = self.game_clock.now
+        elapsed_time = current_time - self.last_score_update_time
+        if not self.score_paused:
+            if elapsed_time >= 1:  
+                self.score -= 25  # Deduct 25 points per second
+                self.score = max(0, self.score)  # Ensure score doesn't go below 0
+                self.last_score_update_time = current_time  
+        self.player.check_invulnerability()
+        mark("player")
+        if self.boss_fight:
+            self.change_music(self.boss_music)  # Start boss music
+            self.boss.update()
+            mark("boss")
+            if self.minigame_completed == False:
+                self.check_minigame_trigger()
             if self.boss_fight:
-                self.change_music(self.boss_music)  # Start boss music
-                self.boss.update()
-                if minigamecompleted == False:
-                    self.check_minigame_trigger()
-                if self.boss_fight:
-                    player_hit = self.bullet_manager.check_player_hit_by_boss_bullet()
-                else:
-                    player_hit = self.bullet_manager.check_player_hit()
-                if player_hit:
-                    score_paused = True
-                    if not self.ask_cybersecurity_question():
-                        self.player.lives -= 1
-                        self.adjust_score(-250)
-                        score_paused = False
-                        if self.player.lives == 0:
-                            self.game_over_screen()
-                    else:
-                        score_paused = False
-
+                player_hit = self.bullet_manager.check_player_hit_by_boss_bullet()
             else:
-                self.barricade_manager.update() 
-                self.barricade_manager.draw()
-                self.enemy_manager.update()
-                self.enemy_manager.draw()
                 player_hit = self.bullet_manager.check_player_hit()
-                self.power_ups.update()
-                if player_hit:
-                    score_paused = True
-                    self.hit_sound.play()
-                    if not self.ask_cybersecurity_question():
-                        self.player.lives -= 1
-                        self.adjust_score(-250)
-                        score_paused = False
-                        if self.player.lives == 0:
-                            self.game_over_screen()
-                            score_paused = False
-                    else:
-                        score_paused = False
-            self.player.draw()
-            self.bullet_manager.update_player_bullets()
-            self.bullet_manager.update_enemy_bullets()
-            self.bullet_manager.update_boss_bullets()
-            self.draw_ui()
-            # Handle 7-segment display
-            if self.is_raspberry_pi:
-                if self.score != self.display_score: 
-                    with self.lock:
-                        self.display_score = self.score
-                        self.display_update_event.set()
+            if player_hit:
+                self.score_paused = True
+                if not self.ask_cybersecurity_question():
+                    self.player.lives -= 1
+                    self.adjust_score(-250)
+                    self.score_paused = False
+                    if self.player.lives == 0:
+                        self.game_over_screen()
+                else:
+                    self.score_paused = False
+
+        else:
+            self.barricade_manager.update() 
+            mark("barricades")
+            self.enemy_manager.update()
+            mark("enemies")
+            player_hit = self.bullet_manager.check_player_hit()
+            self.power_ups.update()
+            if player_hit:
+                self.score_paused = True
+                self.hit_sound.play()
+                if not self.ask_cybersecurity_question():
+                    self.player.lives -= 1
+                    self.adjust_score(-250)
+                    self.score_paused = False
+                    if self.player.lives == 0:
+                        self.game_over_screen()
+                        self.score_paused = False
+                else:
+                    self.score_paused = False
+        mark("hits")
+        self.bullet_manager.update_player_bullets()
+        self.bullet_manager.update_enemy_bullets()
+        self.bullet_manager.update_boss_bullets()
+        mark("bullets")
+
+    def draw_frame(self):
+        if self.dirty_rendering:
+            self.dirty_rects.erase(self.screen, self.BLACK)  # Only clear what was drawn last frame
+        else:
+            self.screen.fill(self.BLACK)
+        drawn = []
+        if self.boss_fight:
+            drawn += self.boss.draw()
+        else:
+            drawn += self.barricade_manager.draw()
+            drawn += self.enemy_manager.draw()
+            drawn += self.power_ups.draw()
+        drawn.append(self.player.draw())
+        drawn += self.bullet_manager.draw()
+        self.perf.mark("draw")
+        drawn += self.draw_ui()
+        overlay_rect = self.perf.draw()
+        if overlay_rect:
+            drawn.append(overlay_rect)
+        self.perf.mark("draw_ui")
+        if self.dirty_rendering:
+            self.dirty_rects.add(drawn)
+
+    def present_frame(self):
+        if self.dirty_rendering:
+            self.dirty_rects.present()
+        else:
             pygame.display.update()
-            self.clock.tick(60)
 
     def check_minigame_trigger(self):
         if self.boss.health <= (self.boss.max_health // 2) and not self.boss.minigame_triggered:
@@ -462,13 +457,8 @@ class Game:
             # Draw player, enemies, bullets, and power-ups
             self.player.draw()
             self.enemy_manager.draw()
-            self.bullet_manager.update_player_bullets(draw_only=True)
-            self.bullet_manager.update_enemy_bullets(draw_only=True)
-            self.bullet_manager.update_boss_bullets(draw_only=True)
-
-             # Manually draw power-ups without updating them 
-            for power_up in self.power_ups.power_ups:
-                pygame.draw.circle(self.screen, self.BLUE, (int(power_up[0]), int(power_up[1])), 10)
+            self.bullet_manager.draw()
+            self.power_ups.draw()
         
             # Draw pause menu overlay
             menu_background = pygame.Surface((400, 300))
@@ -477,14 +467,14 @@ class Game:
             self.screen.blit(menu_background, (self.screen_width//2 - 200, 150))
         
             # Add PAUSED text
-            paused_text = self.bold_font.render("PAUSED", True, self.WHITE)
+            paused_text = self.text_cache.render(self.bold_font, "PAUSED", True, self.WHITE)
             self.screen.blit(paused_text, (self.screen_width//2 - paused_text.get_width()//2, 155))
         
             # Draw menu items
             for i, option in enumerate(menu_options):
                 y = 250 + i*60
                 color = self.GREEN if i == selected_option else self.WHITE
-                option_text = self.big_font.render(option, True, color)
+                option_text = self.text_cache.render(self.big_font, option, True, color)
                 self.screen.blit(option_text, (self.screen_width//2 - option_text.get_width()//2, y))
         
             pygame.display.flip()
@@ -502,11 +492,13 @@ class Game:
                     elif event.key == pygame.K_RETURN:
                         if menu_options[selected_option] == "Resume":
                             self.paused = False
-                            self.power_ups.resume_powerups()
                             return
                         elif menu_options[selected_option] == "Save Game":
                             self.show_save_slot_menu()
                         elif menu_options[selected_option] == "Return to Menu":
+                            self.finish_replay()
+                            self.autosave.save()  # "Continue" picks up from here
+                            self.autosave.wait()  # The menu looks for the file straight away
                             self.reset_game_state()
                             self.show_menu()
                     elif event.key == pygame.K_ESCAPE:
@@ -519,7 +511,7 @@ class Game:
     
         while True:
             self.screen.fill(self.BLACK)
-            title = self.big_font.render("Select Save Slot", True, self.YELLOW)
+            title = self.text_cache.render(self.big_font, "Select Save Slot", True, self.YELLOW)
             self.screen.blit(title, (self.screen_width//2 - title.get_width()//2, 50))
         
             slot_y = 150
@@ -534,7 +526,7 @@ class Game:
                 else:
                     info_text = "Empty Slot!"
             
-                text_surf = self.font.render(info_text, True, color)
+                text_surf = self.text_cache.render(self.font, info_text, True, color)
                 self.screen.blit(text_surf, (220, slot_y + 35))
                 slot_y += 120
 
@@ -557,7 +549,7 @@ class Game:
             pygame.display.flip()
 
     def delete_all_saves(self):
-        confirm_text = self.font.render("Confirm delete ALL saves? (Y/N)", True, self.RED)
+        confirm_text = self.text_cache.render(self.font, "Confirm delete ALL saves? (Y/N)", True, self.RED)
         self.screen.blit(confirm_text, (self.screen_width//2 - 150, 400))
         pygame.display.flip()
 
@@ -566,32 +558,31 @@ class Game:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_y:
                         try:
-                            self.save_slots = [None, None, None]
-                            with open('saves.json', 'w') as f:
-                                json.dump(self.save_slots, f)
+                            self.save_store.delete_all()
                             self.display_feedback("All saves deleted!", self.RED)
                             return
-                        except Exception as e:
+                        except OSError as e:
                             print(f"Error deleting saves: {e}")
                     elif event.key in [pygame.K_n, pygame.K_ESCAPE]:
                         return
 
     def draw_ui(self):
-        lives_text = self.font.render(f"Lives: {self.player.lives}", True, self.WHITE)
-        self.screen.blit(lives_text, (10, 10))
+        rects = []
+        lives_text = self.text_cache.render(self.font, f"Lives: {self.player.lives}", True, self.WHITE)
+        rects.append(self.screen.blit(lives_text, (10, 10)))
 
-        score_text = self.font.render(f"Score: {self.score}", True, self.WHITE)
-        self.screen.blit(score_text, (10, 40))
+        score_text = self.text_cache.render(self.font, f"Score: {self.score}", True, self.WHITE)
+        rects.append(self.screen.blit(score_text, (10, 40)))
 
-        level_text = self.font.render(f"Level: ", True, self.WHITE)
-        boss_text = self.font.render("BOSS" if self.boss_fight else str(self.level), True, self.RED if self.boss_fight else self.WHITE)
-        self.screen.blit(level_text, (self.screen_width - level_text.get_width() - boss_text.get_width() - 10, 10))
-        self.screen.blit(boss_text, (self.screen_width - boss_text.get_width() - 10, 10))
+        level_text = self.text_cache.render(self.font, f"Level: ", True, self.WHITE)
+        boss_text = self.text_cache.render(self.font, "BOSS" if self.boss_fight else str(self.level), True, self.RED if self.boss_fight else self.WHITE)
+        rects.append(self.screen.blit(level_text, (self.screen_width - level_text.get_width() - boss_text.get_width() - 10, 10)))
+        rects.append(self.screen.blit(boss_text, (self.screen_width - boss_text.get_width() - 10, 10)))
 
         # Draw power-up notification only if active
         if self.power_ups.power_up_active:
-            power_up_text = self.font.render("Power Up!", True, self.YELLOW)
-            self.screen.blit(power_up_text, (self.screen_width // 2 - power_up_text.get_width() // 2, 10))
+            power_up_text = self.text_cache.render(self.font, "Power Up!", True, self.YELLOW)
+            rects.append(self.screen.blit(power_up_text, (self.screen_width // 2 - power_up_text.get_width() // 2, 10)))
         
             # Display the name of the active power-up
             if self.power_ups.current_power_up == 'Laser':
@@ -604,12 +595,13 @@ class Game:
                 color = self.GREEN
             else:
                 color = self.WHITE  
-            power_up_name = self.font.render(self.power_ups.current_power_up.capitalize(), True, color)
-            self.screen.blit(power_up_name, (self.screen_width // 2 - power_up_name.get_width() // 2, 40))
+            power_up_name = self.text_cache.render(self.font, self.power_ups.current_power_up.capitalize(), True, color)
+            rects.append(self.screen.blit(power_up_name, (self.screen_width // 2 - power_up_name.get_width() // 2, 40)))
     
         if hasattr(self, 'score_adjustment'):
-            adjust_text = self.font.render(self.score_adjustment, True, self.RED if self.score_adjustment[0] == '-' else self.GREEN)
-            self.screen.blit(adjust_text, (score_text.get_width() + 20, 40))
+            adjust_text = self.text_cache.render(self.font, self.score_adjustment, True, self.RED if self.score_adjustment[0] == '-' else self.GREEN)
+            rects.append(self.screen.blit(adjust_text, (score_text.get_width() + 20, 40)))
+        return rects
 
     def adjust_score(self, points):
         self.score = max(0, self.score + points)  
@@ -622,107 +614,79 @@ class Game:
             pygame.time.set_timer(pygame.USEREVENT + 1, 2000)  
         
     def clear_bullets(self):
-        self.bullet_manager.player_bullets.clear()
-        self.bullet_manager.enemy_bullets.clear()
-        self.bullet_manager.boss_bullets.clear()
+        self.bullet_manager.clear()
 
     def ask_cybersecurity_question(self):
         # Ensure there are available questions
-        if self.questions_asked >= self.question_limit or not self.cybersecurity_questions:
+        if self.questions_asked >= self.question_limit or not len(self.question_bank):
             return False
 
         self.questions_asked += 1
-        available_questions = [q for q in self.cybersecurity_questions if q not in self.asked_questions]
-        if not available_questions:
+        self.dirty_rects.invalidate()
+        # Select a question this session has not asked yet
+        question_data = self.question_bank.draw(self.rng.questions)
+        if question_data is None:
             return False
+        self.asked_questions.append(question_data["id"])
 
-        # Select a question
-        question_data = random.choice(available_questions)
-        self.asked_questions.append(question_data)
-
-        question = question_data["question"]
         options = question_data["options"]
         correct_answer = question_data["answer"]
 
-        # Prepare to display the question
+        if self.replay is not None and self.replay.playing:
+            self.clear_bullets()
+            return self.replay.outcome("question")  # Answered the same way as in the recording
+        if self.headless:
+            # Nobody is at the keyboard, so the simulated player guesses an option
+            selected_answer = chr(pygame.K_a + self.rng.questions.randrange(len(options))).upper()
+            self.clear_bullets()
+            return self.record_outcome("question", selected_answer == correct_answer)
+
+        # Laid out and rendered once; afterwards only a change of selection touches the screen
+        layout = self.question_layouts.get(question_data)
         selected_index = 0
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    quit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        selected_answer = chr(pygame.K_a + selected_index).upper()
-                        if selected_answer == correct_answer:
-                            self.correct_answer_sound.play()
-                            self.display_feedback("Correct!", self.GREEN)
-                            self.clear_bullets()
-                            return True
-                        else:
-                            self.wrong_answer_sound.play()
-                            self.display_feedback("Incorrect!", self.RED)
-                            self.clear_bullets()
-                            return False
-                    elif event.key == pygame.K_UP:
-                        selected_index = (selected_index - 1) % len(options)
-                    elif event.key == pygame.K_DOWN:
-                        selected_index = (selected_index + 1) % len(options)
-
-            self.screen.fill(self.BLACK)
-
-            question_lines = self.wrap_text(question, self.big_font, self.screen_width - 40)
-            total_text_height = len(question_lines) * self.big_font.get_linesize()
-            question_y_start = self.screen_height // 3 - total_text_height // 2
-            for i, line in enumerate(question_lines):
-                question_text = self.big_font.render(line, True, self.WHITE)
-                self.screen.blit(question_text, (self.screen_width // 2 - question_text.get_width() // 2, question_y_start + i * self.big_font.get_linesize()))
-
-            options_y_start = self.screen_height // 2
-            for i, option in enumerate(options):
-                color = self.GREEN if i == selected_index else self.WHITE
-                option_text = self.font.render(option, True, color)
-                self.screen.blit(option_text, (self.screen_width // 2 - option_text.get_width() // 2, options_y_start + i * 40))
-
-            instruction_text = self.font.render("Use UP/DOWN to select, ENTER to confirm.", True, self.YELLOW)
-            self.screen.blit(instruction_text, (self.screen_width // 2 - instruction_text.get_width() // 2, self.screen_height - 50))
-
-            pygame.display.flip()
-
-    def wrap_text(self, text, font, max_width):
-        words = text.split(' ')
-        lines = []
-        current_line = ''
-        for word in words:
-            test_line = current_line + word + ' '
-            if font.size(test_line)[0] <= max_width:
-                current_line = test_line
-            else:
-                lines.append(current_line.strip())
-                current_line = word + ' '
-        lines.append(current_line.strip())
-        return lines
+        pygame.display.update(layout.draw(selected_index))
+        while True:
+            event = pygame.event.wait()  # Sleep until there is input instead of redrawing flat out
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                quit()
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                pygame.display.update(layout.draw(selected_index))
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN:
+                    selected_answer = chr(pygame.K_a + selected_index).upper()
+                    if selected_answer == correct_answer:
+                        self.correct_answer_sound.play()
+                        self.display_feedback("Correct!", self.GREEN)
+                        self.clear_bullets()
+                        return self.record_outcome("question", True)
+                    else:
+                        self.wrong_answer_sound.play()
+                        self.display_feedback("Incorrect!", self.RED)
+                        self.clear_bullets()
+                        return self.record_outcome("question", False)
+                elif event.key in (pygame.K_UP, pygame.K_DOWN):
+                    step = -1 if event.key == pygame.K_UP else 1
+                    new_index = (selected_index + step) % len(options)
+                    pygame.display.update(layout.change_selection(selected_index, new_index))
+                    selected_index = new_index
 
     def display_feedback(self, message, color):
+        if self.headless:
+            return
+        self.dirty_rects.invalidate()
         self.screen.fill(self.BLACK)
-        feedback_text = self.bold_font.render(message, True, color)
+        feedback_text = self.text_cache.render(self.bold_font, message, True, color)
         self.screen.blit(feedback_text, (self.screen_width // 2 - feedback_text.get_width() // 2, self.screen_height // 2 - feedback_text.get_height() // 2))
         pygame.display.flip()
 
-        if self.is_raspberry_pi:
-            if color == self.GREEN:
-                GPIO.output(GREEN_LED_PIN, GPIO.HIGH)
-                GPIO.output(RED_LED_PIN, GPIO.LOW)
-            else:
-                GPIO.output(RED_LED_PIN, GPIO.HIGH)
-                GPIO.output(GREEN_LED_PIN, GPIO.LOW)
+        if self.segment_display is not None:
+            self.segment_display.set_leds(green=color == self.GREEN, red=color != self.GREEN)
 
         pygame.time.wait(2000)
 
-        if self.is_raspberry_pi:
-            GPIO.output(GREEN_LED_PIN, GPIO.LOW)
-            GPIO.output(RED_LED_PIN, GPIO.LOW)
+        if self.segment_display is not None:
+            self.segment_display.set_leds(green=False, red=False)
 
     def boss_fight_splash_screen(self):
         self.change_music(self.boss_music)  # Start boss music
@@ -731,21 +695,29 @@ class Game:
         self.boss.health = self.boss.max_health
         self.boss.reset_boss()
         self.boss.minigame_triggered = False
+        self.dirty_rects.invalidate()
+        if self.headless:
+            return
         
         self.screen.fill(self.BLACK)
-        boss_fight_text = self.bold_font.render("Boss Fight!", True, self.RED)
+        boss_fight_text = self.text_cache.render(self.bold_font, "Boss Fight!", True, self.RED)
         self.screen.blit(boss_fight_text, (self.screen_width // 2 - boss_fight_text.get_width() // 2, self.screen_height // 2 - 100))
-        continue_text = self.big_font.render("Press any key to continue", True, self.WHITE)
+        continue_text = self.text_cache.render(self.big_font, "Press any key to continue", True, self.WHITE)
         self.screen.blit(continue_text, (self.screen_width // 2 - continue_text.get_width() // 2, self.screen_height // 2 + 50))
         pygame.display.flip()
         self.wait_for_keypress()
 
     def game_over_screen(self):
+        self.finish_replay()
+        self.autosave.discard()
         self.change_music(self.game_over_music)  # Play Game Over music
+        if self.headless:
+            self.game_over = True  # End the simulated session instead of waiting on the menu
+            return
         self.screen.fill(self.RED)
-        game_over_text = self.bold_font.render("GAME OVER!", True, self.WHITE)
+        game_over_text = self.text_cache.render(self.bold_font, "GAME OVER!", True, self.WHITE)
         self.screen.blit(game_over_text, (self.screen_width // 2 - game_over_text.get_width() // 2, self.screen_height // 2 - 100))
-        instruction_text = self.big_font.render("Press R to Return to menu or Q to Quit", True, self.WHITE)
+        instruction_text = self.text_cache.render(self.big_font, "Press R to Return to menu or Q to Quit", True, self.WHITE)
         self.screen.blit(instruction_text, (self.screen_width // 2 - instruction_text.get_width() // 2, self.screen_height // 2 + 50))
         pygame.display.flip()
 
@@ -764,6 +736,8 @@ class Game:
                         quit()
 
     def wait_for_keypress(self, cooldown=1000):
+        if self.headless:
+            return
         start_time = pygame.time.get_ticks()
         while True:
             for event in pygame.event.get():
@@ -776,13 +750,29 @@ class Game:
     '''
     Checkpoint 2: Entry of the game. Loading menu
     '''
+    def draw_menu(self, menu_options, selected_option):
+        self.screen.blit(self.menu_backgrounds[self.menu_background_index], (0, 0))
+
+        # Title text
+        self.screen.blit(self.title_image, (self.screen_width // 2 - self.title_image.get_width() // 2, 50))
+
+        # Draw menu items
+        for i, option in enumerate(menu_options):
+            y = 200 + i * 80
+            color = self.GREEN if i == selected_option else self.WHITE
+            option_text = self.text_cache.render(self.big_font, option, True, color)
+            self.screen.blit(option_text, (self.screen_width//2 - option_text.get_width()//2, y))
+
     def show_menu(self):
         # Original_menu_options = ["New Game", "Load Game", "Leaderboard", "Instructions", "Exit"]
-        menu_options = ["New Game", "Instructions", "Exit"]
+        menu_options = ["New Game", "Leaderboard", "Instructions", "Exit"]
+        if self.autosave.enabled and self.save_store.has_autosave():
+            menu_options.insert(0, "Continue")  # A session was left unfinished
         selected_option = 0
         self.loaded_from_menu = False   
 
         self.change_music(self.menu_music)  # Play menu music
+        self.leaderboard.refresh()  # Fetch in the background so the Leaderboard screen opens with data
 
         while True:
             current_time = time.time()
@@ -792,18 +782,7 @@ class Game:
                 self.menu_background_index = (self.menu_background_index + 1) % len(self.menu_backgrounds)
                 self.last_bg_update = current_time
 
-            self.screen.blit(self.menu_backgrounds[self.menu_background_index], (0, 0))
-
-            # Title text
-            self.screen.blit(self.title_image, (self.screen_width // 2 - self.title_image.get_width() // 2, 50))
-
-            # Draw menu items
-            for i, option in enumerate(menu_options):
-                y = 200 + i * 80
-                color = self.GREEN if i == selected_option else self.WHITE
-                option_text = self.big_font.render(option, True, color)
-                self.screen.blit(option_text, (self.screen_width//2 - option_text.get_width()//2, y))
-
+            self.draw_menu(menu_options, selected_option)
             pygame.display.flip()
 
             for event in pygame.event.get():
@@ -818,6 +797,9 @@ class Game:
                     elif event.key == pygame.K_RETURN:
                         if menu_options[selected_option] == "Load Game":
                             self.show_load_menu()
+                        elif menu_options[selected_option] == "Continue":
+                            self.continue_autosave()
+                            return
                         elif menu_options[selected_option] == "New Game":
                             self.reset_game()
                             return
@@ -833,7 +815,7 @@ class Game:
         selected_slot = 0
         while True:
             self.screen.fill(self.BLACK)
-            title = self.big_font.render("Load Game", True, self.YELLOW)
+            title = self.text_cache.render(self.big_font, "Load Game", True, self.YELLOW)
             self.screen.blit(title, (self.screen_width//2 - title.get_width()//2, 50))
         
 
@@ -854,19 +836,19 @@ class Game:
                     save = self.save_slots[i]
                     text_lines = [
                         f"{save['name']}",
-                        f"Level: {save['level']} | Lives: {save['player']['lives']}",
+                        f"Level: {save['level']} | Lives: {save['lives']}",
                         f"Score: {save['score']} | Saved: {save['timestamp']}"
                     ]
                     for j, line in enumerate(text_lines):
-                        text_surf = self.font.render(line, True, color)
+                        text_surf = self.text_cache.render(self.font, line, True, color)
                         self.screen.blit(text_surf, (slot_rect.x + 20, slot_rect.y + 10 + j*30))
                 else:
                     # Draw empty slot text
-                    empty_text = self.font.render("Empty Slot!", True, color)
+                    empty_text = self.text_cache.render(self.font, "Empty Slot!", True, color)
                     self.screen.blit(empty_text, (slot_rect.x + 20, slot_rect.y + 40))
         
             # Add instructions
-            return_text = self.font.render("Press ESC to return to menu | DEL to delete save", True, self.GREEN)
+            return_text = self.text_cache.render(self.font, "Press ESC to return to menu | DEL to delete save", True, self.GREEN)
             self.screen.blit(return_text, (self.screen_width//2 - return_text.get_width()//2, 550))
         
             for event in pygame.event.get():
@@ -884,12 +866,10 @@ class Game:
                     elif event.key == pygame.K_DELETE:
                         if self.save_slots[selected_slot]:
                             if self.confirm_delete_save():
-                                self.save_slots[selected_slot] = None
                                 try:
-                                    with open('saves.json', 'w') as f:
-                                        json.dump(self.save_slots, f)
+                                    self.save_store.delete(selected_slot)
                                     self.display_feedback("Save deleted!", self.RED)
-                                except Exception as e:
+                                except OSError as e:
                                     print(f"Error deleting save: {e}")
         
             pygame.display.flip()
@@ -912,7 +892,7 @@ class Game:
     def confirm_delete_save(self):
         # Confirmation screen
         self.screen.fill(self.BLACK)
-        confirm_text = self.big_font.render("Confirm delete save? (Y/N)", True, self.WHITE)
+        confirm_text = self.text_cache.render(self.big_font, "Confirm delete save? (Y/N)", True, self.WHITE)
         self.screen.blit(confirm_text, (self.screen_width//2 - confirm_text.get_width()//2,
                                         self.screen_height//2 - confirm_text.get_height()//2))
         pygame.display.flip()
@@ -926,67 +906,34 @@ class Game:
                     elif event.key == pygame.K_n or event.key == pygame.K_ESCAPE:
                         return False
                             
-    def save_game(self, slot, name):
-        current_saves = []
-        if os.path.exists('saves.json'):
-            try:
-                with open('saves.json', 'r') as f:
-                    current_saves = json.load(f)
-                current_saves = (current_saves + [None] * 3)[:3]
-            except (json.JSONDecodeError, FileNotFoundError):
-                current_saves = [None, None, None]
-        else:
-            current_saves = [None, None, None]
-
-        # Create the new game state
+    def get_save_state(self, name):
+        """Everything needed to continue this game later; see snapshot.py for how it is stored."""
         game_state = {
             'name': name,
-            'level': "BOSS" if self.boss_fight else self.level,
+            'timestamp': datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
+            'level': self.level,
             'boss_fight': self.boss_fight,
-            'minigame_trigger': self.boss.minigame_triggered,
-            'boss_ragemode': self.boss.rage_mode,
             'score': self.score,
             'questions_asked': self.questions_asked,
-            'asked_questions': self.asked_questions,
-            'player_barricades': [
-                [{'x': block['rect'].x, 'y': block['rect'].y} for block in barricade]
-                for barricade in self.barricade_manager.barricades
-            ],
-
-            'player': {
-                'lives': self.player.lives,
-                'x': self.player.x,
-                'y': self.player.y,
-                'invulnerable': self.player.invulnerable,
-                'invulnerable_time': time.time() - self.player.invulnerable_timer,
-            },
-            'enemies': self.enemy_manager.enemies,
-            'enemy_direction': self.enemy_manager.direction,
-            'enemy_speed': self.enemy_manager.enemy_speed,
-            'enemy_shotprob': self.enemy_manager.shoot_prob,
-            'boss_health': self.boss.health if self.boss_fight else None,
-            'player_bullets': [(b[0], b[1], b[2], b[3]) for b in self.bullet_manager.player_bullets],
-            'enemy_bullets': [(b[0], b[1]) for b in self.bullet_manager.enemy_bullets],
-            'boss_bullets': [(b[0], b[1], b[2], b[3]) for b in self.bullet_manager.boss_bullets],
-            'power_ups': {
-                'active': self.power_ups.power_up_active,
-                'type': self.power_ups.current_power_up,
-                'positions': self.power_ups.power_ups.copy(),  # Save all power-up positions
-                'timer': self.power_ups.power_up_timer - time.time() if self.power_ups.power_up_active else 0,
-                'spawn_time': self.power_ups.spawn_time
-            },
-            'timestamp': datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+            'asked_questions': list(self.asked_questions),  # A copy, the autosave thread encodes it later
+            'player': self.player.get_saved_state(),
+            'enemies': self.enemy_manager.get_saved_state(),
+            'bullets': self.bullet_manager.get_saved_state(),
+            'barricades': self.barricade_manager.get_saved_state(),
+            'power_ups': self.power_ups.get_saved_state(),
+            'boss': self.boss.get_saved_state(),
         }
+        return game_state
 
-        current_saves[slot] = game_state
+    def save_game(self, slot, name):
+        # Create the new game state
+        game_state = self.get_save_state(name)
 
-        # Write back all slots to the file
+        # Only this slot's file and the index are written
         try:
-            with open('saves.json', 'w') as f:
-                json.dump(current_saves, f)
-            self.save_slots = current_saves
+            self.save_store.save(slot, game_state)
             self.display_feedback("Game Saved!", self.GREEN)
-        except IOError as e:
+        except OSError as e:
             print(f"Error saving game: {e}")
             self.display_feedback("Error saving game!", self.RED)
 
@@ -998,13 +945,13 @@ class Game:
             pygame.draw.rect(self.screen, self.GREEN, (150, 150, 900, 300), 3)
 
             # Title text
-            prompt = self.big_font.render("NAME YOUR SAVE FILE", True, self.YELLOW)
+            prompt = self.text_cache.render(self.big_font, "NAME YOUR SAVE FILE", True, self.YELLOW)
             self.screen.blit(prompt, (self.screen_width//2 - prompt.get_width()//2, 180))
 
             # Input box with blinking cursor
             input_rect = pygame.Rect(self.screen_width//2 - 200, 280, 400, 40)
             pygame.draw.rect(self.screen, self.WHITE, input_rect, 2)
-            name_text = self.font.render(name, True, self.GREEN)
+            name_text = self.text_cache.render(self.font, name, True, self.GREEN)
             self.screen.blit(name_text, (input_rect.x + 10, input_rect.y + 5))
         
             # Blinking cursor
@@ -1014,7 +961,7 @@ class Game:
                                (cursor_x, input_rect.y+35), 3)
 
             # Instructions
-            instr_text = self.font.render("Press ESC to cancel | ENTER to save", True, self.WHITE)
+            instr_text = self.text_cache.render(self.font, "Press ESC to cancel | ENTER to save", True, self.WHITE)
             self.screen.blit(instr_text, (self.screen_width//2 - instr_text.get_width()//2, 350))
 
             for event in pygame.event.get():
@@ -1033,28 +980,29 @@ class Game:
 
             pygame.display.flip()
 
-    def load_game(self, slot):
-        if os.path.exists('saves.json'):
-            try:
-                with open('saves.json', 'r') as f:
-                    self.save_slots = json.load(f)  
-            except (json.JSONDecodeError, FileNotFoundError) as e:
-                self.display_feedback(f"Error reading save file: {e}", self.RED)
-                return False
-        else:
-            self.display_feedback("No save file found!", self.RED)
-            return False
-
-        # Ensure selected save slot exists and is not empty
-        if not self.save_slots or not self.save_slots[slot]:
-            self.display_feedback("Empty Slot!", self.RED)
-            return False
-
-        save_data = self.save_slots[slot] 
-
+    def apply_save_state(self, save_data):
+        """Restore a state made by get_save_state."""
         # CLEAR EVERYTHING BEFORE LOADING TO AVOID ISSUES
         self.reset_game_state()
+        if 'player_bullets' in save_data:
+            self.apply_legacy_save_state(save_data)
+            return
 
+        self.level = save_data['level']
+        self.boss_fight = save_data['boss_fight']
+        self.score = save_data['score']
+        self.questions_asked = save_data['questions_asked']
+        self.asked_questions = list(save_data['asked_questions'])
+        self.question_bank.reset(self.asked_questions)
+        self.player.restore_saved_state(save_data['player'])
+        self.enemy_manager.restore_saved_state(save_data['enemies'])
+        self.bullet_manager.restore_saved_state(save_data['bullets'])
+        self.barricade_manager.restore_saved_state(save_data['barricades'])
+        self.power_ups.restore_saved_state(save_data['power_ups'])
+        self.boss.restore_saved_state(save_data['boss'])
+
+    def apply_legacy_save_state(self, save_data):
+        # Saves from the old saves.json (migrated into the slots by SaveStore): JSON lists per manager
         # Restore core state
         self.level = save_data['level']
         self.boss_fight = save_data['boss_fight']
@@ -1062,7 +1010,8 @@ class Game:
         self.boss.rage_mode = save_data['boss_ragemode']
         self.score = save_data['score']
         self.questions_asked = save_data['questions_asked']
-        self.asked_questions = save_data['asked_questions']
+        self.asked_questions = [question_id(question_data) for question_data in save_data['asked_questions']]
+        self.question_bank.reset(self.asked_questions)
         self.barricade_manager.create_barricades(saved_state=save_data.get('player_barricades', None))
 
         # Restore player
@@ -1070,10 +1019,10 @@ class Game:
         self.player.x = save_data['player']['x']
         self.player.y = save_data['player']['y']
         self.player.invulnerable = save_data['player']['invulnerable']
-        self.player.invulnerable_timer = time.time() - save_data['player']['invulnerable_time']
+        self.player.invulnerable_timer = self.game_clock.now - save_data['player']['invulnerable_time']
 
         # Restore enemies exactly as saved
-        self.enemy_manager.enemies = save_data['enemies'] if save_data['enemies'] else []
+        self.enemy_manager.restore_enemy_positions(save_data['enemies'] or [])
         self.enemy_manager.direction = save_data['enemy_direction']
         self.enemy_manager.enemy_speed = save_data['enemy_speed']
         self.enemy_manager.shoot_prob = save_data['enemy_shotprob']
@@ -1081,103 +1030,133 @@ class Game:
         # Restore boss
         if self.boss_fight:
             self.boss.health = save_data['boss_health']
-            self.enemy_manager.enemies.clear() # Fixed issue when loading from save where enemies would spawn
+            self.enemy_manager.clear() # Fixed issue when loading from save where enemies would spawn
             
 
         # Restore bullets
-        self.bullet_manager.player_bullets = [[b[0], b[1], b[2], b[3]] for b in save_data['player_bullets']]
-        self.bullet_manager.enemy_bullets = [[b[0], b[1]] for b in save_data['enemy_bullets']]
-        self.bullet_manager.boss_bullets = [
-            [b[0], b[1], b[2], b[3]] 
-            for b in save_data['boss_bullets']
-            if len(b) == 4 and all(isinstance(v, (int, float)) for v in b)
-        ]
+        for b in save_data['player_bullets']:
+            self.bullet_manager.spawn_player_bullet(b[0], b[1], b[2], b[3])
+        for b in save_data['enemy_bullets']:
+            self.bullet_manager.add_enemy_bullet(b[0], b[1])
+        for b in save_data['boss_bullets']:
+            self.bullet_manager.add_boss_bullet(b[0], b[1], b[2], b[3])
 
         # Restore power-ups
         power_up_data = save_data['power_ups']
         self.power_ups.power_up_active = power_up_data['active']
         self.power_ups.current_power_up = power_up_data['type']
         self.power_ups.power_ups = power_up_data['positions']
-        self.power_ups.spawn_time = power_up_data['spawn_time']
+        self.power_ups.spawn_time = self.game_clock.now  # saves.json held a time.time() value, restart the spawn timer
         if power_up_data['active']:
-            self.power_ups.power_up_timer = time.time() + power_up_data['timer']
+            self.power_ups.power_up_timer = self.game_clock.now + power_up_data['timer']
+
+    def load_game(self, slot):
+        # Ensure selected save slot exists and is not empty
+        if not self.save_slots[slot]:
+            self.display_feedback("Empty Slot!", self.RED)
+            return False
+
+        try:
+            save_data = self.save_store.load(slot)
+        except FileNotFoundError:
+            self.display_feedback("No save file found!", self.RED)
+            return False
+        except (OSError, ValueError) as e:
+            self.display_feedback(f"Error reading save file: {e}", self.RED)
+            return False
 
+        self.apply_save_state(save_data)
         self.display_feedback("Game Loaded!", self.GREEN)
         self.paused = False
         self.main_game_loop()
         
+    def continue_autosave(self):
+        try:
+            save_data = self.save_store.load_autosave()
+        except (OSError, ValueError) as e:
+            self.display_feedback(f"Error reading autosave: {e}", self.RED)
+            return False
+
+        self.apply_save_state(save_data)
+        self.display_feedback("Game Loaded!", self.GREEN)
+        self.paused = False
+        self.main_game_loop()
+
     def check_server_availability(self):
         return False
         
     def load_saves_from_file(self):
-        """Loads saved game data from saves.json at startup."""
-        if os.path.exists('saves.json'):
-            try:
-                with open('saves.json', 'r') as f:
-                    loaded_saves = json.load(f)
-                    # Ensure exactly 3 slots, filling with None if necessary
-                    self.save_slots = (loaded_saves + [None] * 3)[:3]
-            except (json.JSONDecodeError, FileNotFoundError):
-                self.save_slots = [None, None, None]
-        else:
-            self.save_slots = [None, None, None]
+        """Reads the save index at startup (an old saves.json is migrated the first time)."""
+        self.save_store.load_index()
             
     def create_loading_screen(self):
         self.screen.fill(self.BLACK)
-        loading_text = self.big_font.render("Loading...", True, self.GREEN)
+        loading_text = self.text_cache.render(self.big_font, "Loading...", True, self.GREEN)
         self.screen.blit(loading_text, (self.screen_width // 2 - loading_text.get_width() // 2, self.screen_height // 2 - loading_text.get_height() // 2))
         pygame.display.flip()   
         
     def show_leaderboard(self):
-        self.create_loading_screen()  # Show loading screen
-        # try:
-        #     # Changed to HTTPS and added Basic Authentication with the username and password
-        #     response = requests.get("https://5269989.pythonanywhere.com/leaderboard", 
-        #                             timeout=5, 
-        #                             auth=HTTPBasicAuth('5269989', 'SAM'))
-        #     if response.status_code == 200:
-        #         leaderboard_data = response.json()
-        #         self.screen.fill(self.BLACK)
-        #         leaderboard_title = self.big_font.render("Leaderboard", True, self.YELLOW)
-        #         self.screen.blit(leaderboard_title, (self.screen_width // 2 - leaderboard_title.get_width() // 2, 30))
-    
-        #         smaller_font = pygame.font.SysFont("Arial", 22)
-        #         y_position = 100
-    
-        #         for i, entry in enumerate(leaderboard_data):
-        #             player_text = smaller_font.render(f"{i+1}. {entry['player']} - {entry['score']} points", True, self.WHITE)
-        #             self.screen.blit(player_text, (self.screen_width // 2 - player_text.get_width() // 2, y_position))
-        #             y_position += 40
-        #     else:
-        #         raise Exception("Failed to retrieve leaderboard")
-        # except Exception as e:
-        #     self.screen.fill(self.BLACK)
-        #     error_text = self.big_font.render(f"Error: Failed to connect to leaderboard server", True, self.RED)
-        #     self.screen.blit(error_text, (self.screen_width // 2 - error_text.get_width() // 2, self.screen_height // 2 - error_text.get_height() // 2))
-
-        tip = "Press any key to go back!"
-        tip_text = self.font.render(tip, True, self.GREEN)
-        self.screen.blit(tip_text, (self.screen_width // 2 - tip_text.get_width() // 2, self.screen_height - 50))
-
-        pygame.display.flip()
-
-        # Wait for a key press before returning to the menu
+        self.leaderboard.refresh()  # No-op while the cached board is still fresh
+        shown = None
         waiting = True
         while waiting:
+            entries, error, fetching, version = self.leaderboard.snapshot()
+            if (version, fetching) != shown:
+                # Only redraw when new data (or a failure) arrived or a refresh started/stopped
+                if shown is None or version != shown[0]:
+                    if error:
+                        print(f"Leaderboard error: {error}")
+                shown = (version, fetching)
+                self.draw_leaderboard(entries, error, fetching)
+                pygame.display.flip()
+
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     quit()
                 if event.type == pygame.KEYDOWN:
                     waiting = False
+            self.clock.tick(30)
         self.show_menu()
+
+    def draw_leaderboard(self, entries, error, fetching):
+        self.screen.fill(self.BLACK)
+        if entries is None:
+            if error:
+                error_text = self.text_cache.render(self.big_font, "Error: Failed to connect to leaderboard server", True, self.RED)
+            else:
+                error_text = self.text_cache.render(self.big_font, "Loading...", True, self.GREEN)
+            self.screen.blit(error_text, (self.screen_width // 2 - error_text.get_width() // 2, self.screen_height // 2 - error_text.get_height() // 2))
+        else:
+            leaderboard_title = self.text_cache.render(self.big_font, "Leaderboard", True, self.YELLOW)
+            self.screen.blit(leaderboard_title, (self.screen_width // 2 - leaderboard_title.get_width() // 2, 30))
+
+            y_position = 100
+            for i, entry in enumerate(entries):
+                player_text = self.text_cache.render(self.font, f"{i+1}. {entry['player']} - {entry['score']} points", True, self.WHITE)
+                self.screen.blit(player_text, (self.screen_width // 2 - player_text.get_width() // 2, y_position))
+                y_position += 40
+
+            # The cached board is on screen, say whether it is being refreshed or is out of date
+            status = None
+            if fetching:
+                status = self.text_cache.render(self.font, "Updating...", True, self.YELLOW)
+            elif error:
+                status = self.text_cache.render(self.font, "Server unreachable, showing the last scores received", True, self.RED)
+            if status:
+                self.screen.blit(status, (self.screen_width // 2 - status.get_width() // 2, self.screen_height - 90))
+
+        tip = "Press any key to go back!"
+        tip_text = self.text_cache.render(self.font, tip, True, self.GREEN)
+        self.screen.blit(tip_text, (self.screen_width // 2 - tip_text.get_width() // 2, self.screen_height - 50))
+
                  
     def clear_level(self):
         
         # Clear player bullets and deactivate power-ups
         self.clear_bullets()
         self.power_ups.reset_power_up()  
-        self.power_ups.spawn_time = time.time()  
+        self.power_ups.spawn_time = self.game_clock.now  
         self.power_ups.spawn_power_up()
         self.barricade_manager.reset()
 
@@ -1235,15 +1214,13 @@ class Game:
             page = instructions_pages[current_page]
         
             # Draw title
-            title_text = self.bold_font.render(page["title"], True, self.YELLOW)
+            title_text = self.text_cache.render(self.bold_font, page["title"], True, self.YELLOW)
             title_rect = title_text.get_rect(center=(self.screen_width//2, 50))
             self.screen.blit(title_text, title_rect)
         
-            # Load and draw image
+            # Draw image (loaded and scaled only the first time a page is shown)
             try:
-                image_path = os.path.join("assets", "instructions", page["image"])
-                image = pygame.image.load(image_path)
-                image = pygame.transform.scale(image, (600, 270))
+                image = self.assets.image("instructions", page["image"], size=(600, 270))
                 image_rect = image.get_rect(center=(self.screen_width//2, 225))
                 self.screen.blit(image, image_rect)
             except Exception as e:
@@ -1252,20 +1229,20 @@ class Game:
             # Draw text
             text_y = 370
             for line in page["text"]:
-                rendered_line = self.font.render(line, True, self.WHITE)
+                rendered_line = self.text_cache.render(self.font, line, True, self.WHITE)
                 self.screen.blit(rendered_line, 
                                (self.screen_width//2 - rendered_line.get_width()//2, text_y))
                 text_y += 35
         
             # Draw page navigation
-            page_text = self.font.render(
+            page_text = self.text_cache.render(self.font,
                 f"Page {current_page + 1} of {len(instructions_pages)}", 
                 True, self.GREEN
             )
             self.screen.blit(page_text, (self.screen_width//2 - page_text.get_width()//2, 550))
         
             # Draw navigation help
-            nav_text = self.font.render(
+            nav_text = self.text_cache.render(self.font,
                 "<-> : Navigate Pages | ESC: Return to Menu",
                 True, self.LIGHTBLUE
             )
@@ -1289,7 +1266,10 @@ class Game:
     '''
     Checkpoint 3: launch Game view
     '''
-    def reset_game(self):
+    def reset_game(self, max_frames=None, replay=None):
+        self.start_replay(replay)  # Before anything below reads the game clock
+        self.reset_game_state()
+        self.game_over = False
         self.player.lives = 3
         self.player.x = (self.screen_width - self.player.width) // 2
         self.player.y = self.screen_height - self.player.height - 10
@@ -1303,30 +1283,91 @@ class Game:
         self.enemy_manager.create_enemies()
         self.boss.health = self.boss.max_health
         # Reset Bullets
-        self.bullet_manager.player_bullets = []
-        self.bullet_manager.enemy_bullets = []
-        self.bullet_manager.boss_bullets = []
+        self.bullet_manager.clear()
         # Reset Power-ups
         self.power_ups.power_up_active = False
         self.power_ups.current_power_up = None
         self.power_ups.power_ups = []
-        self.power_ups.spawn_time = time.time()
+        self.power_ups.spawn_time = self.game_clock.now
         self.barricade_manager.reset()
         # Ensure game does NOT start paused
         self.paused = False
-        self.main_game_loop()
+        self.main_game_loop(max_frames)
+
+    def run_headless_session(self, max_frames=None):
+        """Play one unattended session from a fresh state and summarise how it ended."""
+        self.reset_game(max_frames)
+        return {
+            "frames": self.frame_count,
+            "score": self.score,
+            "level": "BOSS" if self.boss_fight else self.level,
+            "lives": self.player.lives,
+            "game_over": self.game_over,
+        }
+
+    '''
+    Replays: a new game is recorded when replay_dir is set. Playback re-runs
+    the recording headless, one fixed step per frame, with the recorded seed,
+    keys and question/minigame outcomes, comparing state checksums as it goes.
+    '''
+    def start_replay(self, replay=None):
+        if replay is not None:
+            # Start from the same clock step and seeds as the recorded session
+            self.game_clock.jump_to(replay.start_step)
+            self.rng.reseed(replay.seed)
+        else:
+            self.rng.reseed()
+            if self.replay_dir:
+                replay = Replay(self.rng.seed, self.game_clock.steps)
+        self.replay = replay
+
+    def finish_replay(self):
+        # Save the recording of the session that just ended (playbacks are left for play_replay)
+        replay = self.replay
+        if replay is None or replay.playing:
+            return
+        self.replay = None
+        os.makedirs(self.replay_dir, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self.replay_dir, f"session-{stamp}-{replay.seed}.replay")
+        try:
+            replay.save(path)
+            print(f"Replay saved: {path} ({replay.steps} steps)")
+        except OSError as e:
+            print(f"Error saving replay: {e}")
+
+    def record_outcome(self, kind, value):
+        # Blocking screens report their result through here so a recording can repeat it
+        if self.replay is not None:
+            return self.replay.outcome(kind, value)
+        return value
+
+    def play_replay(self, path):
+        """Re-run a recorded session step for step and report whether it diverged."""
+        replay = Replay.load(path)
+        self.reset_game(replay.steps, replay)
+        self.replay = None
+        return {
+            "steps": replay.step,
+            "recorded_steps": replay.steps,
+            "checksums": len(replay.checksums),
+            "divergences": replay.divergences,
+            "score": self.score,
+            "level": "BOSS" if self.boss_fight else self.level,
+            "lives": self.player.lives,
+        }
                
     def reset_game_state(self):
         # Clear Bullets
-        self.bullet_manager.player_bullets.clear()
-        self.bullet_manager.enemy_bullets.clear()
-        self.bullet_manager.boss_bullets.clear()
+        self.bullet_manager.clear()
         self.barricade_manager.reset()
         # Clear Enemies
-        self.enemy_manager.enemies.clear()
+        self.enemy_manager.clear()
         # Clear Power-Ups
         self.power_ups.reset_power_up()
         self.power_ups.is_first_level = True
+        self.power_ups.last_level_check = 1
+        self.power_ups.power_up_timer = 0
         # Reset Boss
         self.boss.reset_boss()
         self.boss_fight = False
@@ -1334,25 +1375,33 @@ class Game:
         self.level = 1
         self.questions_asked = 0
         self.asked_questions.clear()
+        self.question_bank.reset()
         self.score = 5000
         # Reset Player
         self.player.lives = 3
         self.player.invulnerable = False
         self.player.invulnerable_timer = 0
+        self.bullet_manager.last_shot_time = 0
+        self.enemy_manager.reset_difficulty()
         # Ensure UI and timers are reset
         pygame.time.set_timer(pygame.USEREVENT + 1, 0)
         if hasattr(self, 'score_adjustment'):
             del self.score_adjustment
 
     def end_game_screen(self):
+        self.finish_replay()
+        self.autosave.discard()
+        if self.headless:
+            self.game_over = True  # The simulated player won, end the session
+            return
         self.screen.fill(self.BLACK)
     
         # Game Over Text
-        end_text = self.bold_font.render(f"YOU WIN! Your Score is: {self.score}", True, self.GREEN)
+        end_text = self.text_cache.render(self.bold_font, f"YOU WIN! Your Score is: {self.score}", True, self.GREEN)
         self.screen.blit(end_text, (self.screen_width // 2 - end_text.get_width() // 2, self.screen_height // 3 - end_text.get_height() // 2))
     
         # Name Prompt
-        name_prompt = self.big_font.render("Enter your name (3 letters):", True, self.WHITE)
+        name_prompt = self.text_cache.render(self.big_font, "Enter your name (3 letters):", True, self.WHITE)
         self.screen.blit(name_prompt, (self.screen_width // 2 - name_prompt.get_width() // 2, self.screen_height // 2 - 30))
 
         # Input Box
@@ -1381,7 +1430,7 @@ class Game:
             pygame.draw.rect(self.screen, color, input_box)
         
             # Draw text inside the box
-            txt_surface = self.font.render(text, True, self.BLACK)
+            txt_surface = self.text_cache.render(self.font, text, True, self.BLACK)
             width = max(30, txt_surface.get_width()+10)
             input_box.w = width
             self.screen.blit(txt_surface, (input_box.x+5, input_box.y+5))
@@ -1391,35 +1440,10 @@ class Game:
         self.power_ups.reset_power_up()
             
     def save_score(self, name, score):
-        self.create_loading_screen()  # Show loading screen
-        self.display_feedback("Score submitted successfully", self.GREEN)
-        # try:
-        #     payload = {'player_name': name, 'score': score}
-        #     # Changed to HTTPS and added Basic Authentication with the username and password
-        #     response = requests.post("https://5269989.pythonanywhere.com/submit_score", 
-        #                              json=payload, 
-        #                              timeout=5, 
-        #                              auth=HTTPBasicAuth('5269989', 'SAM'))
-        #     if response.status_code != 200:
-        #         raise Exception(f"Failed to submit score. Status code: {response.status_code}")
-        #     else:
-        #         self.display_feedback("Score submitted successfully", self.GREEN)
-        # except requests.RequestException as e:
-        #     self.display_feedback(f"Network Error: {str(e)}", self.RED)
-        # except Exception as e:
-        #     self.display_feedback(f"Error: {str(e)}", self.RED)
-    
-        self.show_menu()
-
-    def load_cybersecurity_questions(self):
-        """Loading questions from JSON file"""
-        questions_file = get_asset_path("assets", "cybersecurity_questions.json")
+        # Queued on disk and uploaded in the background, the player goes straight back to the menu
         try:
-            with open(questions_file, "r") as file:
-                return json.load(file)
-        except FileNotFoundError:
-            print(f"Error: {questions_file} not found.")
-            return []
-        except json.JSONDecodeError as e:
-            print(f"Error decoding JSON: {e}")
-            return []
\ No newline at end of file
+            self.score_queue.put(name, score)
+        except (OSError, sqlite3.Error) as e:
+            self.display_feedback(f"Error: {str(e)}", self.RED)
+
+        self.show_menu()
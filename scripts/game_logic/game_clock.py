@@ -0,0 +1,65 @@
+import time
+
+class GameClock:
+    """
+    Fixed-timestep clock that every manager reads the game time from.
+
+    Game time only moves forward in whole steps of `step` seconds, so anything
+    timed against `now` (shoot cooldowns, power-ups, invulnerability, boss
+    attacks, score decay) freezes together while the clock is paused.
+    """
+    def __init__(self, step=1 / 60, max_steps_per_frame=5):
+        self.step = step
+        self.max_steps_per_frame = max_steps_per_frame  # Catch-up limit after a slow frame
+        self.now = 0.0
+        self.steps = 0
+        self.paused = False
+        self.accumulator = 0.0
+        self.last_real_time = None
+
+    def tick(self):
+        '''
+        Measure the real time since the last call and return how many fixed
+        steps the simulation has to run to catch up with it.
+        '''
+        real_time = time.perf_counter()
+        if self.paused or self.last_real_time is None:
+            self.last_real_time = real_time
+            return 0
+        elapsed = real_time - self.last_real_time
+        self.last_real_time = real_time
+
+        # Drop anything beyond the catch-up limit (blocking screens, long stalls)
+        # instead of fast-forwarding through it
+        self.accumulator = min(self.accumulator + elapsed, self.max_steps_per_frame * self.step)
+        steps = int(self.accumulator / self.step)
+        self.accumulator -= steps * self.step
+        return steps
+
+    def advance(self):
+        """Move game time forward by one fixed step."""
+        self.steps += 1
+        self.now = self.steps * self.step
+
+    def jump_to(self, steps):
+        """Set game time to a whole number of steps (a replay starts where its recording did)."""
+        self.steps = steps
+        self.now = steps * self.step
+        self.resync()
+
+    def ticks_ms(self):
+        """Game time in milliseconds, a drop-in for pygame.time.get_ticks()."""
+        return int(self.now * 1000)
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        if self.paused:
+            self.paused = False
+            self.resync()
+
+    def resync(self):
+        # Forget the real time that passed since the last tick
+        self.accumulator = 0.0
+        self.last_real_time = time.perf_counter()
@@ -0,0 +1,89 @@
+import threading
+import time
+import requests
+
+class LeaderboardClient:
+    '''
+    Talks to the leaderboard server without holding up the screen.
+
+    All requests go through one requests.Session, so the connection to the
+    server is kept open between visits. The last board is kept in memory:
+    for `ttl` seconds it is used as it is, after that it is revalidated on a
+    background thread with its ETag, which costs the server a 304 when
+    nothing changed. Screens draw whatever is cached straight away and
+    redraw when `version` changes.
+    '''
+    def __init__(self, url, auth=None, ttl=30, timeout=5):
+        self.url = url
+        self.ttl = ttl
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.auth = auth
+        self.lock = threading.Lock()
+        self.entries = None  # Last board received, None until the first one arrives
+        self.etag = None
+        self.fetched_at = -float("inf")
+        self.error = None  # Why the last refresh failed, None when it worked
+        self.fetching = False
+        self.version = 0  # Bumped whenever entries or error change
+
+    def is_fresh(self):
+        return time.monotonic() - self.fetched_at < self.ttl
+
+    def refresh(self, force=False):
+        """Start a background fetch unless the cache is fresh or one is already running."""
+        with self.lock:
+            if self.fetching or (self.is_fresh() and not force):
+                return
+            self.fetching = True
+        threading.Thread(target=self.fetch, daemon=True).start()
+
+    def fetch(self):
+        with self.lock:
+            cached_entries, cached_etag = self.entries, self.etag
+        headers = {"If-None-Match": cached_etag} if cached_etag and cached_entries is not None else {}
+        try:
+            response = self.session.get(f"{self.url}/leaderboard", headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                entries, etag = cached_entries, cached_etag  # Still current
+            elif response.status_code == 200:
+                entries, etag = response.json(), response.headers.get("ETag")
+            else:
+                raise requests.RequestException(f"status code {response.status_code}")
+        except (requests.RequestException, ValueError) as e:
+            with self.lock:
+                self.error = str(e)
+                self.fetching = False
+                self.version += 1
+            return
+        with self.lock:
+            changed = entries is not self.entries or self.error is not None
+            self.entries, self.etag = entries, etag
+            self.fetched_at = time.monotonic()
+            self.error = None
+            self.fetching = False
+            if changed:
+                self.version += 1
+
+    def snapshot(self):
+        # (entries, error, fetching, version) read together
+        with self.lock:
+            return self.entries, self.error, self.fetching, self.version
+
+    def submit_batch(self, scores, session):
+        """
+        Send queued scores ([{"id", "player_name", "score", "submitted"}]) in one request, through the
+        caller's `session` (the score queue's own, used from its thread).
+        Raises requests.RequestException; HTTP errors are requests.HTTPError with the response attached.
+        """
+        response = session.post(f"{self.url}/submit_scores", json={"scores": scores}, timeout=self.timeout)
+        if response.status_code == 404:
+            # A server without the bulk endpoint, fall back to one request per score
+            for score in scores:
+                single = session.post(f"{self.url}/submit_score", timeout=self.timeout,
+                                      json={"player_name": score["player_name"], "score": score["score"]})
+                single.raise_for_status()
+        else:
+            response.raise_for_status()
+        with self.lock:
+            self.fetched_at = -float("inf")  # The board has changed, the next visit refreshes it
@@ -0,0 +1,80 @@
+import sqlite3
+import threading
+import time
+
+class LeaderboardStore:
+    '''
+    Scores in a local SQLite database.
+
+    The (score DESC, submitted) index holds the table in leaderboard order,
+    so the top N is the first N index entries without sorting anything and
+    the rank of a score is a count over the start of that same index. A
+    second index on the submission time keeps "recent scores" queries just
+    as cheap.
+    Scores are only ever removed all at once, by delete_all. Batches from
+    the game's offline queue carry an ID per score, and IDs already seen are
+    skipped, so a batch that is sent again after a lost reply is harmless.
+    The IDs are kept through delete_all for the same reason (a batch resent
+    after a reset must not come back), at the cost of a table that only
+    grows, by about 40 bytes per score ever submitted.
+    '''
+    def __init__(self, path="leaderboard.sqlite"):
+        self.path = path
+        # One connection shared by the server's threads, guarded by a lock
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS scores ("
+                                    "id INTEGER PRIMARY KEY, player TEXT NOT NULL, "
+                                    "score INTEGER NOT NULL, submitted REAL NOT NULL)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS scores_by_rank ON scores (score DESC, submitted)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS scores_by_time ON scores (submitted)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS submission_ids (id TEXT PRIMARY KEY)")
+
+    def submit(self, player, score, submitted=None):
+        """Store one score and return its rank (1 is the best)."""
+        with self.lock, self.connection:
+            self.connection.execute("INSERT INTO scores (player, score, submitted) VALUES (?, ?, ?)",
+                                    (player, int(score), time.time() if submitted is None else submitted))
+        return self.rank_of(score)
+
+    def submit_batch(self, entries):
+        """Store [(id, player, score, submitted)] in one transaction; returns how many were new."""
+        added = 0
+        with self.lock, self.connection:
+            for submission_id, player, score, submitted in entries:
+                if self.connection.execute("INSERT OR IGNORE INTO submission_ids VALUES (?)", (submission_id,)).rowcount:
+                    self.connection.execute("INSERT INTO scores (player, score, submitted) VALUES (?, ?, ?)",
+                                            (player, int(score), submitted))
+                    added += 1
+        return added
+
+    def top(self, limit=10):
+        with self.lock:
+            rows = self.connection.execute("SELECT player, score FROM scores ORDER BY score DESC, submitted LIMIT ?",
+                                           (limit,)).fetchall()
+        return [{"player": player, "score": score} for player, score in rows]
+
+    def rank_of(self, score):
+        """Place a score would take: one more than the number of better scores."""
+        with self.lock:
+            better, = self.connection.execute("SELECT COUNT(*) FROM scores WHERE score > ?", (int(score),)).fetchone()
+        return better + 1
+
+    def recent(self, since):
+        with self.lock:
+            rows = self.connection.execute("SELECT player, score, submitted FROM scores WHERE submitted >= ? "
+                                           "ORDER BY submitted DESC", (since,)).fetchall()
+        return [{"player": player, "score": score, "submitted": submitted} for player, score, submitted in rows]
+
+    def count(self):
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def delete_all(self):
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM scores")
+
+    def close(self):
+        self.connection.close()
@@ -1,5 +1,4 @@
 import pygame
-import random
 
 class HackingMiniGame:
     def __init__(self, game):
@@ -10,7 +9,7 @@ class HackingMiniGame:
         self.grid_size = 8
         self.chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*"
         self.words = ["SECURE", "ACCESS", "SYSTEM", "DEFEND", "SHIELD"]
-        self.correct_word = random.choice(self.words)
+        self.correct_word = self.game.rng.minigame.choice(self.words)
         self.selected_row = 0
         self.selected_col = 0
         self.input_buffer = []
@@ -21,30 +20,30 @@ class HackingMiniGame:
 
     def generate_grid(self):
         """Generate the grid with the correct word hidden in a random orientation."""
-        self.grid = [[random.choice(self.chars) for _ in range(self.grid_size)] 
+        self.grid = [[self.game.rng.minigame.choice(self.chars) for _ in range(self.grid_size)] 
                      for _ in range(self.grid_size)]
         
         # Randomly choose orientation: 0 = horizontal, 1 = vertical, 2 = diagonal 
-        orientation = random.choice([0, 1, 2])
+        orientation = self.game.rng.minigame.choice([0, 1, 2])
         if orientation == 0:  # Horizontal
-            row = random.randint(0, self.grid_size - 1)
-            start_col = random.randint(0, self.grid_size - len(self.correct_word))
+            row = self.game.rng.minigame.randint(0, self.grid_size - 1)
+            start_col = self.game.rng.minigame.randint(0, self.grid_size - len(self.correct_word))
             for i, c in enumerate(self.correct_word):
                 self.grid[row][start_col + i] = c
         elif orientation == 1:  # Vertical
-            col = random.randint(0, self.grid_size - 1)
-            start_row = random.randint(0, self.grid_size - len(self.correct_word))
+            col = self.game.rng.minigame.randint(0, self.grid_size - 1)
+            start_row = self.game.rng.minigame.randint(0, self.grid_size - len(self.correct_word))
             for i, c in enumerate(self.correct_word):
                 self.grid[start_row + i][col] = c
         elif orientation == 2:  # Diagonal
-            start_row = random.randint(0, self.grid_size - len(self.correct_word))
-            start_col = random.randint(0, self.grid_size - len(self.correct_word))
+            start_row = self.game.rng.minigame.randint(0, self.grid_size - len(self.correct_word))
+            start_col = self.game.rng.minigame.randint(0, self.grid_size - len(self.correct_word))
             for i, c in enumerate(self.correct_word):
                 self.grid[start_row + i][start_col + i] = c
 
     def show_instructions(self):
         self.screen.fill(self.game.BLACK)
-        title = self.game.bold_font.render("HACKING MINIGAME", True, self.game.GREEN)
+        title = self.game.text_cache.render(self.game.bold_font, "HACKING MINIGAME", True, self.game.GREEN)
         title_rect = title.get_rect(center=(self.screen_width // 2, 100))
         self.screen.blit(title, title_rect)
 
@@ -66,7 +65,7 @@ class HackingMiniGame:
             start_x = (self.screen_width - total_width) // 2
             x_offset = 0
             for part_text, part_color in line:
-                text_surface = self.game.font.render(part_text, True, part_color)
+                text_surface = self.game.text_cache.render(self.game.font, part_text, True, part_color)
                 self.screen.blit(text_surface, (start_x + x_offset, y))
                 x_offset += text_surface.get_width()
             y += 40
@@ -79,7 +78,7 @@ class HackingMiniGame:
         self.screen.fill(self.game.BLACK)
         
         # Timer
-        timer_text = self.game.font.render(f"TIME: {int(remaining_time)}", True, 
+        timer_text = self.game.text_cache.render(self.game.font, f"TIME: {int(remaining_time)}", True,
                                              self.game.RED if remaining_time < 5 else self.game.WHITE)
         self.screen.blit(timer_text, (self.screen_width // 2 - timer_text.get_width() // 2, 10))
         
@@ -100,19 +99,19 @@ class HackingMiniGame:
                     pygame.draw.rect(self.screen, self.game.GREEN, (x - 2, y - 2, cell_size + 4, cell_size + 4), 3)
                 
                 # Draw character
-                text = self.game.font.render(char, True, self.game.WHITE)
+                text = self.game.text_cache.render(self.game.font, char, True, self.game.WHITE)
                 self.screen.blit(text, (x + 10, y + 10))
         
-        input_text = self.game.font.render("".join(self.input_buffer), True, self.game.WHITE)
+        input_text = self.game.text_cache.render(self.game.font, "".join(self.input_buffer), True, self.game.WHITE)
         input_rect = input_text.get_rect(center=(self.screen_width // 2, start_y + (self.grid_size * cell_size) + 50))
         self.screen.blit(input_text, input_rect)
         
         # Input status – using dynamic max letters
         status_color = self.game.RED if len(self.input_buffer) >= len(self.correct_word) else self.game.WHITE
-        status_text = self.game.font.render(f"Letters: {len(self.input_buffer)}/{len(self.correct_word)}", True, status_color)
+        status_text = self.game.text_cache.render(self.game.font, f"Letters: {len(self.input_buffer)}/{len(self.correct_word)}", True, status_color)
         self.screen.blit(status_text, (self.screen_width // 2 - 100, input_rect.bottom + 10))
         
-        word_text = self.game.font.render(f"Target Word: {self.correct_word}", True, self.game.GREEN)
+        word_text = self.game.text_cache.render(self.game.font, f"Target Word: {self.correct_word}", True, self.game.GREEN)
         self.screen.blit(word_text, (self.screen_width//2 - word_text.get_width()//2, start_y - 50))
         pygame.display.flip()
 
@@ -122,17 +121,17 @@ class HackingMiniGame:
         
         result_text = "ACCESS GRANTED!" if success else "ACCESS DENIED!"
         color = self.game.GREEN if success else self.game.RED
-        text = self.game.bold_font.render(result_text, True, color)
+        text = self.game.text_cache.render(self.game.bold_font, result_text, True, color)
         text_rect = text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
         self.screen.blit(text, text_rect)
         
         if not success:
-            effect_text = self.game.font.render("The boss is entering rage mode!", True, self.game.RED)
+            effect_text = self.game.text_cache.render(self.game.font, "The boss is entering rage mode!", True, self.game.RED)
             effect_rect = effect_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 50))
             self.screen.blit(effect_text, effect_rect)
             self.game.boss.enable_rage_mode()
         
-        prompt = self.game.font.render("Press any key to continue...", True, self.game.WHITE)
+        prompt = self.game.text_cache.render(self.game.font, "Press any key to continue...", True, self.game.WHITE)
         prompt_rect = prompt.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 100))
         self.screen.blit(prompt, prompt_rect)
         
@@ -140,6 +139,12 @@ class HackingMiniGame:
         self.game.wait_for_keypress()
 
     def run(self):
+        replay = self.game.replay
+        if replay is not None and replay.playing:
+            return replay.outcome("minigame")  # Same result as in the recorded session
+        if self.game.headless:
+            return self.game.record_outcome("minigame", False)  # Nobody can solve the grid in a simulated session
+        self.game.dirty_rects.invalidate()  # The minigame takes over the whole screen
         self.show_instructions()
         # Reset timer so that it starts after the instructions are dismissed
         self.start_time = pygame.time.get_ticks() / 1000
@@ -198,4 +203,4 @@ class HackingMiniGame:
             self.game.clock.tick(60)
         
         self.show_result(success)
-        return success
+        return self.game.record_outcome("minigame", success)
@@ -0,0 +1,123 @@
+import time
+import pygame
+import numpy as np
+
+class PerfOverlay:
+    '''
+    On-screen profiler for the main game loop, toggled with F3.
+
+    The loop calls mark(stage) after each stage; the time since the previous
+    mark is charged to that stage. When the overlay is off every call returns
+    straight away, so the timing points cost one method call each.
+    '''
+    STAGES = ("input", "player", "barricades", "enemies", "boss", "hits", "bullets", "draw", "draw_ui", "display")
+    FRAME_BUDGET_MS = 1000 / 60
+
+    def __init__(self, game, history=180, refresh_interval=0.25):
+        self.game = game
+        self.enabled = False
+        self.history = history
+        self.refresh_interval = refresh_interval  # Seconds between panel redraws
+        self.stage_times = dict.fromkeys(self.STAGES, 0.0)  # Seconds spent in the current frame
+        self.stage_ms = dict.fromkeys(self.STAGES, 0.0)  # Smoothed milliseconds per frame
+        self.frame_times = np.zeros(history)  # Ring buffer of frame times in ms
+        self.frames_recorded = 0
+        self.frame_start = 0.0
+        self.last_mark = 0.0
+        self.panel = None
+        self.last_refresh = 0.0
+        self.font = None  # Loaded the first time the overlay is drawn
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.frames_recorded = 0
+        self.game.text_cache.reset_stats()  # Hit rate counts from when the overlay was switched on
+        self.panel = None
+        self.game.dirty_rects.invalidate()  # Clear the panel away when it is switched off
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.frame_start = self.last_mark = time.perf_counter()
+        for stage in self.stage_times:
+            self.stage_times[stage] = 0.0
+
+    def mark(self, stage):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.stage_times[stage] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.frame_times[self.frames_recorded % self.history] = (self.last_mark - self.frame_start) * 1000
+        self.frames_recorded += 1
+        for stage, seconds in self.stage_times.items():
+            # Exponential moving average keeps the numbers readable
+            self.stage_ms[stage] += (seconds * 1000 - self.stage_ms[stage]) * 0.1
+
+    def recent_frame_times(self):
+        # Oldest first
+        if self.frames_recorded < self.history:
+            return self.frame_times[:self.frames_recorded]
+        return np.roll(self.frame_times, -(self.frames_recorded % self.history))
+
+    def entity_counts(self):
+        bullet_manager = self.game.bullet_manager
+        return [
+            ("enemies", self.game.enemy_manager.alive_count),
+            ("player bullets", bullet_manager.player_bullets.count),
+            ("enemy bullets", bullet_manager.enemy_bullets.count),
+            ("boss bullets", bullet_manager.boss_bullets.count),
+            ("barricade blocks", sum(int(barricade["cells"].sum()) for barricade in self.game.barricade_manager.barricades)),
+            ("power-ups", len(self.game.power_ups.power_ups)),
+        ]
+
+    def build_panel(self):
+        if self.font is None:
+            self.font = pygame.font.Font(None, 18)  # pygame's built-in font, narrower than the game font
+        font = self.font
+        times = self.recent_frame_times()
+        p50 = np.percentile(times, 50) if len(times) else 0.0
+        p99 = np.percentile(times, 99) if len(times) else 0.0
+        lines = [(f"frame p50 {p50:.2f} ms   p99 {p99:.2f} ms", self.game.YELLOW)]
+        lines += [(f"{stage}: {self.stage_ms[stage]:.2f} ms", self.game.WHITE) for stage in self.STAGES]
+        lines += [(f"{name} {count}", self.game.LIGHTBLUE) for name, count in self.entity_counts()]
+        # The autosave snapshot is taken on the main thread and should stay well under a millisecond
+        capture_ms = self.game.autosave.capture_ms
+        lines.append((f"autosave capture {capture_ms:.3f} ms", self.game.RED if capture_ms >= 1 else self.game.WHITE))
+        text_cache = self.game.text_cache
+        lines.append((f"text cache {text_cache.hit_rate():.1%} hits ({len(text_cache.entries)} surfaces)", self.game.WHITE))
+
+        # Values change every refresh, so they are rendered directly rather than through the text cache
+        rendered = [font.render(text, True, color) for text, color in lines]
+        line_height = font.get_linesize()
+        graph_width, graph_height = self.history, 50
+        width = max([graph_width] + [text.get_width() for text in rendered]) + 10
+        panel = pygame.Surface((width, len(lines) * line_height + graph_height + 15))
+        panel.fill((20, 20, 20))
+        for i, text in enumerate(rendered):
+            panel.blit(text, (5, 5 + i * line_height))
+
+        # Rolling frame-time graph, scaled so the 60 FPS budget sits in the middle
+        graph_top = 10 + len(lines) * line_height
+        scale = graph_height / (2 * self.FRAME_BUDGET_MS)
+        for x, frame_ms in enumerate(times.tolist()):
+            bar = min(graph_height, int(frame_ms * scale))
+            color = self.game.RED if frame_ms > self.FRAME_BUDGET_MS else self.game.GREEN
+            pygame.draw.line(panel, color, (5 + x, graph_top + graph_height), (5 + x, graph_top + graph_height - bar))
+        budget_y = graph_top + graph_height - int(self.FRAME_BUDGET_MS * scale)
+        pygame.draw.line(panel, self.game.YELLOW, (5, budget_y), (5 + graph_width, budget_y))
+        panel.set_alpha(210)
+        return panel
+
+    def draw(self):
+        if not self.enabled:
+            return None
+        now = time.perf_counter()
+        if self.panel is None or now - self.last_refresh >= self.refresh_interval:
+            self.panel = self.build_panel()
+            self.last_refresh = now
+        return self.game.screen.blit(self.panel, (self.game.screen_width - self.panel.get_width() - 10, 70))
@@ -1,10 +1,8 @@
 import pygame
-import os
-import time
 
 class Player:
     def __init__(self, game):
-        self.image = self.load_and_scale_image("player.png", (50, 50))
+        self.image = game.assets.sprite("player.png", (50, 50))
         self.width, self.height = self.image.get_size()
         self.x = (game.screen_width - self.width) // 2
         self.y = game.screen_height - self.height - 10
@@ -16,40 +14,9 @@ class Player:
         self.invulnerable_duration = 5  # Duration in seconds for invulnerability
         self.shield_outline = self.create_shield_outline()
 
-    def load_and_scale_image(self, filename, size):
-        try:
-            return pygame.transform.scale(pygame.image.load(os.path.join("assets", "sprites", filename)).convert_alpha(), size)
-        except pygame.error as e:
-            print(f"Error loading or scaling image '{filename}': {e}")
-            pygame.quit()
-            quit()
-
     def create_shield_outline(self):
-        outline_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        player_mask = pygame.mask.from_surface(self.image)
-        dark_blue = (60, 60 , 180, 255)  # Darker blue for the outline
-
-        for x in range(self.width):
-            for y in range(self.height):
-                if player_mask.get_at((x, y)):
-                    # Check if this pixel is on or near the edge of the shape
-                    for dx in range(-2, 3):  # Check 2 pixels in each direction
-                        for dy in range(-2, 3):
-                            nx, ny = x + dx, y + dy
-                            if 0 <= nx < self.width and 0 <= ny < self.height and not player_mask.get_at((nx, ny)):
-                                # Set color for a thicker outline
-                                outline_surface.set_at((x, y), dark_blue)
-                                for i in range(-1, 2):
-                                    for j in range(-1, 2):
-                                        nx2, ny2 = x + i, y + j
-                                        if 0 <= nx2 < self.width and 0 <= ny2 < self.height:
-                                            outline_surface.set_at((nx2, ny2), dark_blue)
-                                break  # Break after setting one outline pixel to prevent overwriting
-                        else:
-                            continue
-                        break
-
-        return outline_surface    
+        # Built with array dilation and cached on disk, see sprite_outline.py
+        return self.game.assets.outline("player.png", (50, 50))
 
     '''
     Checkpoint 5: moving the player
@@ -75,28 +42,48 @@ class Player:
         Get the current time
         If the key pressed is the space key and (current_time - last_shot_time) is after shoot_interval
         '''
-        current_time = time.time()
+        current_time = self.game.game_clock.now
         if keys[pygame.K_SPACE] and current_time - self.game.bullet_manager.last_shot_time >= self.game.bullet_manager.player_shoot_interval:
             self.game.bullet_manager.add_player_bullet(self.x + self.width // 2, self.y)
             self.game.bullet_manager.last_shot_time = current_time
             self.game.shoot_sound.play()
 
     def draw(self):
-        self.game.screen.blit(self.image, (self.x, self.y))
+        rect = self.game.screen.blit(self.image, (self.x, self.y))
         
         if self.invulnerable:
-            if int(time.time() * 5) % 2 == 0:  # Flash every 0.2 seconds
-                self.game.screen.blit(self.shield_outline, (self.x, self.y))
+            if int(self.game.game_clock.now * 5) % 2 == 0:  # Flash every 0.2 seconds
+                rect = rect.union(self.game.screen.blit(self.shield_outline, (self.x, self.y)))
+        return rect
                 
     def set_invulnerable(self, duration=None):
         self.invulnerable = True
-        self.invulnerable_timer = time.time()
+        self.invulnerable_timer = self.game.game_clock.now
         if duration:
             self.invulnerable_duration = duration
             
+    def get_saved_state(self):
+        now = self.game.game_clock.now
+        return {
+            'lives': self.lives,
+            'x': self.x,
+            'y': self.y,
+            'invulnerable': self.invulnerable,
+            'invulnerable_time': now - self.invulnerable_timer,  # Seconds since it started
+            'invulnerable_duration': self.invulnerable_duration,
+        }
+
+    def restore_saved_state(self, state):
+        self.lives = state['lives']
+        self.x = state['x']
+        self.y = state['y']
+        self.invulnerable = state['invulnerable']
+        self.invulnerable_timer = self.game.game_clock.now - state['invulnerable_time']
+        self.invulnerable_duration = state['invulnerable_duration']
+
     def check_invulnerability(self):
         if self.invulnerable:
-            current_time = time.time()
+            current_time = self.game.game_clock.now
             if current_time - self.invulnerable_timer >= self.invulnerable_duration:
                 self.invulnerable = False
 
@@ -1,6 +1,5 @@
-import time
-import random
 import pygame
+from scripts.game_logic.spatial_grid import points_in_rect
 
 class PowerUpManager:
     def __init__(self, game):
@@ -13,13 +12,11 @@ class PowerUpManager:
         self.current_power_up = None
         self.last_level_check = 1
         self.is_first_level = True 
-        self.paused_time = None 
         
     def update(self):
         if self.game.paused:
-            self.paused_time = time.time()
             return
-        current_time = time.time()
+        current_time = self.game.game_clock.now
         # Only update spawn time if not paused
         if not self.game.paused and not self.power_up_active:
             if not self.power_ups and current_time - self.spawn_time >= self.spawn_interval:
@@ -47,13 +44,11 @@ class PowerUpManager:
             power_up[1] += 2  # Move downwards
             if power_up[1] > self.game.screen_height:
                 self.power_ups.clear()  # Remove power-up if it goes off screen
-                self.power_up_timer = time.time()
-            else:
-                pygame.draw.circle(self.game.screen, self.game.BLUE, (int(power_up[0]), int(power_up[1])), 10)
+                self.power_up_timer = current_time
 
             # Check for collision with player
-            if (self.game.player.x < power_up[0] < self.game.player.x + self.game.player.width and 
-                self.game.player.y < power_up[1] < self.game.player.y + self.game.player.height):
+            if points_in_rect(power_up[0], power_up[1], self.game.player.x, self.game.player.y,
+                              self.game.player.width, self.game.player.height):
                 self.power_ups.clear()
                 self.apply_power_up()
         # Deactivate power-up after duration
@@ -61,17 +56,21 @@ class PowerUpManager:
             if current_time - self.power_up_timer > 5:  # Duration of power-up
                 self.reset_power_up()
 
+    def draw(self):
+        return [pygame.draw.circle(self.game.screen, self.game.BLUE, (int(power_up[0]), int(power_up[1])), 10)
+                for power_up in self.power_ups]
+
     def spawn_power_up(self):
         if not self.power_ups:  # Ensure only one power-up spawns at a time
-            x = random.randint(0, self.game.screen_width - 20)
+            x = self.game.rng.power_ups.randint(0, self.game.screen_width - 20)
             y = 0
             self.power_ups = [[x, y]]
 
     def apply_power_up(self):
         self.power_up_active = True
-        self.power_up_timer = time.time()
+        self.power_up_timer = self.game.game_clock.now
         power_up_types = ['Laser', 'Shield', 'TripleShot']
-        self.current_power_up = random.choice(power_up_types)
+        self.current_power_up = self.game.rng.power_ups.choice(power_up_types)
         if self.current_power_up == 'Laser':
             self.game.bullet_manager.player_bullet_height = 30
             self.game.bullet_manager.player_bullet_speed = 35
@@ -83,25 +82,34 @@ class PowerUpManager:
         self.game.adjust_score(250)  
         self.game.power_up_sound.play()
 
-    def pause_powerups(self):
-        if self.power_up_active and self.paused_time is None:
-            # Record the time at which the game was paused.
-            self.paused_time = time.time()
+    def get_saved_state(self):
+        now = self.game.game_clock.now
+        return {
+            'positions': [list(power_up) for power_up in self.power_ups],
+            'active': self.power_up_active,
+            'type': self.current_power_up,
+            'timer': now - self.power_up_timer,  # Seconds since the power-up was picked up
+            'spawn_time': now - self.spawn_time,  # Seconds since the last spawn
+            'last_level_check': self.last_level_check,
+            'is_first_level': self.is_first_level,
+        }
 
-    def resume_powerups(self):
-        if self.power_up_active and self.paused_time is not None:
-            # Calculate how long the game was paused.
-            paused_duration = time.time() - self.paused_time
-            # Push the expiration time further by the paused duration.
-            self.power_up_timer += paused_duration
-            self.paused_time = None
+    def restore_saved_state(self, state):
+        now = self.game.game_clock.now
+        self.power_ups = [list(power_up) for power_up in state['positions']]
+        self.power_up_active = state['active']
+        self.current_power_up = state['type']
+        self.power_up_timer = now - state['timer']
+        self.spawn_time = now - state['spawn_time']
+        self.last_level_check = state['last_level_check']
+        self.is_first_level = state['is_first_level']
 
     def reset_power_up(self):
         self.power_up_active = False
         self.current_power_up = None
         self.power_ups = []
         self.power_ups.clear()
-        self.spawn_time = time.time()  # Reset the spawn timer
+        self.spawn_time = self.game.game_clock.now  # Reset the spawn timer
         # Reset specific power-up effects
         self.game.bullet_manager.player_bullet_height = 10  # Default bullet height
         self.game.bullet_manager.player_bullet_speed = 7    # Default bullet speed
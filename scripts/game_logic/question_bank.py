@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import sqlite3
+
+QUESTION_CACHE_DIR = "cache"
+
+
+def question_id(question_data):
+    # Stable ID: the one given in the JSON, otherwise derived from the question text
+    if "id" in question_data:
+        return str(question_data["id"])
+    return hashlib.sha1(question_data["question"].encode()).hexdigest()[:12]
+
+
+class ShuffleBag:
+    '''
+    Draws the numbers 0..size-1 in random order without repeats, in O(1).
+
+    This is a Fisher-Yates shuffle done one step at a time: drawing swaps a
+    random remaining position with the last remaining one. Only positions
+    that were ever swapped are stored (in two dicts), so a bag over tens of
+    thousands of questions costs nothing until it is used and reset() is
+    just clearing the dicts.
+    '''
+    def __init__(self, size):
+        self.size = size
+        self.reset()
+
+    def reset(self):
+        self.remaining = self.size
+        self.values = {}  # position -> value, where they differ
+        self.positions = {}  # value -> position, where they differ
+
+    def __len__(self):
+        return self.remaining
+
+    def value_at(self, position):
+        return self.values.get(position, position)
+
+    def position_of(self, value):
+        return self.positions.get(value, value)
+
+    def place(self, position, value):
+        self.values[position] = value
+        self.positions[value] = position
+
+    def take(self, position):
+        # Move the last remaining value into `position` and shrink the bag
+        value = self.value_at(position)
+        last = self.remaining - 1
+        self.place(position, self.value_at(last))
+        self.place(last, value)
+        self.remaining = last
+        return value
+
+    def draw(self, rng):
+        if not self.remaining:
+            return None
+        return self.take(rng.randrange(self.remaining))
+
+    def remove(self, value):
+        """Take a specific value out of the bag (e.g. questions asked before a save)."""
+        if 0 <= value < self.size and self.position_of(value) < self.remaining:
+            self.take(self.position_of(value))
+
+
+class QuestionBank:
+    '''
+    Question storage for ask_cybersecurity_question.
+
+    Questions are written in cybersecurity_questions.json; the first time
+    the game sees a version of that file it copies it into an indexed SQLite
+    database in cache/, and from then on only the rows that are actually
+    asked are read. Rows are numbered 1..n, so a ShuffleBag over 0..n-1
+    picks an unseen question without any list of questions in memory.
+    Saves refer to questions by their stable ID (see question_id).
+    '''
+    def __init__(self, source_path):
+        self.source_path = source_path
+        self.connection = None
+        self.count = 0
+        try:
+            self.open()
+        except (OSError, ValueError, KeyError, sqlite3.Error) as e:
+            print(f"Error loading questions from {source_path}: {e}")
+        self.bag = ShuffleBag(self.count)
+
+    def __len__(self):
+        return self.count
+
+    def database_path(self):
+        return os.path.join(QUESTION_CACHE_DIR, os.path.splitext(os.path.basename(self.source_path))[0] + ".sqlite")
+
+    def open(self):
+        stat = os.stat(self.source_path)
+        source_version = f"{stat.st_size}:{stat.st_mtime_ns}"
+        os.makedirs(QUESTION_CACHE_DIR, exist_ok=True)
+        self.connection = sqlite3.connect(self.database_path())
+        self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'source_version'").fetchone()
+        if row is None or row[0] != source_version:
+            self.rebuild(source_version)
+        self.count = self.connection.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+
+    def rebuild(self, source_version):
+        with open(self.source_path, "r") as file:
+            questions = json.load(file)
+
+        rows = []
+        seen = set()
+        for question_data in questions:
+            uid = question_id(question_data)
+            if uid in seen:
+                print(f"Skipping duplicate question {uid}: {question_data['question']}")
+                continue
+            seen.add(uid)
+            rows.append((len(rows) + 1, uid, question_data["question"],
+                         json.dumps(question_data["options"]), question_data["answer"]))
+
+        with self.connection:
+            self.connection.execute("DROP TABLE IF EXISTS questions")
+            self.connection.execute("CREATE TABLE questions (row INTEGER PRIMARY KEY, id TEXT UNIQUE, "
+                                    "question TEXT, options TEXT, answer TEXT)")
+            self.connection.executemany("INSERT INTO questions VALUES (?, ?, ?, ?, ?)", rows)
+            self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('source_version', ?)", (source_version,))
+
+    def get(self, row):
+        uid, question, options, answer = self.connection.execute(
+            "SELECT id, question, options, answer FROM questions WHERE row = ?", (row,)).fetchone()
+        return {"id": uid, "question": question, "options": json.loads(options), "answer": answer}
+
+    def draw(self, rng):
+        """A question not drawn since the last reset(), or None when all have been asked."""
+        index = self.bag.draw(rng)
+        if index is None:
+            return None
+        return self.get(index + 1)
+
+    def reset(self, asked_ids=()):
+        # New session: every question is back in the bag except `asked_ids`
+        self.bag.reset()
+        if not asked_ids or not self.count:
+            return
+        placeholders = ",".join("?" * len(asked_ids))
+        for row, in self.connection.execute(f"SELECT row FROM questions WHERE id IN ({placeholders})", list(asked_ids)):
+            self.bag.remove(row - 1)
@@ -0,0 +1,92 @@
+from collections import OrderedDict
+import pygame
+
+def wrap_text(text, font, max_width):
+    words = text.split(' ')
+    lines = []
+    current_line = ''
+    for word in words:
+        test_line = current_line + word + ' '
+        if font.size(test_line)[0] <= max_width:
+            current_line = test_line
+        else:
+            lines.append(current_line.strip())
+            current_line = word + ' '
+    lines.append(current_line.strip())
+    return lines
+
+class QuestionLayout:
+    '''
+    A question screen laid out and rendered once.
+
+    The background (question text, every option in white, instructions) is
+    one full-screen surface, and each option also has a highlighted surface.
+    Showing the screen is a single blit; moving the selection repaints only
+    the two option rows that changed.
+    '''
+    def __init__(self, game, question_data):
+        self.game = game
+        screen_width, screen_height = game.screen_width, game.screen_height
+        self.background = pygame.Surface((screen_width, screen_height))
+        self.background.fill(game.BLACK)
+
+        # Question text, wrapped and centred around the upper third
+        line_height = game.big_font.get_linesize()
+        lines = wrap_text(question_data["question"], game.big_font, screen_width - 40)
+        question_y_start = screen_height // 3 - len(lines) * line_height // 2
+        for i, line in enumerate(lines):
+            # Question texts are shown once per session, so they bypass the text cache
+            question_text = game.big_font.render(line, True, game.WHITE)
+            self.background.blit(question_text, (screen_width // 2 - question_text.get_width() // 2, question_y_start + i * line_height))
+
+        # Options: drawn unselected into the background, highlighted versions kept to one side
+        self.option_rects = []
+        self.highlighted = []
+        options_y_start = screen_height // 2
+        for i, option in enumerate(question_data["options"]):
+            option_text = game.font.render(option, True, game.WHITE)
+            position = (screen_width // 2 - option_text.get_width() // 2, options_y_start + i * 40)
+            self.option_rects.append(self.background.blit(option_text, position))
+            self.highlighted.append(game.font.render(option, True, game.GREEN))
+
+        instruction_text = game.text_cache.render(game.font, "Use UP/DOWN to select, ENTER to confirm.", True, game.YELLOW)
+        self.background.blit(instruction_text, (screen_width // 2 - instruction_text.get_width() // 2, screen_height - 50))
+
+    def draw(self, selected_index):
+        """Paint the whole screen; returns the rect to update."""
+        rect = self.game.screen.blit(self.background, (0, 0))
+        self.draw_option(selected_index, True)
+        return rect
+
+    def draw_option(self, index, selected):
+        rect = self.option_rects[index]
+        if selected:
+            # Antialiased text blends with what is under it, so the white option is cleared first
+            self.game.screen.fill(self.game.BLACK, rect)
+            self.game.screen.blit(self.highlighted[index], rect)
+        else:
+            self.game.screen.blit(self.background, rect, rect)
+        return rect
+
+    def change_selection(self, old_index, new_index):
+        """Repaint the two options involved; returns the rects to update."""
+        return [self.draw_option(old_index, False), self.draw_option(new_index, True)]
+
+class QuestionLayoutCache:
+    """The last few laid-out questions, keyed by question ID."""
+    def __init__(self, game, max_entries=8):
+        self.game = game
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def get(self, question_data):
+        key = question_data["id"]
+        layout = self.entries.get(key)
+        if layout is None:
+            layout = QuestionLayout(self.game, question_data)
+            self.entries[key] = layout
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        else:
+            self.entries.move_to_end(key)
+        return layout
@@ -0,0 +1,172 @@
+import json
+import random
+import struct
+import zlib
+import pygame
+import numpy as np
+
+REPLAY_MAGIC = b"SIRP"
+REPLAY_VERSION = 1
+CHECKSUM_INTERVAL = 60  # Steps between state checksums (one second of game time)
+
+# Only these keys affect the simulation; each is one bit of a step's key mask
+TRACKED_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE, pygame.K_ESCAPE)
+KEY_BITS = {key: 1 << bit for bit, key in enumerate(TRACKED_KEYS)}
+
+
+class RecordedKeys:
+    """One step's key mask, read the same way as pygame.key.get_pressed()."""
+    def __init__(self, mask):
+        self.mask = mask
+
+    @staticmethod
+    def mask_of(pressed):
+        mask = 0
+        for key, bit in KEY_BITS.items():
+            if pressed[key]:
+                mask |= bit
+        return mask
+
+    def __getitem__(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+
+class RngStreams:
+    '''
+    One random number stream per subsystem, all derived from a single seed.
+
+    Each subsystem draws from its own stream, so an extra draw in one of them
+    (say a new boss attack) does not shift the numbers every other subsystem
+    gets. The enemy wave uses a NumPy generator, everything else random.Random.
+    '''
+    def __init__(self, seed=None):
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        self.seed = seed
+        enemies, boss, power_ups, minigame, questions = np.random.SeedSequence(seed).spawn(5)
+        self.enemies = np.random.default_rng(enemies)
+        self.boss = random.Random(int(boss.generate_state(1)[0]))
+        self.power_ups = random.Random(int(power_ups.generate_state(1)[0]))
+        self.minigame = random.Random(int(minigame.generate_state(1)[0]))
+        self.questions = random.Random(int(questions.generate_state(1)[0]))
+
+
+def state_checksum(game):
+    """CRC32 over everything the simulation depends on."""
+    enemies = game.enemy_manager
+    values = (
+        game.score, game.level, game.boss_fight, game.player.lives, game.player.x,
+        game.boss.health, game.boss.x, game.boss.y, game.boss.phase, game.boss.rage_mode,
+        enemies.offset_x, enemies.offset_y, enemies.direction,
+        game.power_ups.power_ups, game.power_ups.current_power_up,
+    )
+    crc = zlib.crc32(repr(values).encode())
+    crc = zlib.crc32(enemies.alive.tobytes(), crc)
+    bullet_manager = game.bullet_manager
+    for pool in (bullet_manager.player_bullets, bullet_manager.enemy_bullets, bullet_manager.boss_bullets):
+        crc = zlib.crc32(pool.x[:pool.count].tobytes(), crc)
+        crc = zlib.crc32(pool.y[:pool.count].tobytes(), crc)
+    for barricade in game.barricade_manager.barricades:
+        crc = zlib.crc32(barricade["cells"].tobytes(), crc)
+    return crc
+
+
+class Replay:
+    '''
+    Everything needed to re-run one session: the RNG seed, the game-clock step
+    it started on, the tracked keys of every fixed step, and the outcome of
+    every blocking screen (question answers, minigame results) in order.
+    State checksums taken every `checksum_interval` steps show where a
+    playback stopped matching the recording.
+    '''
+    def __init__(self, seed, start_step, checksum_interval=CHECKSUM_INTERVAL):
+        self.seed = seed
+        self.start_step = start_step
+        self.checksum_interval = checksum_interval
+        self.inputs = bytearray()  # One key mask per step
+        self.outcomes = []  # [step, kind, value]
+        self.checksums = []  # [step, crc]
+        self.playing = False
+        self.step = 0
+        self.next_outcome = 0
+        self.divergences = []  # Steps whose playback checksum did not match
+
+    @property
+    def steps(self):
+        return len(self.inputs)
+
+    @property
+    def finished(self):
+        return self.playing and self.step >= len(self.inputs)
+
+    def keys_for_step(self, pressed):
+        # Recording stores the live keys, playback ignores them and returns the recorded ones
+        if self.playing:
+            mask = self.inputs[self.step]
+        else:
+            mask = RecordedKeys.mask_of(pressed)
+            self.inputs.append(mask)
+        self.step += 1
+        return RecordedKeys(mask)
+
+    def outcome(self, kind, value=None):
+        '''
+        Recording: remember what a blocking screen decided and return it.
+        Playback: return what it decided in the recording instead.
+        '''
+        if not self.playing:
+            self.outcomes.append([self.step, kind, value])
+            return value
+        if self.next_outcome >= len(self.outcomes):
+            self.divergences.append(self.step)
+            return value
+        step, recorded_kind, recorded_value = self.outcomes[self.next_outcome]
+        self.next_outcome += 1
+        if step != self.step or recorded_kind != kind:
+            self.divergences.append(self.step)
+        return recorded_value
+
+    def after_step(self, game):
+        if self.step % self.checksum_interval:
+            return
+        crc = state_checksum(game)
+        if not self.playing:
+            self.checksums.append([self.step, crc])
+        elif self.recorded_checksums.get(self.step, crc) != crc:
+            self.divergences.append(self.step)
+
+    def save(self, path):
+        header = json.dumps({
+            "seed": self.seed,
+            "start_step": self.start_step,
+            "checksum_interval": self.checksum_interval,
+            "outcomes": self.outcomes,
+            "checksums": self.checksums,
+        }).encode()
+        payload = struct.pack("<I", len(header)) + header + bytes(self.inputs)
+        with open(path, "wb") as f:
+            f.write(REPLAY_MAGIC + struct.pack("<B", REPLAY_VERSION) + zlib.compress(payload, 9))
+
+    @classmethod
+    def load(cls, path):
+        """Read a replay for playback. Raises ValueError for files that are not replays."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[:4] != REPLAY_MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        if data[4] != REPLAY_VERSION:
+            raise ValueError(f"{path} has replay version {data[4]}, expected {REPLAY_VERSION}")
+        payload = zlib.decompress(data[5:])
+        header_length, = struct.unpack_from("<I", payload)
+        header = json.loads(payload[4:4 + header_length])
+
+        replay = cls(header["seed"], header["start_step"], header["checksum_interval"])
+        replay.inputs = bytearray(payload[4 + header_length:])
+        replay.outcomes = header["outcomes"]
+        replay.checksums = header["checksums"]
+        replay.recorded_checksums = {step: crc for step, crc in replay.checksums}
+        replay.playing = True
+        return replay
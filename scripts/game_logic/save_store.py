@@ -0,0 +1,176 @@
+import json
+import os
+import tempfile
+from scripts.game_logic.snapshot import encode, decode, to_json
+
+LEGACY_SAVE_FILE = "saves.json"  # Every slot in one file, written by older versions
+
+def write_atomic(path, data):
+    '''
+    Write `data` (bytes) to path so that a crash leaves either the old file or
+    the new one, never half of each: the data goes to a temporary file in the
+    same folder first and is then renamed over the old file.
+    '''
+    folder = os.path.dirname(path) or "."
+    fd, temp_path = tempfile.mkstemp(dir=folder, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+class SaveStore:
+    '''
+    Save slots on disk, one file per slot plus a small index.
+
+    saves/slot_<n>.snap holds a whole save as a binary snapshot (see
+    snapshot.py), saves/index.json only what the
+    slot menus show (name, level, lives, score, time). Saving or deleting a
+    slot rewrites that slot's file and the index and nothing else; both are
+    written with write_atomic. The slot file is always written before the
+    index, and each index entry records the modification time of the file
+    it describes, so after a crash load_index() can tell which entries are
+    stale and rebuilds them from the slot files.
+    '''
+    def __init__(self, folder="saves", slot_count=3, compress=True):
+        self.folder = folder
+        self.slot_count = slot_count
+        self.compress = compress  # zlib the snapshots; smaller, slightly more CPU
+        self.slots = [None] * slot_count  # Index entry per slot, None when empty
+
+    def slot_path(self, slot):
+        return os.path.join(self.folder, f"slot_{slot}.snap")
+
+    @property
+    def index_path(self):
+        return os.path.join(self.folder, "index.json")
+
+    def summary(self, slot, save_data):
+        # The part of a save the menus need, plus the slot file it was taken from
+        return {
+            'name': save_data['name'],
+            'level': "BOSS" if save_data['boss_fight'] else save_data['level'],
+            'lives': save_data['player']['lives'],
+            'score': save_data['score'],
+            'timestamp': save_data['timestamp'],
+            'mtime': os.stat(self.slot_path(slot)).st_mtime_ns,
+        }
+
+    def load_index(self):
+        """Read the index (migrating an old saves.json the first time) and return the slot list."""
+        if not os.path.exists(self.index_path) and os.path.exists(LEGACY_SAVE_FILE):
+            self.migrate_legacy_file()
+
+        try:
+            with open(self.index_path, 'r') as f:
+                slots = json.load(f)
+            slots = (slots + [None] * self.slot_count)[:self.slot_count]
+        except (OSError, ValueError):
+            slots = [None] * self.slot_count
+
+        # Make the index agree with the slot files that are really there
+        changed = False
+        for slot in range(self.slot_count):
+            try:
+                mtime = os.stat(self.slot_path(slot)).st_mtime_ns
+            except OSError:
+                mtime = None
+            if slots[slot] and mtime is None:
+                slots[slot] = None
+                changed = True
+            elif mtime is not None and (not slots[slot] or slots[slot].get('mtime') != mtime):
+                try:
+                    slots[slot] = self.summary(slot, self.load(slot))
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    print(f"Ignoring unreadable save slot {slot + 1}: {e}")
+                    continue
+                changed = True
+        self.slots[:] = slots  # In place, the game holds on to this list
+        if changed:
+            self.write_index()
+        return self.slots
+
+    def migrate_legacy_file(self):
+        try:
+            with open(LEGACY_SAVE_FILE, 'r') as f:
+                legacy_saves = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading {LEGACY_SAVE_FILE}: {e}")
+            return
+        os.makedirs(self.folder, exist_ok=True)
+        for slot, save_data in enumerate(legacy_saves[:self.slot_count]):
+            if save_data:
+                write_atomic(self.slot_path(slot), encode(save_data, self.compress))
+        # The index is rebuilt from the slot files by load_index
+
+    def write_index(self):
+        os.makedirs(self.folder, exist_ok=True)
+        write_atomic(self.index_path, json.dumps(self.slots).encode())
+
+    def save(self, slot, save_data):
+        """Write one slot. Raises OSError."""
+        os.makedirs(self.folder, exist_ok=True)
+        write_atomic(self.slot_path(slot), encode(save_data, self.compress))
+        self.slots[slot] = self.summary(slot, save_data)
+        self.write_index()
+
+    def load(self, slot):
+        """Full save data of one slot. Raises OSError or ValueError."""
+        with open(self.slot_path(slot), 'rb') as f:
+            return decode(f.read())
+
+    def export_json(self, slot, path):
+        """Write one slot as readable JSON. Raises OSError or ValueError."""
+        with open(path, 'w') as f:
+            f.write(to_json(self.load(slot)))
+
+    def delete(self, slot):
+        """Empty one slot. Raises OSError."""
+        try:
+            os.remove(self.slot_path(slot))
+        except FileNotFoundError:
+            pass
+        self.slots[slot] = None
+        self.write_index()
+
+    def delete_all(self):
+        for slot in range(self.slot_count):
+            try:
+                os.remove(self.slot_path(slot))
+            except FileNotFoundError:
+                pass
+        self.slots[:] = [None] * self.slot_count
+        self.write_index()
+
+    '''
+    The autosave lives next to the slots in saves/autosave.snap and is not
+    part of the index; Autosave writes it from its worker thread.
+    '''
+    @property
+    def autosave_path(self):
+        return os.path.join(self.folder, "autosave.snap")
+
+    def has_autosave(self):
+        return os.path.exists(self.autosave_path)
+
+    def save_autosave(self, save_data):
+        os.makedirs(self.folder, exist_ok=True)
+        write_atomic(self.autosave_path, encode(save_data, self.compress))
+
+    def load_autosave(self):
+        """Raises OSError or ValueError."""
+        with open(self.autosave_path, 'rb') as f:
+            return decode(f.read())
+
+    def delete_autosave(self):
+        try:
+            os.remove(self.autosave_path)
+        except FileNotFoundError:
+            pass
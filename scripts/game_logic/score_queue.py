@@ -0,0 +1,143 @@
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+import requests
+
+class ScoreQueue:
+    '''
+    Scores waiting to be uploaded to the leaderboard.
+
+    put() only writes the score to a small SQLite file (committed before it
+    returns, so it survives a crash or power cut) and wakes the worker
+    thread. The worker sends the oldest scores in batches of up to
+    `batch_size`, deleting them once the server has accepted them. When the
+    server can't be reached it waits before trying again, doubling the wait
+    after every failure up to `max_delay`, so a cabinet that was offline for
+    days sends its whole backlog in a few bulk requests once it is back.
+    Every score has an ID, which lets the server skip a batch it already
+    stored when only the reply got lost.
+    '''
+    def __init__(self, client, path=os.path.join("saves", "score_queue.sqlite"), batch_size=500,
+                 base_delay=2, max_delay=300):
+        self.client = client
+        self.path = path
+        self.batch_size = batch_size
+        self.base_delay = base_delay  # Seconds before the first retry
+        self.max_delay = max_delay
+        self.delay = base_delay
+        self.retry_at = 0  # time.monotonic() before which the worker stays idle
+        self.connection = None  # Opened on first use, simulated sessions never touch the disk
+        self.lock = threading.Lock()
+        self.condition = threading.Condition()
+        self.pending = 0
+        self.sending = False
+        self.last_error = None
+        self.thread = None
+        # requests.Session isn't documented as thread-safe, so uploads don't share the leaderboard fetch's
+        self.session = requests.Session()
+        self.session.auth = client.session.auth
+
+    def open(self):
+        with self.lock:
+            if self.connection is not None:
+                return
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            with self.connection:
+                self.connection.execute("CREATE TABLE IF NOT EXISTS queue (seq INTEGER PRIMARY KEY, id TEXT NOT NULL, "
+                                        "player TEXT NOT NULL, score INTEGER NOT NULL, submitted REAL NOT NULL)")
+            self.pending = self.connection.execute("SELECT COUNT(*) FROM queue").fetchone()[0]
+
+    def start(self):
+        """Open the queue and start uploading anything left from earlier sessions."""
+        self.open()
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run_worker, daemon=True)
+            self.thread.start()
+
+    def put(self, name, score):
+        self.start()
+        with self.condition:
+            # Counted under the same condition the worker checks, so it never sees the row without the count
+            with self.lock, self.connection:
+                self.connection.execute("INSERT INTO queue (id, player, score, submitted) VALUES (?, ?, ?, ?)",
+                                        (uuid.uuid4().hex, name, int(score), time.time()))
+            self.pending += 1
+            self.condition.notify_all()
+
+    def next_batch(self):
+        with self.lock:
+            rows = self.connection.execute("SELECT seq, id, player, score, submitted FROM queue ORDER BY seq LIMIT ?",
+                                           (self.batch_size,)).fetchall()
+        scores = [{"id": submission_id, "player_name": player, "score": score, "submitted": submitted}
+                  for _, submission_id, player, score, submitted in rows]
+        return (rows[-1][0] if rows else None), scores
+
+    def run_worker(self):
+        while True:
+            with self.condition:
+                # New scores don't cut a backoff short, the server gets the whole backlog at retry_at
+                while self.pending == 0 or time.monotonic() < self.retry_at:
+                    timeout = None if self.pending == 0 else self.retry_at - time.monotonic()
+                    self.condition.wait(timeout)
+                self.sending = True
+            try:
+                self.send_batch()
+            except Exception as e:
+                # Anything unexpected (a damaged queue file, a bad reply) is retried later like a network error
+                self.back_off(e)
+            finally:
+                with self.condition:
+                    self.sending = False
+                    self.condition.notify_all()
+
+    def send_batch(self):
+        last_seq, scores = self.next_batch()
+        if not scores:
+            with self.condition:
+                self.pending = 0  # Nothing left in the file, the count had drifted
+            return
+        try:
+            self.client.submit_batch(scores, self.session)
+        except requests.RequestException as e:
+            status = e.response.status_code if e.response is not None else None
+            if status is not None and 400 <= status < 500 and status not in (401, 408, 429):
+                # The server will never take this batch, don't let it block the queue forever
+                print(f"Leaderboard rejected {len(scores)} queued score(s): {e}")
+                self.remove_through(last_seq)
+            else:
+                self.back_off(e)
+        else:
+            self.remove_through(last_seq)
+            self.delay = self.base_delay
+            self.last_error = None
+
+    def remove_through(self, last_seq):
+        with self.lock, self.connection:
+            removed = self.connection.execute("DELETE FROM queue WHERE seq <= ?", (last_seq,)).rowcount
+        with self.condition:
+            self.pending -= removed
+
+    def back_off(self, error):
+        self.last_error = str(error)
+        print(f"Leaderboard upload failed, retrying in {self.delay:.0f}s: {error}")
+        # A little jitter so cabinets that lost the same network don't all come back in step
+        with self.condition:
+            self.retry_at = time.monotonic() + self.delay * random.uniform(0.8, 1.0)
+        self.delay = min(self.delay * 2, self.max_delay)
+
+    def wait(self, timeout=None):
+        """Block until the queue is empty (or the timeout passes); returns True if it emptied."""
+        end = None if timeout is None else time.monotonic() + timeout
+        with self.condition:
+            while self.pending or self.sending:
+                remaining = None if end is None else end - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+        return True
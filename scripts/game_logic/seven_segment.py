@@ -0,0 +1,194 @@
+import threading
+import time
+from collections import deque
+
+'''
+Wiring of the cabinet's 4-digit 7-segment display and status LEDs (BCM numbers).
+The display is common anode: a segment pin lights its segment when LOW, a
+digit pin selects its digit when HIGH.
+'''
+SEGMENT_PINS = (4, 18, 24, 23, 22, 17, 27)  # a, b, c, d, e, f, g
+DIGIT_PINS = (5, 26, 25, 16)  # D1 (leftmost) to D4
+GREEN_LED_PIN = 20
+RED_LED_PIN = 21
+DISPLAY_PINS = SEGMENT_PINS + DIGIT_PINS  # Bit k of a pin word is the level of DISPLAY_PINS[k]
+
+# Segments lit by each digit, bit 0 = a ... bit 6 = g
+DIGIT_SEGMENTS = (0b0111111, 0b0000110, 0b1011011, 0b1001111, 0b1100110,
+                  0b1101101, 0b1111101, 0b0000111, 0b1111111, 0b1101111)
+
+SEGMENT_MASK = (1 << len(SEGMENT_PINS)) - 1
+DIGIT_MASK = ((1 << len(DIGIT_PINS)) - 1) << len(SEGMENT_PINS)
+BLANK = SEGMENT_MASK  # Every segment HIGH (off) and no digit selected
+
+def pin_word(position, digit):
+    """Levels of every display pin while `digit` is shown at `position`."""
+    return (~DIGIT_SEGMENTS[digit] & SEGMENT_MASK) | (1 << (len(SEGMENT_PINS) + position))
+
+def plan_writes(old, new):
+    '''
+    The output calls that take the pins from word `old` to word `new`, one
+    call per group of pins that changed: digits switching off first, then
+    the segments, then the digit switching on, so the old digit never
+    flashes the new digit's pattern.
+    '''
+    changed = old ^ new
+    writes = []
+    for group in (changed & DIGIT_MASK & ~new, changed & SEGMENT_MASK, changed & DIGIT_MASK & new):
+        bits = [k for k in range(len(DISPLAY_PINS)) if group >> k & 1]
+        if bits:
+            writes.append((tuple(DISPLAY_PINS[k] for k in bits), tuple(new >> k & 1 for k in bits)))
+    return tuple(writes)
+
+class RPiGPIO:
+    """The real pins, through RPi.GPIO (only importable on a Raspberry Pi)."""
+    def __init__(self):
+        import RPi.GPIO as GPIO
+        GPIO.setwarnings(False)
+        GPIO.setmode(GPIO.BCM)
+        self.gpio = GPIO
+
+    def setup(self, channels, initial):
+        self.gpio.setup(list(channels), self.gpio.OUT, initial=initial)
+
+    def output(self, channels, values):
+        self.gpio.output(list(channels), list(values))
+
+    def cleanup(self):
+        self.gpio.cleanup()
+
+class SimulatedGPIO:
+    '''
+    Stand-in for RPi.GPIO on any machine. Keeps the level of every pin,
+    counts output calls and pin writes, and logs the last `log_size` writes
+    as (time, pin, level) so the refresh timing can be checked.
+    '''
+    def __init__(self, log_size=10000):
+        self.levels = {}
+        self.calls = 0
+        self.pin_writes = 0
+        self.log = deque(maxlen=log_size)
+
+    def setup(self, channels, initial):
+        for pin in channels:
+            self.levels[pin] = initial
+
+    def output(self, channels, values):
+        now = time.perf_counter()
+        self.calls += 1
+        self.pin_writes += len(channels)
+        for pin, value in zip(channels, values):
+            self.levels[pin] = value
+            self.log.append((now, pin, value))
+
+    def cleanup(self):
+        self.levels.clear()
+
+    def shown(self):
+        # (position, digit) the display is lighting right now, None when blank or not a digit
+        positions = [i for i, pin in enumerate(DIGIT_PINS) if self.levels.get(pin)]
+        segments = sum(1 << s for s, pin in enumerate(SEGMENT_PINS) if self.levels.get(pin) == 0)
+        if len(positions) != 1 or segments not in DIGIT_SEGMENTS:
+            return None
+        return positions[0], DIGIT_SEGMENTS.index(segments)
+
+class SevenSegmentDisplay:
+    '''
+    Multiplexed 4-digit display, refreshed from its own thread.
+
+    The pin levels for every (position, digit) are worked out once up front,
+    and the output calls for going from one to the next are planned on
+    first use and kept, so a refresh step is a dictionary lookup and at most
+    three output calls touching only the pins that changed. Steps run on a
+    fixed schedule (sleeping, not spinning, between them); the achieved
+    refresh rate and the thread's CPU use are measured as it runs.
+    '''
+    def __init__(self, gpio, refresh_hz=250):
+        self.gpio = gpio
+        self.refresh_hz = refresh_hz  # Whole-display refreshes per second, each digit is lit once per refresh
+        self.step_interval = 1.0 / (refresh_hz * len(DIGIT_PINS))
+        self.words = [[pin_word(position, digit) for digit in range(10)] for position in range(len(DIGIT_PINS))]
+        self.transitions = {}
+        self.word = BLANK
+        self.number = 0
+        self.digits = (0, 0, 0, 0)
+        self.position = 0
+        self.running = False
+        self.thread = None
+        # Measurements, updated by the refresh thread
+        self.steps = 0
+        self.late_steps = 0
+        self.elapsed = 0.0
+        self.cpu_time = 0.0
+        gpio.setup(SEGMENT_PINS, 1)
+        gpio.setup(DIGIT_PINS, 0)
+        gpio.setup((GREEN_LED_PIN, RED_LED_PIN), 0)
+
+    def set_number(self, number):
+        """Show `number` (clamped to 0-9999); cheap enough to call every frame."""
+        number = max(0, min(9999, int(number)))
+        if number != self.number:
+            self.number = number
+            # One tuple swap, the refresh thread never sees half an update
+            self.digits = (number // 1000, number // 100 % 10, number // 10 % 10, number % 10)
+
+    def set_leds(self, green, red):
+        self.gpio.output((GREEN_LED_PIN, RED_LED_PIN), (int(green), int(red)))
+
+    def show_word(self, new):
+        writes = self.transitions.get((self.word, new))
+        if writes is None:
+            writes = self.transitions[(self.word, new)] = plan_writes(self.word, new)
+        for channels, values in writes:
+            self.gpio.output(channels, values)
+        self.word = new
+
+    def step(self):
+        """Light the next digit."""
+        position = self.position
+        self.show_word(self.words[position][self.digits[position]])
+        self.position = (position + 1) % len(DIGIT_PINS)
+
+    def run(self):
+        interval = self.step_interval
+        start = next_step = time.perf_counter()
+        cpu_start = time.thread_time()
+        while self.running:
+            self.step()
+            self.steps += 1
+            next_step += interval
+            now = time.perf_counter()
+            self.elapsed = now - start
+            self.cpu_time = time.thread_time() - cpu_start
+            if next_step > now:
+                time.sleep(next_step - now)
+            elif now - next_step > interval:
+                # More than a step behind (the thread was not scheduled), restart the schedule from now
+                self.late_steps += 1
+                next_step = now
+        self.show_word(BLANK)
+
+    def start(self):
+        if self.thread is None:
+            self.running = True
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def cleanup(self):
+        self.stop()
+        self.gpio.cleanup()
+
+    def stats(self):
+        elapsed = self.elapsed or 1e-9
+        return {
+            "refresh_hz": self.steps / len(DIGIT_PINS) / elapsed,
+            "target_hz": self.refresh_hz,
+            "late_steps": self.late_steps,
+            "cpu_percent": 100 * self.cpu_time / elapsed,
+        }
@@ -0,0 +1,122 @@
+import json
+import struct
+import zlib
+import numpy as np
+
+SNAPSHOT_MAGIC = b"SISN"
+SNAPSHOT_VERSION = 1
+FLAG_COMPRESSED = 1
+
+'''
+Binary game state snapshots.
+
+A snapshot is any nested dict/list of plain values in which the bulky parts
+(bullet columns, alive masks, barricade cells) are NumPy arrays. The plain
+values go into a small JSON header; every array is replaced there by its
+dtype and shape and its raw little-endian bytes are appended after the
+header. Boolean arrays are bit-packed. The payload is optionally zlib
+compressed:
+
+    magic "SISN" | version (u8) | flags (u8) | payload
+    payload = header length (u32) | JSON header | array bytes ...
+
+Every manager provides get_saved_state() / restore_saved_state(state) using
+this shape, so one encoder handles all of them.
+'''
+
+def split_arrays(value, arrays):
+    # Copy of value with every array swapped for a reference into `arrays`
+    if isinstance(value, np.ndarray):
+        arrays.append(value)
+        return {"__array__": len(arrays) - 1, "dtype": value.dtype.str, "shape": list(value.shape)}
+    if isinstance(value, dict):
+        return {key: split_arrays(item, arrays) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [split_arrays(item, arrays) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def join_arrays(value, arrays):
+    if isinstance(value, dict):
+        if "__array__" in value:
+            return arrays[value["__array__"]]
+        return {key: join_arrays(item, arrays) for key, item in value.items()}
+    if isinstance(value, list):
+        return [join_arrays(item, arrays) for item in value]
+    return value
+
+def array_bytes(array):
+    if array.dtype == bool:
+        return np.packbits(array, axis=None).tobytes()
+    return np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<")).tobytes()
+
+def encode(state, compress=True):
+    arrays = []
+    header = split_arrays(state, arrays)
+    blobs = [array_bytes(array) for array in arrays]
+    header = json.dumps({"state": header, "sizes": [len(blob) for blob in blobs]}).encode()
+    payload = struct.pack("<I", len(header)) + header + b"".join(blobs)
+    if compress:
+        payload = zlib.compress(payload, 6)
+    return SNAPSHOT_MAGIC + struct.pack("<BB", SNAPSHOT_VERSION, FLAG_COMPRESSED if compress else 0) + payload
+
+def decode(data):
+    """State dict from encode(). Raises ValueError for data that is not a snapshot this version can read."""
+    try:
+        return decode_snapshot(data)
+    except (struct.error, zlib.error, KeyError, TypeError) as e:
+        raise ValueError(f"damaged snapshot: {e}")
+
+def decode_snapshot(data):
+    if data[:4] != SNAPSHOT_MAGIC:
+        raise ValueError("not a game snapshot")
+    version, flags = struct.unpack_from("<BB", data, 4)
+    if version > SNAPSHOT_VERSION:
+        raise ValueError(f"snapshot version {version} is newer than this game ({SNAPSHOT_VERSION})")
+    payload = data[6:]
+    if flags & FLAG_COMPRESSED:
+        payload = zlib.decompress(payload)
+    header_length, = struct.unpack_from("<I", payload)
+    header = json.loads(payload[4:4 + header_length])
+
+    arrays = []
+    offset = 4 + header_length
+    for size, ref in zip(header["sizes"], array_refs(header["state"])):
+        blob = payload[offset:offset + size]
+        offset += size
+        dtype = np.dtype(ref["dtype"])
+        shape = tuple(ref["shape"])
+        if dtype == bool:
+            count = int(np.prod(shape))
+            array = np.unpackbits(np.frombuffer(blob, dtype=np.uint8), count=count).astype(bool)
+        else:
+            array = np.frombuffer(blob, dtype=dtype.newbyteorder("<")).astype(dtype)
+        arrays.append(array.reshape(shape))
+    return join_arrays(header["state"], arrays)
+
+def array_refs(value):
+    # Array placeholders of a header in the order encode() wrote them
+    refs = []
+    def walk(item):
+        if isinstance(item, dict):
+            if "__array__" in item:
+                refs.append(item)
+                return
+            for child in item.values():
+                walk(child)
+        elif isinstance(item, list):
+            for child in item:
+                walk(child)
+    walk(value)
+    return sorted(refs, key=lambda ref: ref["__array__"])
+
+def to_json(state):
+    """Readable JSON export of a snapshot's state, arrays written out as lists."""
+    def plain(value):
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        if isinstance(value, np.generic):
+            return value.item()
+        raise TypeError(f"{type(value).__name__} is not JSON serializable")
+    return json.dumps(state, indent=2, default=plain)
@@ -0,0 +1,114 @@
+import math
+import numpy as np
+
+def points_in_rect(xs, ys, left, top, width, height):
+    # Strict inside test used by every hitbox in the game (works on scalars and arrays)
+    return (left < xs) & (xs < left + width) & (top < ys) & (ys < top + height)
+
+class SpatialGrid:
+    """
+    Uniform-grid (spatial hash) broadphase over a set of points.
+
+    rebuild() sorts the points by cell, so every cell bucket is a contiguous
+    run of `order`. Queries only visit the buckets of the cells around the
+    query area and finish with an exact test on squared distances, which keeps
+    collision checks close to O(n) instead of comparing every pair.
+    """
+    KEY_STRIDE = 1 << 20
+    KEY_BIAS = 1 << 19  # Keeps off-screen (negative) cells from aliasing other cells
+
+    def __init__(self, cell_size=32):
+        self.cell_size = cell_size
+        self.xs = np.zeros(0)
+        self.ys = np.zeros(0)
+        self.order = np.zeros(0, dtype=np.int64)
+        self.sorted_keys = np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.xs)
+
+    def cell_of(self, xs, ys):
+        cx = np.floor_divide(xs, self.cell_size).astype(np.int64)
+        cy = np.floor_divide(ys, self.cell_size).astype(np.int64)
+        return cx, cy
+
+    def cell_key(self, cx, cy):
+        return (cx + self.KEY_BIAS) * self.KEY_STRIDE + (cy + self.KEY_BIAS)
+
+    def rebuild(self, xs, ys):
+        """Bucket the given points (NumPy arrays) by cell."""
+        self.xs = np.array(xs, dtype=float)  # Copy, the grid must not move with the pool
+        self.ys = np.array(ys, dtype=float)
+        keys = self.cell_key(*self.cell_of(self.xs, self.ys))
+        self.order = np.argsort(keys, kind="stable")
+        self.sorted_keys = keys[self.order]
+        return self
+
+    def bucket(self, cx, cy):
+        key = self.cell_key(cx, cy)
+        start = np.searchsorted(self.sorted_keys, key, side="left")
+        end = np.searchsorted(self.sorted_keys, key, side="right")
+        return self.order[start:end]
+
+    def candidates_in_cells(self, min_cx, min_cy, max_cx, max_cy):
+        buckets = [self.bucket(cx, cy)
+                   for cx in range(min_cx, max_cx + 1)
+                   for cy in range(min_cy, max_cy + 1)]
+        return np.concatenate(buckets) if buckets else self.order[:0]
+
+    def query_rect(self, left, top, width, height):
+        """Indices of the points strictly inside the rectangle."""
+        if not len(self):
+            return self.order[:0]
+        min_cx, min_cy = (int(v) for v in self.cell_of(left, top))
+        max_cx, max_cy = (int(v) for v in self.cell_of(left + width, top + height))
+        candidates = self.candidates_in_cells(min_cx, min_cy, max_cx, max_cy)
+        inside = points_in_rect(self.xs[candidates], self.ys[candidates], left, top, width, height)
+        return candidates[inside]
+
+    def query_radius(self, x, y, radius):
+        """Indices of the points closer than `radius` to (x, y)."""
+        if not len(self):
+            return self.order[:0]
+        min_cx, min_cy = (int(v) for v in self.cell_of(x - radius, y - radius))
+        max_cx, max_cy = (int(v) for v in self.cell_of(x + radius, y + radius))
+        candidates = self.candidates_in_cells(min_cx, min_cy, max_cx, max_cy)
+        dist_sq = (self.xs[candidates] - x) ** 2 + (self.ys[candidates] - y) ** 2
+        return candidates[dist_sq < radius * radius]
+
+    def pairs_within(self, xs, ys, radius):
+        '''
+        Find every (query point, grid point) pair closer than `radius`.
+        Returns two index arrays: into the query points and into the grid points.
+        All query points are looked up at once, one neighbouring cell offset at a time.
+        '''
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if not len(self) or not len(xs):
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        cx, cy = self.cell_of(xs, ys)
+        span = max(1, math.ceil(radius / self.cell_size))
+        query_parts, grid_parts = [], []
+        for ox in range(-span, span + 1):
+            for oy in range(-span, span + 1):
+                keys = self.cell_key(cx + ox, cy + oy)
+                start = np.searchsorted(self.sorted_keys, keys, side="left")
+                counts = np.searchsorted(self.sorted_keys, keys, side="right") - start
+                total = int(counts.sum())
+                if not total:
+                    continue
+                # Expand every query point into one row per point in its bucket
+                query_idx = np.repeat(np.arange(len(xs)), counts)
+                run_start = np.repeat(np.cumsum(counts) - counts, counts)
+                grid_idx = self.order[np.repeat(start, counts) + np.arange(total) - run_start]
+                query_parts.append(query_idx)
+                grid_parts.append(grid_idx)
+        if not query_parts:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        query_idx = np.concatenate(query_parts)
+        grid_idx = np.concatenate(grid_parts)
+        dist_sq = (xs[query_idx] - self.xs[grid_idx]) ** 2 + (ys[query_idx] - self.ys[grid_idx]) ** 2
+        close = dist_sq < radius * radius
+        return query_idx[close], grid_idx[close]
@@ -0,0 +1,82 @@
+import hashlib
+import os
+import pygame
+import numpy as np
+
+OUTLINE_CACHE_DIR = os.path.join("cache", "outlines")
+SHIELD_BLUE = (60, 60, 180, 255)  # Darker blue for the outline
+
+
+def dilate(cells, radius):
+    '''
+    Grow every True cell of a 2D boolean array into a (2*radius+1) square.
+    Cells outside the array count as False.
+    '''
+    width, height = cells.shape
+    padded = np.pad(cells, radius)
+    grown = np.zeros_like(cells)
+    for dx in range(2 * radius + 1):
+        for dy in range(2 * radius + 1):
+            grown |= padded[dx:dx + width, dy:dy + height]
+    return grown
+
+
+def outline_cells(solid, edge_radius=2, thickness=1):
+    '''
+    Which pixels of the outline are set, given the sprite's solid pixels.
+    A solid pixel is on the edge when a transparent pixel is within
+    edge_radius of it; the edge is then thickened by `thickness` pixels.
+    '''
+    edge = solid & dilate(~solid, edge_radius)
+    return dilate(edge, thickness)
+
+
+def solid_pixels(image):
+    # Same rule as pygame.mask.from_surface: alpha above 127 is solid
+    return pygame.surfarray.array_alpha(image) > 127
+
+
+def build_outline(image, color=SHIELD_BLUE):
+    outline = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+    cells = outline_cells(solid_pixels(image))
+    pixels = pygame.surfarray.pixels3d(outline)
+    alpha = pygame.surfarray.pixels_alpha(outline)
+    pixels[cells] = color[:3]
+    alpha[cells] = color[3]
+    del pixels, alpha  # Release the surface lock
+    return outline
+
+
+def outline_cache_path(sprite_path, size, color):
+    with open(sprite_path, "rb") as f:
+        sprite_hash = hashlib.sha1(f.read()).hexdigest()[:16]
+    color_name = "".join(f"{channel:02x}" for channel in color)
+    return os.path.join(OUTLINE_CACHE_DIR, f"{sprite_hash}_{size[0]}x{size[1]}_{color_name}.png")
+
+
+def load_outline(sprite_path, image, color=SHIELD_BLUE):
+    '''
+    Outline for a sprite loaded from sprite_path and scaled to image's size.
+    Outlines are cached on disk under the sprite file's hash and size, so
+    only the first launch (or a changed sprite) has to build one.
+    '''
+    try:
+        cache_path = outline_cache_path(sprite_path, image.get_size(), color)
+    except OSError as e:
+        print(f"Error reading sprite '{sprite_path}' for its outline: {e}")
+        return build_outline(image, color)
+
+    if os.path.exists(cache_path):
+        try:
+            outline = pygame.image.load(cache_path)
+            return outline.convert_alpha() if pygame.display.get_surface() is not None else outline
+        except pygame.error as e:
+            print(f"Error loading cached outline '{cache_path}': {e}")
+
+    outline = build_outline(image, color)
+    try:
+        os.makedirs(OUTLINE_CACHE_DIR, exist_ok=True)
+        pygame.image.save(outline, cache_path)
+    except (OSError, pygame.error) as e:
+        print(f"Error caching outline '{cache_path}': {e}")
+    return outline
@@ -0,0 +1,43 @@
+from collections import OrderedDict
+
+class TextCache:
+    """
+    Size-bounded LRU cache of rendered text surfaces, shared by every screen.
+
+    Most on-screen strings (menu items, labels, the minigame grid) are the same
+    every frame, so they are rendered once and reused. Returned surfaces are
+    shared: blit them, never draw on them.
+    """
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Same arguments as font.render, with the font first."""
+        key = (font, text, antialias, tuple(color))
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)  # Evict the least recently used text
+        return surface
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self.entries.clear()
+        self.reset_stats()
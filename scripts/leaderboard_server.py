@@ -0,0 +1,184 @@
+'''
+Local leaderboard server.
+
+Serves the endpoints the game and scripts/clear_leaderboard.py talk to, from
+a SQLite file, so a cabinet with no network (or a development machine) can
+run its own leaderboard:
+
+    python -m scripts.leaderboard_server
+    python -m scripts.leaderboard_server --port 8000 --user admin --password secret
+
+    GET    /leaderboard?limit=10   -> [{"player": "ABC", "score": 5000}, ...] (with an ETag)
+    GET    /rank?score=4200        -> {"rank": 3}
+    POST   /submit_score           {"player_name": "ABC", "score": 5000} -> {"rank": 1}
+    POST   /submit_scores          {"scores": [{"id": "...", "player_name": "ABC", "score": 5000,
+                                                "submitted": 1700000000.0}, ...]}
+                                   -> {"added": 1, "duplicates": 0, "rejected": 0}
+    DELETE /delete_all_scores      -> {"message": "..."}
+
+With --user/--password (or LEADERBOARD_USER/LEADERBOARD_PASSWORD) every
+request needs HTTP Basic authentication, like the old hosted server.
+'''
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from scripts.game_logic.leaderboard_store import LeaderboardStore
+
+MAX_LIMIT = 100
+MAX_BODY = 1024 * 1024  # Room for a full batch from the game's offline queue
+
+
+class LeaderboardHandler(BaseHTTPRequestHandler):
+    store = None
+    credentials = None  # Expected "user:password", or None for an open server
+
+    def send_json(self, status, data, etag=False):
+        body = json.dumps(data).encode()
+        if etag:
+            # Clients that already have this exact board get a bodyless 304
+            tag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+            if self.headers.get("If-None-Match") == tag:
+                self.send_response(304)
+                self.send_header("ETag", tag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", tag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def authorized(self):
+        if self.credentials is None:
+            return True
+        header = self.headers.get("Authorization", "")
+        if not header.startswith("Basic "):
+            return False
+        try:
+            given = base64.b64decode(header[6:]).decode()
+        except (ValueError, UnicodeDecodeError):
+            return False
+        return hmac.compare_digest(given, self.credentials)
+
+    def check_auth(self):
+        if self.authorized():
+            return True
+        self.send_response(401)
+        self.send_header("WWW-Authenticate", 'Basic realm="leaderboard"')
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        return False
+
+    def read_json(self):
+        length = int(self.headers.get("Content-Length", 0))
+        if length > MAX_BODY:
+            raise ValueError("request too large")
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        if not self.check_auth():
+            return
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        try:
+            if url.path == "/leaderboard":
+                limit = min(MAX_LIMIT, max(1, int(query.get("limit", ["10"])[0])))
+                self.send_json(200, self.store.top(limit), etag=True)
+            elif url.path == "/rank":
+                self.send_json(200, {"rank": self.store.rank_of(int(query["score"][0]))})
+            else:
+                self.send_json(404, {"error": "not found"})
+        except (KeyError, ValueError):
+            self.send_json(400, {"error": "bad query"})
+
+    def do_POST(self):
+        if not self.check_auth():
+            return
+        path = urlparse(self.path).path
+        if path == "/submit_scores":
+            self.submit_scores()
+            return
+        if path != "/submit_score":
+            self.send_json(404, {"error": "not found"})
+            return
+        try:
+            payload = self.read_json()
+            player = str(payload["player_name"])[:20]
+            score = int(payload["score"])
+        except (KeyError, ValueError, TypeError):
+            self.send_json(400, {"error": "expected player_name and score"})
+            return
+        self.send_json(200, {"rank": self.store.submit(player, score)})
+
+    def submit_scores(self):
+        try:
+            scores = self.read_json()["scores"]
+            if not isinstance(scores, list):
+                raise TypeError("scores must be a list")
+        except (KeyError, ValueError, TypeError):
+            self.send_json(400, {"error": "expected a list of scores"})
+            return
+        entries = []
+        for item in scores:
+            # A malformed entry is dropped on its own, so it can't hold up the rest of the queue
+            try:
+                entries.append((str(item["id"])[:64], str(item["player_name"])[:20],
+                                int(item["score"]), float(item["submitted"])))
+            except (KeyError, ValueError, TypeError):
+                pass
+        added = self.store.submit_batch(entries)
+        self.send_json(200, {"added": added, "duplicates": len(entries) - added,
+                             "rejected": len(scores) - len(entries)})
+
+    def do_DELETE(self):
+        if not self.check_auth():
+            return
+        if urlparse(self.path).path != "/delete_all_scores":
+            self.send_json(404, {"error": "not found"})
+            return
+        self.store.delete_all()
+        self.send_json(200, {"message": "All scores deleted"})
+
+    def log_message(self, format, *args):
+        pass  # Keep the console quiet, one line per request is too much on a cabinet
+
+
+def make_server(store, host="127.0.0.1", port=8000, user=None, password=None):
+    handler = type("Handler", (LeaderboardHandler,), {
+        "store": store,
+        "credentials": f"{user}:{password}" if user else None,
+    })
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Security Invaders local leaderboard server")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    parser.add_argument("--db", default="leaderboard.sqlite", help="SQLite file holding the scores")
+    parser.add_argument("--user", default=os.environ.get("LEADERBOARD_USER"), help="require this Basic auth user")
+    parser.add_argument("--password", default=os.environ.get("LEADERBOARD_PASSWORD"), help="...and this password")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    server = make_server(LeaderboardStore(args.db), args.host, args.port, args.user, args.password)
+    print(f"Leaderboard serving {args.db} on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+'''
+Stress test: how much can this machine handle at 60 FPS?
+
+Injects a growing number of entities into the real game (enemies, bullets of
+every kind, extra barricades, or a boss firing faster and faster), runs the
+normal update and draw code for a while at each load, and stops once the
+frame time goes over the budget. The last load that stayed inside the budget
+is reported as the maximum for this hardware:
+
+    python -m scripts.stress_test
+    python -m scripts.stress_test --load bullets --budget-ms 8
+'''
+import argparse
+import json
+import math
+import time
+import numpy as np
+import pygame
+from scripts.benchmark import prepare, step, NO_KEYS
+from scripts.game_logic.game import Game, enable_headless_drivers
+
+SEED = 1234
+WARMUP_FRAMES = 20
+
+
+'''
+Each load sets up a game carrying `n` extra entities and returns the function
+that plays one frame, topping the load back up first.
+'''
+def enemies_load(game, n):
+    # One formation of n enemies, packed tighter than usual when they would not fit on screen
+    prepare(game)
+    enemies = game.enemy_manager
+    area_width = game.screen_width - 2 * enemies.start_x - 100  # Leave room to move sideways
+    area_height = game.screen_height - enemies.start_y - 250
+    cols = max(1, min(n, math.ceil(math.sqrt(n * area_width / area_height))))
+    rows = math.ceil(n / cols)
+    enemies.spacing_x = max(1, min(enemies.enemy_width + 10, (area_width - enemies.enemy_width) // max(1, cols - 1)))
+    enemies.spacing_y = max(1, min(enemies.enemy_height + 10, (area_height - enemies.enemy_height) // max(1, rows - 1)))
+    alive = np.zeros(rows * cols, dtype=bool)
+    alive[:n] = True
+    alive = alive.reshape(rows, cols)
+    enemies.create_enemies(alive)
+
+    def frame():
+        if enemies.bounding_box()[3] > game.screen_height - 150 or enemies.alive_count < n:
+            enemies.create_enemies(alive)  # Start over before the wave reaches the player
+        step(game, NO_KEYS)
+    return frame
+
+
+def bullets_load(game, n):
+    # n player, n enemy and n boss bullets in flight at all times
+    prepare(game)
+    rng = np.random.default_rng(SEED)
+    bullet_manager = game.bullet_manager
+    width, height = game.screen_width, game.screen_height
+
+    def frame():
+        missing = n - bullet_manager.player_bullets.count
+        for x, y in rng.uniform((0, height / 2), (width, height), (max(0, missing), 2)).tolist():
+            bullet_manager.spawn_player_bullet(x, y, bullet_manager.player_bullet_height, 0.0)
+        missing = n - bullet_manager.enemy_bullets.count
+        for x, y in rng.uniform((0, 0), (width, height / 2), (max(0, missing), 2)).tolist():
+            bullet_manager.add_enemy_bullet(x, y)
+        missing = n - bullet_manager.boss_bullets.count
+        for x, y, angle in rng.uniform((0, 0, 0), (width, height, 2 * math.pi), (max(0, missing), 3)).tolist():
+            bullet_manager.add_boss_bullet(x, y, math.cos(angle) * 3, math.sin(angle) * 3)
+        if game.enemy_manager.alive_count < 10:
+            game.enemy_manager.create_enemies()  # Never clear the level
+        step(game, NO_KEYS)
+    return frame
+
+
+def barricades_load(game, n):
+    # n extra barricades spread over the lower half of the screen, rebuilt as they wear away
+    prepare(game)
+    barricades = game.barricade_manager
+    width = barricades.cols * barricades.block_width + 10
+    height = barricades.rows * barricades.block_height + 10
+    per_row = game.screen_width // width
+    rows = (game.screen_height // 2 - 60) // height
+    positions = [(5 + (i % per_row) * width, game.screen_height // 2 + ((i // per_row) % rows) * height)
+                 for i in range(n)]  # Past one screenful they start stacking on top of each other
+
+    def rebuild():
+        barricades.reset()
+        for x, y in positions:
+            barricades.add_barricade(x, y)
+
+    rebuild()
+
+    def frame():
+        if not any(barricade["cells"].any() for barricade in barricades.barricades):
+            rebuild()
+        if game.enemy_manager.bounding_box()[3] > game.screen_height - 150:
+            game.enemy_manager.create_enemies()
+        step(game, NO_KEYS)
+    return frame
+
+
+def boss_load(game, n):
+    # Boss in phase 4 (circle attack) firing n shots per second on top of its own
+    prepare(game)
+    game.enemy_manager.clear()
+    game.boss_fight = True
+    game.minigame_completed = True
+    game.boss.minigame_triggered = True
+    game.boss.health = 30
+    steps_per_second = round(1 / game.game_clock.step)
+    owed = [0.0]  # Shots that did not fit in a whole step yet
+
+    def frame():
+        owed[0] += n / steps_per_second
+        for _ in range(int(owed[0])):
+            game.boss.fire_current_attack()
+        owed[0] -= int(owed[0])
+        step(game, NO_KEYS)
+    return frame
+
+
+# name: (setup, what n counts, first load tried)
+LOADS = {
+    "enemies": (enemies_load, "enemies", 50),
+    "bullets": (bullets_load, "bullets of each kind", 100),
+    "barricades": (barricades_load, "extra barricades", 10),
+    "boss": (boss_load, "boss shots per second", 60),
+}
+
+
+def restore_layout(game):
+    # enemies_load squeezes the formation, put the normal spacing back
+    enemies = game.enemy_manager
+    enemies.spacing_x = enemies.enemy_width + 10
+    enemies.spacing_y = enemies.enemy_height + 10
+
+
+def measure(game, setup, n, frames):
+    # p95 frame time in ms at load n
+    frame = setup(game, n)
+    frame_times = []
+    for i in range(WARMUP_FRAMES + frames):
+        start = time.perf_counter()
+        frame()
+        game.present_frame()
+        pygame.event.pump()
+        if i >= WARMUP_FRAMES:
+            frame_times.append(time.perf_counter() - start)
+    restore_layout(game)
+    return float(np.percentile(frame_times, 95)) * 1000
+
+
+def find_limit(game, name, budget_ms, frames, growth=1.5, refine_steps=4, max_load=200000):
+    '''
+    Raise the load by `growth` each stage until the p95 frame time goes over
+    `budget_ms`, then bisect between the last good and the first bad load.
+    A stage over budget is run a second time before it counts, so one
+    hiccup from another process does not end the test early.
+    '''
+    setup, unit, n = LOADS[name]
+
+    def within_budget(n):
+        p95 = measure(game, setup, n, frames)
+        if p95 > budget_ms:
+            p95 = min(p95, measure(game, setup, n, frames))
+        print(f"  {name:<11}{n:>8}  p95 {p95:7.2f} ms  {'ok' if p95 <= budget_ms else 'over budget'}")
+        return p95 <= budget_ms
+
+    best, worst = 0, None
+    while n <= max_load:
+        if not within_budget(n):
+            worst = n
+            break
+        best = n
+        n = max(n + 1, int(n * growth))
+
+    # Narrow the gap between the last load that fit and the first one that didn't
+    for _ in range(refine_steps if worst is not None else 0):
+        if worst - best <= 1:
+            break
+        middle = (best + worst) // 2
+        if within_budget(middle):
+            best = middle
+        else:
+            worst = middle
+    return {"max": best, "unit": unit, "capped": worst is None}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Security Invaders stress test")
+    parser.add_argument("--load", action="append", choices=list(LOADS),
+                        help="load to ramp up (repeatable, default: all)")
+    parser.add_argument("--budget-ms", type=float, default=1000 / 60,
+                        help="frame time budget in ms (default: 60 FPS)")
+    parser.add_argument("--frames", type=int, default=120,
+                        help="frames timed at each load")
+    parser.add_argument("--growth", type=float, default=1.5,
+                        help="factor the load grows by between stages")
+    parser.add_argument("--output", default=None,
+                        help="also write the results as JSON to this file")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    enable_headless_drivers()
+    pygame.init()
+    game = Game(headless=True)
+
+    print(f"Frame budget {args.budget_ms:.2f} ms (p95 over {args.frames} frames per stage)")
+    results = {}
+    for name in args.load or LOADS:
+        results[name] = find_limit(game, name, args.budget_ms, args.frames, args.growth)
+
+    print()
+    for name, result in results.items():
+        limit = f"{result['max']}+" if result["capped"] else str(result["max"])
+        print(f"{name:<12}{limit:>8}  {result['unit']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"budget_ms": args.budget_ms, "loads": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import json
+import os
+import pygame
+import pytest
+from scripts.game_logic import save_store
+from scripts.game_logic.game import Game, enable_headless_drivers
+from scripts.game_logic.save_store import SaveStore
+from scripts.game_logic.question_bank import question_id
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def baseline_save():
+    # One slot exactly as the old save_game wrote it into saves.json
+    left, right, top = 325, 725, 480
+    return {
+        'name': "Old save",
+        'level': 2,
+        'boss_fight': False,
+        'minigame_trigger': False,
+        'boss_ragemode': False,
+        'score': 6150,
+        'questions_asked': 1,
+        'asked_questions': [{"question": "What does 'HTTPS' stand for?",
+                             "options": ["A) Hypertext Transfer Protocol Standard",
+                                         "B) Hypertext Transfer Protocol Secure",
+                                         "C) High Transfer Protocol Secure"],
+                             "answer": "B"}],
+        'player_barricades': [
+            [{'x': left + col * 15, 'y': top + row * 10} for row in range(4) for col in range(10) if row or col > 2],
+            [{'x': right + col * 15, 'y': top + row * 10} for row in range(4) for col in range(10)],
+        ],
+        'player': {'lives': 2, 'x': 560, 'y': 520, 'invulnerable': False, 'invulnerable_time': 4.2},
+        'enemies': [[140, 60], [190, 60], [240, 60], [140, 110], [240, 110]],
+        'enemy_direction': -1,
+        'enemy_speed': 2.5,
+        'enemy_shotprob': 0.004,
+        'boss_health': None,
+        'player_bullets': [[580, 400, 10, 0]],
+        'enemy_bullets': [[160, 300], [260, 350]],
+        'boss_bullets': [],
+        'power_ups': {'active': True, 'type': "triple_shot", 'positions': [[300, 200]],
+                      'timer': 3.0, 'spawn_time': 1718000000.0},
+        'timestamp': "2024-06-10 14:13",
+    }
+
+
+@pytest.fixture
+def game(monkeypatch):
+    monkeypatch.chdir(ROOT)  # Fonts and assets are opened relative to the repository
+    enable_headless_drivers()
+    pygame.init()
+    yield Game(headless=True)
+    pygame.quit()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    legacy_file = tmp_path / "saves.json"
+    legacy_file.write_text(json.dumps([baseline_save(), None, None]))
+    monkeypatch.setattr(save_store, "LEGACY_SAVE_FILE", str(legacy_file))
+    store = SaveStore(folder=str(tmp_path / "saves"))
+    store.load_index()
+    return store
+
+
+def test_saves_json_is_migrated_into_slots(store):
+    assert store.slots[0]['name'] == "Old save"
+    assert store.slots[0]['level'] == 2
+    assert store.slots[0]['score'] == 6150
+    assert store.slots[1] is None and store.slots[2] is None
+
+
+def test_saves_json_slot_restores_the_game(game, store):
+    game.apply_save_state(store.load(0))
+
+    assert game.level == 2
+    assert game.score == 6150
+    assert game.asked_questions == [question_id(baseline_save()['asked_questions'][0])]
+    assert game.player.lives == 2
+    assert (game.player.x, game.player.y) == (560, 520)
+
+    enemies = game.enemy_manager
+    assert enemies.alive_count == 5
+    assert (enemies.offset_x, enemies.offset_y) == (140, 60)
+    assert not enemies.alive[1, 1]
+    assert enemies.direction == -1
+
+    left, right = game.barricade_manager.barricades
+    assert left["cells"].sum() == 37 and not left["cells"][0, :3].any()
+    assert right["cells"].all()
+
+    assert len(game.bullet_manager.player_bullets) == 1
+    assert len(game.bullet_manager.enemy_bullets) == 2
+    assert len(game.bullet_manager.boss_bullets) == 0
+
+
+def test_saves_json_power_up_timers_use_game_time(game, store):
+    game.apply_save_state(store.load(0))
+
+    # saves.json stored spawn_time as a wall-clock timestamp, it must not leak into game time
+    assert game.power_ups.spawn_time == game.game_clock.now
+    assert game.power_ups.power_up_active
+    assert game.power_ups.power_up_timer == pytest.approx(game.game_clock.now + 3.0)